@@ -1,5 +1,6 @@
 from app.api.services.city_service import SeoulCityData
 from app.api.services.congestion_db import insert_congestion_data
+from app.api.services.forecast_service import build_forecast_matrix, save_forecast_matrix
 import time
 import logging
 
@@ -43,6 +44,9 @@ def collect_congestion_data():
         insert_congestion_data(area_results)
         logger.info("✅ DB 저장 완료")
 
+        # 전체 지역 예측 행렬 사전 계산
+        save_forecast_matrix(build_forecast_matrix(area_results))
+
     return area_results
 
 if __name__ == "__main__":
@@ -1,18 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any
-import os
+import json
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, Iterator
 from app.models.pydantic_models import ChatRequest, ChatResponse
 from app.api.services.chat_service import ChatBot
+from app.api.services.single_flight import single_flight_stats
 
 router = APIRouter()
 
-def get_chat_bot():
-    """ChatBot 인스턴스 생성"""
-    api_key = os.getenv("SEOUL_API_KEY")
-    return ChatBot(api_key)
+def get_chat_bot(request: Request) -> ChatBot:
+    """앱 수명 동안 공유되는 ChatBot 인스턴스"""
+    return request.app.state.services.chat_bot
 
+# 외부 API/LLM 호출이 블로킹이므로 일반 함수로 두어 스레드풀에서 실행 (이벤트 루프 점유 방지)
 @router.post("/message/", response_model=ChatResponse)
-async def chat_message(request: ChatRequest, chat_bot: ChatBot = Depends(get_chat_bot)):
+def chat_message(request: ChatRequest, chat_bot: ChatBot = Depends(get_chat_bot)):
     """채팅 메시지 처리 엔드포인트"""
     try:
         # 사용자 메시지 처리
@@ -23,4 +25,41 @@ async def chat_message(request: ChatRequest, chat_bot: ChatBot = Depends(get_cha
 
         return {"answer": response}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _sse_stream(events: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """private: 이벤트 → Server-Sent Events 형식 (스트림 도중 오류도 이벤트로 전달)"""
+    try:
+        for event in events:
+            yield f"event: {event['event']}\ndata: {json.dumps(event['data'], ensure_ascii=False)}\n\n"
+    except Exception as e:
+        yield f"event: error\ndata: {json.dumps({'message': str(e)}, ensure_ascii=False)}\n\n"
+
+@router.post("/stream")
+async def chat_stream(request: ChatRequest, chat_bot: ChatBot = Depends(get_chat_bot)):
+    """채팅 메시지 스트리밍 엔드포인트 (SSE: status → section/token → done)"""
+    try:
+        return StreamingResponse(
+            _sse_stream(chat_bot.stream_user_input(request.message, request.user_preferences)),
+            media_type="text/event-stream",
+            # 프록시 버퍼링을 막아 첫 이벤트가 바로 전달되도록 함
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/llm-cache")
+async def llm_cache_stats(request: Request) -> Dict[str, Any]:
+    """LLM 응답 캐시 적중률 및 동시 요청 병합 현황"""
+    try:
+        return {**request.app.state.services.llm_cache.stats(), "single_flight": single_flight_stats()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/llm-gateway")
+async def llm_gateway_stats(request: Request) -> Dict[str, Any]:
+    """LLM 게이트웨이 대기열 길이/대기 시간"""
+    try:
+        return request.app.state.services.llm_gateway.stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
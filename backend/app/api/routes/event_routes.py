@@ -0,0 +1,71 @@
+from fastapi import APIRouter, HTTPException, Request
+from datetime import date
+from typing import Optional
+from app.api.services.location_service import CityInfo
+
+router = APIRouter()
+
+# 한 번에 반환할 수 있는 최대 검색 결과 수
+MAX_SEARCH_LIMIT = 50
+
+# 색인 구성(최초 검색)과 BM25 점수 계산이 CPU/SQLite 작업이므로 일반 함수로 두어 스레드풀에서 실행
+@router.get("/search")
+def search_events(request: Request, q: str, district: Optional[str] = None,
+                  codename: Optional[str] = None, active_on: Optional[date] = None,
+                  limit: int = 10):
+    """문화행사 키워드 검색 (제목/장소/프로그램/분류, BM25 점수 순)"""
+    try:
+        if not q.strip():
+            raise HTTPException(status_code=400, detail="검색어를 입력해주세요.")
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise HTTPException(status_code=400, detail=f"limit은 1~{MAX_SEARCH_LIMIT} 사이여야 합니다.")
+
+        total_count, events = request.app.state.services.event_store.search_events(
+            q, district=district, codename=codename, active_on=active_on, limit=limit
+        )
+        return {"query": q, "total_count": total_count, "data": events}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 주변 행사 조회 최대 반경 (km)
+MAX_NEARBY_RADIUS_KM = 20.0
+
+# 스냅샷 재구성 시 SQLite를 읽으므로 일반 함수로 두어 스레드풀에서 실행
+@router.get("/nearby")
+def get_nearby_events(request: Request, area: Optional[str] = None,
+                      lat: Optional[float] = None, lng: Optional[float] = None,
+                      radius_km: float = 1.0, codename: Optional[str] = None,
+                      limit: int = 10):
+    """지역 또는 좌표 반경 내 진행 중 문화행사 (가까운 순)"""
+    try:
+        if not 0 < radius_km <= MAX_NEARBY_RADIUS_KM:
+            raise HTTPException(status_code=400, detail=f"반경은 0 초과 {MAX_NEARBY_RADIUS_KM:g}km 이하여야 합니다.")
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise HTTPException(status_code=400, detail=f"limit은 1~{MAX_SEARCH_LIMIT} 사이여야 합니다.")
+
+        if area:
+            main_area = CityInfo.resolve_local(area)
+            if not main_area:
+                raise HTTPException(status_code=404, detail="해당 지역을 찾을 수 없습니다.")
+            lat, lng = CityInfo.AREA_COORDINATES[main_area]
+        elif lat is None or lng is None:
+            raise HTTPException(status_code=400, detail="area 또는 lat/lng를 입력해주세요.")
+        else:
+            main_area = None
+
+        total_count, events = request.app.state.services.event_store.events_near(
+            lat, lng, radius_km, codename=codename, limit=limit
+        )
+        return {
+            "area": main_area,
+            "center": [lat, lng],
+            "radius_km": radius_km,
+            "total_count": total_count,
+            "data": events
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
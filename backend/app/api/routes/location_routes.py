@@ -0,0 +1,21 @@
+from fastapi import APIRouter, HTTPException, Request
+from app.api.services.suggest_service import DEFAULT_LIMIT
+
+router = APIRouter()
+
+# 한 번에 반환할 수 있는 최대 후보 수
+MAX_SUGGEST_LIMIT = 20
+
+@router.get("/suggest")
+async def suggest_locations(request: Request, q: str = "", limit: int = DEFAULT_LIMIT):
+    """위치 자동완성 (지역명/자치구명/별칭 접두어 일치, 인기도 순)"""
+    try:
+        if not 1 <= limit <= MAX_SUGGEST_LIMIT:
+            raise HTTPException(status_code=400, detail=f"limit은 1~{MAX_SUGGEST_LIMIT} 사이여야 합니다.")
+
+        suggestions = request.app.state.services.location_trie.suggest(q, limit)
+        return {"query": q, "suggestions": suggestions}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
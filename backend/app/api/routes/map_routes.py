@@ -1,16 +1,38 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
 from typing import Optional
 from urllib.parse import unquote
+from app.models.pydantic_models import NearestAreaBatchRequest, NearestAreaBatchResponse
 from app.api.services.congestion_db import get_congestion_data, get_area_congestion_data
+from app.api.services.location_service import CityInfo
+from app.api.services.area_registry import AREA_NAMES, AREA_TABLE_VERSION, CONGESTION_LEVELS, get_area_table
+from app.api.services.payload_codec import (
+    POPULATION_SCALE, wants_binary, binary_response, encode_congestion_rows,
+    quantize_population, to_smallest_uint
+)
 
 router = APIRouter()
 
+# SQLite를 읽거나 통계/프로필을 갱신하는 핸들러는 일반 함수로 두어 스레드풀에서 실행 (이벤트 루프 점유 방지)
+
+@router.get("/areas")
+async def get_area_table_route(request: Request):
+    """정적 지역 테이블 (바이너리 응답의 지역 ID 해석용, 장기 캐싱)"""
+    etag = f'"{AREA_TABLE_VERSION}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=get_area_table(), headers=headers)
+
 @router.get("/congestion")
-async def get_congestion_data_route():
-    """전체 혼잡도 데이터 (DB에서 가져옴)"""
+def get_congestion_data_route(request: Request, format: Optional[str] = None):
+    """전체 혼잡도 데이터 (DB에서 가져옴, format=binary 시 열 단위 바이너리)"""
     try:
         data = get_congestion_data()
+        if data and wants_binary(request, format):
+            arrays = encode_congestion_rows(data)
+            if arrays is not None:
+                return binary_response(arrays)
         if data:
             return JSONResponse(content={"data": data}, status_code=200)
         else:
@@ -19,7 +41,7 @@ async def get_congestion_data_route():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/congestion/{area}")
-async def get_area_congestion(area: str):
+def get_area_congestion(area: str):
     """단일 지역 혼잡도 상세 조회"""
     try:
         decoded_area = unquote(area)
@@ -33,3 +55,123 @@ async def get_area_congestion(area: str):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/statistics")
+def get_congestion_statistics(request: Request):
+    """전체/자치구별 혼잡도 통계 (증분 집계값 조회)"""
+    try:
+        services = request.app.state.services
+        services.statistics.refresh()
+        return services.statistics.get_statistics()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/profile")
+def get_congestion_profiles(request: Request, format: Optional[str] = None):
+    """전체 지역 요일×시간대 혼잡도 프로필 (지역 × 7 × 24)"""
+    try:
+        store = request.app.state.services.profile_store
+        store.refresh()
+        if wants_binary(request, format):
+            arrays = store.get_all_arrays()
+            return binary_response(
+                {
+                    "level_counts": to_smallest_uint(arrays["level_counts"]),
+                    "mean_population": quantize_population(arrays["mean_population"])
+                },
+                {"population_scale": POPULATION_SCALE}
+            )
+        return store.get_all_profiles()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/profile/{area}")
+def get_area_congestion_profile(area: str, request: Request):
+    """단일 지역 요일×시간대 혼잡도 프로필 (7 × 24)"""
+    try:
+        store = request.app.state.services.profile_store
+        store.refresh()
+        result = store.get_area_profile(unquote(area))
+
+        if not result:
+            raise HTTPException(status_code=404, detail="해당 지역 데이터 없음")
+
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/forecast")
+async def get_forecast_matrix(request: Request, format: Optional[str] = None):
+    """전체 지역 예측 혼잡도 행렬 (지역 × 예측시간, 행 우선 평탄화)"""
+    try:
+        forecast_store = request.app.state.services.forecast_store
+        if wants_binary(request, format):
+            arrays = forecast_store.get_arrays()
+            if not arrays:
+                raise HTTPException(status_code=404, detail="예측 데이터 없음")
+            for key in ("population_min", "population_max"):
+                arrays[key] = quantize_population(arrays[key])
+            return binary_response(arrays, {"population_scale": POPULATION_SCALE})
+
+        result = forecast_store.get_payload()
+        if not result:
+            raise HTTPException(status_code=404, detail="예측 데이터 없음")
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 한 번에 처리할 수 있는 최대 좌표 수
+MAX_BATCH_POINTS = 100000
+
+@router.post("/nearest", response_model=NearestAreaBatchResponse)
+def get_nearest_areas_batch(request: NearestAreaBatchRequest):
+    """좌표 묶음 → 가장 가까운 주요 지역 ID/거리 (일괄 처리)"""
+    try:
+        if len(request.points) > MAX_BATCH_POINTS:
+            raise HTTPException(status_code=400, detail=f"최대 {MAX_BATCH_POINTS}개 좌표까지 처리할 수 있습니다.")
+        if any(len(point) != 2 for point in request.points):
+            raise HTTPException(status_code=400, detail="좌표는 [위도, 경도] 형식이어야 합니다.")
+
+        area_ids, distances = CityInfo.find_nearest_areas_batch(request.points)
+        return {
+            "area_ids": area_ids.tolist(),
+            "areas": [AREA_NAMES[area_id] for area_id in area_ids],
+            "distances_km": distances.round(3).tolist()
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 주변 지역 조회 최대 반경 (km)
+MAX_NEARBY_RADIUS_KM = 50.0
+
+@router.get("/nearby")
+def get_nearby_areas(request: Request, area: str, radius_km: float = 2.0,
+                     include_congestion: bool = True):
+    """기준 지역 반경 내 주요 지역 (가까운 순, 현재 혼잡도 포함 가능)"""
+    try:
+        if not 0 < radius_km <= MAX_NEARBY_RADIUS_KM:
+            raise HTTPException(status_code=400, detail=f"반경은 0 초과 {MAX_NEARBY_RADIUS_KM:g}km 이하여야 합니다.")
+
+        main_area = CityInfo.resolve_local(unquote(area))
+        if not main_area:
+            raise HTTPException(status_code=404, detail="해당 지역을 찾을 수 없습니다.")
+
+        services = request.app.state.services
+        nearby = services.area_distances.within_radius(main_area, radius_km)
+        if include_congestion:
+            services.statistics.refresh()
+            levels = services.statistics.get_area_level_codes()
+            for item in nearby:
+                item["congestion_level"] = CONGESTION_LEVELS[levels[item["area_id"]]]
+
+        return {"area": main_area, "radius_km": radius_km, "areas": nearby}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
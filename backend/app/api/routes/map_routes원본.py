@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from typing import Dict, Any
 # from app.api.services.heatmap_service import HeatmapService
 
@@ -22,10 +22,10 @@ from typing import Dict, Any
 # api콜방식에서_db방식으로_변경
 from app.api.services.heatmap_service import HeatmapService
 @router.get("/congestion")
-async def get_congestion_data():
+async def get_congestion_data(request: Request):
     """전체 혼잡도 데이터 제공 엔드포인트"""
     try:
-        heatmap_service = HeatmapService()
+        heatmap_service = request.app.state.services.heatmap_service
 
         # 혼잡도 데이터 가져오기
         data = heatmap_service.get_congestion_data()
@@ -34,10 +34,10 @@ async def get_congestion_data():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/congestion/{area}")
-async def get_area_congestion(area: str):
+async def get_area_congestion(area: str, request: Request):
     """특정 지역 혼잡도 정보 제공 엔드포인트"""
     try:
-        heatmap_service = HeatmapService()
+        heatmap_service = request.app.state.services.heatmap_service
         result = heatmap_service.get_area_congestion_data(area)
 
         # 에러 확인
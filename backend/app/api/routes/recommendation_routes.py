@@ -1,18 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import Dict, Any
-import os
 from app.models.pydantic_models import RecommendationRequest
 from app.api.services.chat_service import ChatBot
 
 router = APIRouter()
 
-def get_chat_bot():
-    """ChatBot 인스턴스 생성"""
-    api_key = os.getenv("SEOUL_API_KEY")
-    return ChatBot(api_key)
+def get_chat_bot(request: Request) -> ChatBot:
+    """앱 수명 동안 공유되는 ChatBot 인스턴스"""
+    return request.app.state.services.chat_bot
 
+# 외부 API/LLM 호출이 블로킹이므로 일반 함수로 두어 스레드풀에서 실행 (이벤트 루프 점유 방지)
 @router.post("/", response_model=Dict[str, Any])
-async def get_recommendation(request: RecommendationRequest, chat_bot: ChatBot = Depends(get_chat_bot)):
+def get_recommendation(request: RecommendationRequest, chat_bot: ChatBot = Depends(get_chat_bot)):
     """추천 정보 제공 엔드포인트"""
     try:
         # 위치 기반 추천 처리
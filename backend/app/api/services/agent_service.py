@@ -1,14 +1,78 @@
-from typing import Dict, Any, List
-import google.generativeai as genai
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import logging
+from app.api.services.llm_cache import LLMResponseCache, make_cache_key
+from app.api.services.single_flight import get_single_flight
+from app.api.services.llm_gateway import LLMGateway, get_llm_gateway
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 상황 분석 응답의 섹션 키 → 헤더 (응답 순서)
+SECTION_HEADERS = {
+    'situation': '현재 상황 평가',
+    'best_time': '최적의 방문 시간대',
+    'route': '추천 동선',
+    'warnings': '방문객 안내사항'
+}
+_HEADER_DECORATION = "[]#*: \n"
+
+
+class SectionSplitter:
+    """스트리밍 조각을 섹션 경계와 본문 조각으로 나누기
+
+    헤더가 조각 경계에 걸쳐 올 수 있으므로, 버퍼 끝이 헤더의 앞부분과 일치하면 다음 조각까지 보류한다.
+    """
+
+    def __init__(self, headers: Dict[str, str]):
+        self._names = {header: name for name, header in headers.items()}
+        self._pending = ""
+        self._after_header = False
+
+    def _token(self, text: str) -> List[Tuple[str, str]]:
+        """private: 헤더 장식 문자([, ], #, :)를 걷어낸 본문 조각"""
+        if self._after_header:
+            text = text.lstrip(_HEADER_DECORATION)
+            if text:
+                self._after_header = False
+        return [('token', text)] if text else []
+
+    def feed(self, text: str) -> List[Tuple[str, str]]:
+        """조각 추가 → [('section', 섹션 키) | ('token', 본문)]"""
+        self._pending += text
+        events: List[Tuple[str, str]] = []
+        while True:
+            found = [(self._pending.find(header), header) for header in self._names if header in self._pending]
+            if not found:
+                break
+            position, header = min(found)
+            events.extend(self._token(self._pending[:position].rstrip(_HEADER_DECORATION)))
+            events.append(('section', self._names[header]))
+            self._after_header = True
+            self._pending = self._pending[position + len(header):]
+
+        cut = len(self._pending)
+        for start in range(len(self._pending)):
+            tail = self._pending[start:]
+            if any(header.startswith(tail) for header in self._names):
+                cut = start
+                break
+        while cut and self._pending[cut - 1] in _HEADER_DECORATION:
+            cut -= 1
+        events.extend(self._token(self._pending[:cut]))
+        self._pending = self._pending[cut:]
+        return events
+
+    def flush(self) -> List[Tuple[str, str]]:
+        """남은 본문 내보내기"""
+        pending, self._pending = self._pending, ""
+        return self._token(pending)
+
+
 class CultureAgent:
-    def __init__(self):
-        self._model = genai.GenerativeModel('gemini-1.5-flash')
+    def __init__(self, cache: Optional[LLMResponseCache] = None, gateway: Optional[LLMGateway] = None):
+        self._gateway = gateway or get_llm_gateway()
+        self._cache = cache
         self._context = {
             "역할": "문화예술 전문 큐레이터",
             "전문분야": [
@@ -30,7 +94,76 @@ class CultureAgent:
                         commercial_data: Dict[str, Any],
                         user_preferences: Dict[str, str]) -> Dict[str, Any]:
         """상황 분석 및 추천"""
-        prompt = f"""
+        cache_key = self._situation_cache_key(area, population_data, traffic_data, commercial_data, user_preferences)
+        hit, cached = self._cache_get(cache_key)
+        if hit:
+            return cached
+
+        prompt = self._situation_prompt(area, population_data, traffic_data, commercial_data, user_preferences)
+        # 같은 입력의 동시 요청은 Gemini 호출 하나를 공유
+        return get_single_flight("llm").do(cache_key, self._generate_situation, cache_key, prompt)
+
+    def _generate_situation(self, cache_key: str, prompt: str) -> Dict[str, Any]:
+        """private: 상황 분석 호출 후 캐시에 저장"""
+        try:
+            analysis = self._parse_agent_response(self._gateway.generate(prompt))
+        except Exception as e:
+            logger.error(f"에이전트 분석 중 오류 발생: {str(e)}")
+            return self._get_default_response()
+        self._cache_put(cache_key, analysis)
+        return analysis
+
+    def stream_situation(self, area: str, population_data: Dict[str, Any],
+                         traffic_data: Dict[str, Any],
+                         commercial_data: Dict[str, Any],
+                         user_preferences: Dict[str, str]) -> Iterator[Tuple[str, str]]:
+        """상황 분석 스트리밍: ('section', 섹션 키) / ('token', 본문 조각) / ('error', 메시지)"""
+        cache_key = self._situation_cache_key(area, population_data, traffic_data, commercial_data, user_preferences)
+        hit, cached = self._cache_get(cache_key)
+        if hit:
+            for section_name in SECTION_HEADERS:
+                yield 'section', section_name
+                yield 'token', cached[section_name]
+            return
+
+        prompt = self._situation_prompt(area, population_data, traffic_data, commercial_data, user_preferences)
+        splitter = SectionSplitter(SECTION_HEADERS)
+        chunks = []
+        try:
+            for text in self._gateway.stream(prompt):
+                chunks.append(text)
+                yield from splitter.feed(text)
+            yield from splitter.flush()
+        except Exception as e:
+            logger.error(f"에이전트 분석 스트리밍 중 오류 발생: {str(e)}")
+            yield 'error', '현재 상황 분석을 수행할 수 없습니다.'
+            return
+        # 스트리밍으로 받은 전체 응답도 일반 호출과 같은 형태로 캐시
+        self._cache_put(cache_key, self._parse_agent_response("".join(chunks)))
+
+    def _situation_cache_key(self, area: str, population_data: Dict[str, Any],
+                             traffic_data: Dict[str, Any],
+                             commercial_data: Dict[str, Any],
+                             user_preferences: Dict[str, str]) -> str:
+        """private: 상황 분석 캐시 키"""
+        # 프롬프트에 들어가는 값만으로 키를 만듦 (입력 도메인이 작아 같은 구간 내 재사용률이 높음)
+        return self._cache_key("analysis", {
+            "area": area,
+            "congestion_level": population_data.get('congestion_level'),
+            "congestion_message": population_data.get('congestion_message'),
+            "traffic_status": traffic_data.get('status'),
+            "traffic_speed": traffic_data.get('speed'),
+            "commercial_level": commercial_data.get('congestion_level'),
+            "preferences": self._preference_inputs(user_preferences)
+        })
+
+    @staticmethod
+    def _situation_prompt(area: str, population_data: Dict[str, Any],
+                          traffic_data: Dict[str, Any],
+                          commercial_data: Dict[str, Any],
+                          user_preferences: Dict[str, str]) -> str:
+        """private: 상황 분석 프롬프트"""
+        return f"""
         당신은 서울시 문화예술 전문 큐레이터입니다. 다음 정보를 바탕으로 방문객을 위한 상세한 안내를 제공해주세요.
 
         분석 지역: {area}
@@ -89,13 +222,25 @@ class CultureAgent:
         모든 정보는 방문객의 연령대와 이동수단을 고려하여 맞춤형으로 제공해주세요.
         혼잡도가 낮은 경우에도 긍정적인 관점에서 장점과 활용 방안을 제시해주세요.
         """
-        
-        try:
-            response = self._model.generate_content(prompt)
-            return self._parse_agent_response(response.text)
-        except Exception as e:
-            logger.error(f"에이전트 분석 중 오류 발생: {str(e)}")
-            return self._get_default_response()
+
+    @staticmethod
+    def _preference_inputs(user_preferences: Dict[str, str]) -> Dict[str, str]:
+        """private: 프롬프트에 쓰이는 사용자 조건"""
+        return {key: user_preferences[key] for key in ('gender', 'age_group', 'has_children', 'transportation')}
+
+    @staticmethod
+    def _cache_key(namespace: str, inputs: Dict[str, Any]) -> str:
+        """private: 캐시/동시 요청 병합 키"""
+        return make_cache_key(f"agent.{namespace}", inputs)
+
+    def _cache_get(self, key: str):
+        """private: (적중 여부, 캐시된 응답)"""
+        return self._cache.get(key) if self._cache is not None else (False, None)
+
+    def _cache_put(self, key: str, value: Any) -> None:
+        """private: 정상 응답만 캐시에 저장"""
+        if self._cache is not None:
+            self._cache.put(key, value)
 
     def _get_default_response(self) -> Dict[str, Any]:
         """기본 응답 생성"""
@@ -110,7 +255,59 @@ class CultureAgent:
                                      events: List[Dict[str, Any]], 
                                      user_preferences: Dict[str, str]) -> str:
         """사용자 맞춤 행사 추천"""
-        prompt = f"""
+        formatted_events = self._format_events(events)
+        cache_key = self._events_cache_key(formatted_events, user_preferences)
+        hit, cached = self._cache_get(cache_key)
+        if hit:
+            return cached
+
+        return get_single_flight("llm").do(
+            cache_key, self._generate_recommendation, cache_key,
+            self._events_prompt(formatted_events, user_preferences)
+        )
+
+    def _generate_recommendation(self, cache_key: str, prompt: str) -> str:
+        """private: 맞춤 행사 추천 호출 후 캐시에 저장"""
+        try:
+            recommendation = self._gateway.generate(prompt)
+        except Exception as e:
+            logger.error(f"행사 추천 중 오류 발생: {str(e)}")
+            return "행사 추천을 생성할 수 없습니다. 잠시 후 다시 시도해 주세요."
+        self._cache_put(cache_key, recommendation)
+        return recommendation
+
+    def stream_personalized_recommendation(self, events: List[Dict[str, Any]],
+                                           user_preferences: Dict[str, str]) -> Iterator[Tuple[str, str]]:
+        """사용자 맞춤 행사 추천 스트리밍: ('token', 본문 조각) / ('error', 메시지)"""
+        formatted_events = self._format_events(events)
+        cache_key = self._events_cache_key(formatted_events, user_preferences)
+        hit, cached = self._cache_get(cache_key)
+        if hit:
+            yield 'token', cached
+            return
+
+        chunks = []
+        try:
+            for text in self._gateway.stream(self._events_prompt(formatted_events, user_preferences)):
+                chunks.append(text)
+                yield 'token', text
+        except Exception as e:
+            logger.error(f"행사 추천 스트리밍 중 오류 발생: {str(e)}")
+            yield 'error', '행사 추천을 생성할 수 없습니다. 잠시 후 다시 시도해 주세요.'
+            return
+        self._cache_put(cache_key, "".join(chunks))
+
+    def _events_cache_key(self, formatted_events: str, user_preferences: Dict[str, str]) -> str:
+        """private: 맞춤 행사 추천 캐시 키"""
+        return self._cache_key("events", {
+            "events": formatted_events,
+            "preferences": self._preference_inputs(user_preferences)
+        })
+
+    @staticmethod
+    def _events_prompt(formatted_events: str, user_preferences: Dict[str, str]) -> str:
+        """private: 맞춤 행사 추천 프롬프트"""
+        return f"""
         사용자 정보:
         - 성별: {user_preferences['gender']}
         - 나이대: {user_preferences['age_group']}
@@ -118,7 +315,7 @@ class CultureAgent:
         - 이동수단: {user_preferences['transportation']}
 
         다음 문화 행사들 중에서 사용자에게 가장 적합한 행사를 추천해주세요:
-        {self._format_events(events)}
+        {formatted_events}
 
         다음 기준으로 분석해주세요:
         1. 사용자의 라이프스타일 고려
@@ -127,22 +324,18 @@ class CultureAgent:
         4. 연령대별 선호도
         5. 시간대별 혼잡도
         """
-        
-        try:
-            response = self._model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            logger.error(f"행사 추천 중 오류 발생: {str(e)}")
-            return "행사 추천을 생성할 수 없습니다. 잠시 후 다시 시도해 주세요."
 
     @staticmethod
     def _format_events(events: List[Dict[str, Any]]) -> str:
         """이벤트 정보 포맷팅"""
         formatted = []
         for event in events:
+            # 사전 순위화 단계에서 계산한 거리가 있으면 함께 전달
+            distance = f"거리: 약 {event['DISTANCE_KM']}km\n" if event.get('DISTANCE_KM') is not None else ""
             formatted.append(
                 f"행사: {event.get('TITLE', '제목 없음')}\n"
                 f"장소: {event.get('PLACE', '장소 미정')}\n"
+                f"{distance}"
                 f"날짜: {event.get('DATE', '날짜 미정')}\n"
                 f"분류: {event.get('CODENAME', '분류 없음')}\n"
                 f"요금: {event.get('USE_FEE', '요금 정보 없음')}\n"
@@ -153,12 +346,7 @@ class CultureAgent:
     def _parse_agent_response(self, response: str) -> Dict[str, Any]:
         """에이전트 응답 파싱"""
         try:
-            sections = {
-                'situation': '현재 상황 평가',
-                'best_time': '최적의 방문 시간대',
-                'route': '추천 동선',
-                'warnings': '방문객 안내사항'
-            }
+            sections = SECTION_HEADERS
             
             parsed = {}
             text = response.replace('\n\n', '\n').replace('###', '')
@@ -0,0 +1,104 @@
+import logging
+from typing import Callable, Dict, List, Optional, Sequence
+import numpy as np
+from app.api.services.area_registry import (
+    AREA_NAMES, AREA_INDEX, AREA_CATEGORIES, CATEGORY_NAMES, CONGESTION_LEVELS, get_level_code
+)
+from app.api.services.area_distance import build_distance_matrix
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_RADIUS_KM = 5.0
+
+# 서로 비슷한 성격으로 보는 분류 쌍 (같은 분류는 1.0)
+_RELATED_CATEGORIES = [
+    ("한강공원", "공원·자연"),
+    ("관광특구", "거리·상권"),
+    ("관광특구", "역사·문화"),
+    ("거리·상권", "시장·먹자"),
+    ("거리·상권", "교통 거점"),
+]
+RELATED_SIMILARITY = 0.5
+
+# 점수 가중치: 분류 유사도, 혼잡도 개선 단계, 거리(km)
+SIMILARITY_WEIGHT = 2.0
+RELIEF_WEIGHT = 1.0
+DISTANCE_WEIGHT = 0.3
+
+
+def _build_similarity_matrix() -> np.ndarray:
+    """지역 × 지역 분류 유사도 행렬"""
+    category_index = {category: idx for idx, category in enumerate(CATEGORY_NAMES)}
+    category_similarity = np.eye(len(CATEGORY_NAMES), dtype=np.float32)
+    for first, second in _RELATED_CATEGORIES:
+        a, b = category_index[first], category_index[second]
+        category_similarity[a, b] = category_similarity[b, a] = RELATED_SIMILARITY
+
+    area_categories = np.array([category_index[AREA_CATEGORIES[name]] for name in AREA_NAMES])
+    return category_similarity[area_categories[:, None], area_categories[None, :]]
+
+
+class AlternativePlaceEngine:
+    """LLM 없이 '근처의 덜 붐비는 대체 장소'를 찾는 결정적 추천 엔진
+
+    지역 간 거리 행렬과 분류 유사도 행렬을 미리 계산해 두고,
+    최신 혼잡도 스냅샷(지역 ID 순서의 혼잡도 코드)과 조합해 벡터 연산으로 순위를 매긴다.
+    """
+
+    def __init__(self, level_provider: Callable[[], Sequence[int]],
+                 distance_matrix: Optional[np.ndarray] = None):
+        self._level_provider = level_provider
+        self._distances = distance_matrix if distance_matrix is not None else build_distance_matrix()
+        self._similarity = _build_similarity_matrix()
+
+    def recommend(self, area: str, current_level: Optional[str] = None,
+                  radius_km: float = DEFAULT_RADIUS_KM, limit: int = 3) -> List[Dict]:
+        """기준 지역보다 덜 붐비는 반경 내 대체 장소 (점수 높은 순)"""
+        area_id = AREA_INDEX.get(area)
+        if area_id is None:
+            return []
+
+        levels = np.asarray(self._level_provider(), dtype=np.int64)
+        origin_level = get_level_code(current_level) if current_level else int(levels[area_id])
+        if not origin_level:
+            return []
+
+        distances = self._distances[area_id]
+        similarity = self._similarity[area_id]
+        # 혼잡도 정보가 있고(코드>0) 기준보다 한적한 반경 내 지역만 후보
+        candidates = (distances <= radius_km) & (levels > 0) & (levels < origin_level)
+        candidates[area_id] = False
+        candidate_ids = np.flatnonzero(candidates)
+        if not candidate_ids.size:
+            return []
+
+        scores = (SIMILARITY_WEIGHT * similarity[candidate_ids]
+                  + RELIEF_WEIGHT * (origin_level - levels[candidate_ids])
+                  - DISTANCE_WEIGHT * distances[candidate_ids])
+        order = candidate_ids[np.argsort(-scores, kind="stable")][:limit]
+        score_by_id = dict(zip(candidate_ids.tolist(), scores.tolist()))
+
+        return [
+            {
+                "area": AREA_NAMES[idx],
+                "distance_km": round(float(distances[idx]), 2),
+                "congestion_level": CONGESTION_LEVELS[levels[idx]],
+                "category": AREA_CATEGORIES[AREA_NAMES[idx]],
+                "score": round(score_by_id[idx], 3)
+            }
+            for idx in order.tolist()
+        ]
+
+    @staticmethod
+    def describe(area: str, alternatives: List[Dict]) -> str:
+        """추천 결과를 '[대체장소명]: [이유]' 형식 문장으로 변환"""
+        if not alternatives:
+            return f"현재 {area} 주변 5km 이내에서 더 한적한 장소를 찾지 못했습니다."
+
+        best = alternatives[0]
+        return (
+            f"{best['area']}: {area}에서 약 {best['distance_km']}km 떨어진 "
+            f"{best['category']} 장소로, 현재 혼잡도가 '{best['congestion_level']}' 수준입니다."
+        )
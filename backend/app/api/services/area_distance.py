@@ -0,0 +1,107 @@
+import os
+import threading
+import logging
+from typing import Dict, List, Optional
+import numpy as np
+from app.api.services.area_registry import AREA_NAMES, AREA_INDEX, AREA_TABLE_VERSION
+from app.api.services.coordinates import AREA_COORDINATES
+from app.api.services.congestion_db import DB_PATH
+from app.api.services.spatial_index import haversine_matrix_km
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 지역 간 거리 행렬 저장 경로 (혼잡도 DB와 같은 디렉토리)
+AREA_DISTANCE_PATH = os.path.join(os.path.dirname(DB_PATH), "area_distances.npz")
+
+
+def build_distance_matrix() -> np.ndarray:
+    """지역 ID 순서의 대칭 거리 행렬 (km, float32)"""
+    lats = np.array([AREA_COORDINATES[name][0] for name in AREA_NAMES])
+    lngs = np.array([AREA_COORDINATES[name][1] for name in AREA_NAMES])
+    matrix = haversine_matrix_km(lats, lngs, lats, lngs)
+    # 부동소수 오차로 생기는 비대칭/대각 성분 정리
+    matrix = (matrix + matrix.T) / 2
+    np.fill_diagonal(matrix, 0.0)
+    return matrix.astype(np.float32)
+
+
+class AreaDistanceMatrix:
+    """지역 × 지역 거리 행렬
+
+    지역 테이블 버전과 함께 파일로 저장해 두고, 시작 시 버전이 같으면 그대로 읽고
+    지역 목록/좌표가 바뀌었으면 다시 계산해 저장한다.
+    """
+
+    def __init__(self, path: str = AREA_DISTANCE_PATH):
+        self._path = path
+        self._matrix = self._load()
+        if self._matrix is None:
+            self._matrix = build_distance_matrix()
+            self._save()
+
+    def _load(self) -> Optional[np.ndarray]:
+        """private: 저장된 행렬 읽기 (버전/크기가 다르면 None)"""
+        try:
+            with np.load(self._path) as data:
+                if str(data["version"]) != AREA_TABLE_VERSION:
+                    logger.info("지역 테이블이 바뀌어 거리 행렬을 다시 계산합니다.")
+                    return None
+                matrix = data["distances"]
+        except (OSError, KeyError, ValueError):
+            return None
+
+        if matrix.shape != (len(AREA_NAMES), len(AREA_NAMES)):
+            return None
+        return matrix.astype(np.float32, copy=False)
+
+    def _save(self) -> None:
+        """private: 행렬 저장 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            tmp_path = f"{self._path}.tmp.npz"
+            np.savez(tmp_path, version=np.asarray(AREA_TABLE_VERSION), distances=self._matrix)
+            os.replace(tmp_path, self._path)
+            logger.info(f"지역 거리 행렬 저장 완료: {self._matrix.shape}")
+        except OSError as e:
+            logger.error(f"지역 거리 행렬 저장 오류: {e}")
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """거리 행렬 전체 (읽기 전용으로 사용)"""
+        return self._matrix
+
+    def distance(self, area1: str, area2: str) -> Optional[float]:
+        """두 지역 사이 거리 (km)"""
+        if area1 not in AREA_INDEX or area2 not in AREA_INDEX:
+            return None
+        return float(self._matrix[AREA_INDEX[area1], AREA_INDEX[area2]])
+
+    def within_radius(self, area: str, radius_km: float) -> List[Dict]:
+        """기준 지역 반경 내 다른 지역 [{'area_id', 'area', 'distance_km'}] (가까운 순)"""
+        area_id = AREA_INDEX.get(area)
+        if area_id is None:
+            return []
+
+        row = self._matrix[area_id]
+        ids = np.flatnonzero(row <= radius_km)
+        ids = ids[ids != area_id]
+        ids = ids[np.argsort(row[ids], kind="stable")]
+        return [
+            {"area_id": int(idx), "area": AREA_NAMES[idx], "distance_km": round(float(row[idx]), 3)}
+            for idx in ids
+        ]
+
+
+_area_distances: Optional[AreaDistanceMatrix] = None
+_area_distances_lock = threading.Lock()
+
+
+def get_area_distances() -> AreaDistanceMatrix:
+    """지역 거리 행렬 싱글톤"""
+    global _area_distances
+    with _area_distances_lock:
+        if _area_distances is None:
+            _area_distances = AreaDistanceMatrix()
+        return _area_distances
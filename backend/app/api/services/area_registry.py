@@ -0,0 +1,73 @@
+import hashlib
+from typing import Dict, List, Optional
+from app.api.services.coordinates import AREA_COORDINATES
+
+# 지역 ID: AREA_COORDINATES 등록 순서를 그대로 사용 (배열 인덱스로 활용)
+AREA_NAMES: List[str] = list(AREA_COORDINATES.keys())
+AREA_INDEX: Dict[str, int] = {name: idx for idx, name in enumerate(AREA_NAMES)}
+
+# 혼잡도 코드 (0은 정보 없음)
+CONGESTION_LEVELS: List[str] = ['정보 없음', '여유', '보통', '약간 붐빔', '붐빔']
+LEVEL_CODES: Dict[str, int] = {level: code for code, level in enumerate(CONGESTION_LEVELS)}
+
+# 좌표 고정소수점 양자화 배율 (1e-5도 ≈ 1.1m)
+COORD_SCALE = 100000
+
+# 지역 목록/좌표가 바뀌면 달라지는 테이블 버전 (ETag로 사용)
+AREA_TABLE_VERSION = hashlib.sha1(
+    repr([(name, AREA_COORDINATES[name]) for name in AREA_NAMES]).encode("utf-8")
+).hexdigest()[:12]
+
+
+def get_area_id(area: str) -> Optional[int]:
+    """지역명 → 지역 ID"""
+    return AREA_INDEX.get(area)
+
+
+def get_level_code(congestion_level: str) -> int:
+    """혼잡도 문자열 → 혼잡도 코드"""
+    return LEVEL_CODES.get(congestion_level, 0)
+
+
+def get_area_table() -> Dict:
+    """정적 지역 테이블 (지역 ID ↔ 이름, 양자화 좌표)
+
+    바이너리 응답은 지역명/좌표 대신 지역 ID만 보내므로 클라이언트는
+    이 테이블을 한 번 받아 캐싱해 두고 ID로 조회한다.
+    """
+    return {
+        "version": AREA_TABLE_VERSION,
+        "coord_scale": COORD_SCALE,
+        "levels": CONGESTION_LEVELS,
+        "ids": list(range(len(AREA_NAMES))),
+        "names": AREA_NAMES,
+        "lat": [round(AREA_COORDINATES[name][0] * COORD_SCALE) for name in AREA_NAMES],
+        "lng": [round(AREA_COORDINATES[name][1] * COORD_SCALE) for name in AREA_NAMES]
+    }
+
+
+# 지역 성격 분류 (이름 키워드 규칙, 먼저 일치한 분류 사용)
+_CATEGORY_RULES = [
+    ("한강공원", ("한강공원",)),
+    ("관광특구", ("관광특구",)),
+    ("역사·문화", ("궁", "종묘", "유적", "한옥", "청와대", "보신각", "독립문", "박물관",
+                  "이화마을", "DDP", "인사동", "서촌", "익선동")),
+    ("공원·자연", ("공원", "숲", "아차산", "불광천")),
+    ("시장·먹자", ("시장", "먹자골목", "맛집거리")),
+    ("공연·스포츠", ("돔", "운동장")),
+    ("교통 거점", ("역", "공항", "터미널", "외대앞")),
+    ("거리·상권", ("거리", "길", "연남동", "타임스퀘어", "여의도", "중심지")),
+]
+DEFAULT_CATEGORY = "거리·상권"
+
+
+def _categorize(area: str) -> str:
+    """private: 지역명 → 성격 분류"""
+    for category, keywords in _CATEGORY_RULES:
+        if any(keyword in area for keyword in keywords):
+            return category
+    return DEFAULT_CATEGORY
+
+
+AREA_CATEGORIES: Dict[str, str] = {name: _categorize(name) for name in AREA_NAMES}
+CATEGORY_NAMES: List[str] = [category for category, _ in _CATEGORY_RULES]
@@ -1,46 +1,62 @@
 import os
 import logging
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Iterator, Optional
 import google.generativeai as genai
 from app.api.services.city_service import SeoulCityData
-from app.api.services.llm_service import LLMService
+from app.api.services.llm_service import LLMService, LLM_ERROR_MESSAGE
 from app.api.services.agent_service import CultureAgent
 from app.api.services.event_service import get_events
 from app.api.services.location_service import CityInfo, get_coordinates
+from app.api.services.alternative_service import AlternativePlaceEngine
+from app.api.services.event_ranking import EventRanker
+from app.api.services.pipeline import Stage, run_stages, STAGE_OK, MAX_PIPELINE_WORKERS
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 추천 파이프라인 단계별 제한 시간 (초)
+CITY_STAGE_TIMEOUT = float(os.getenv("RECOMMEND_CITY_TIMEOUT", 12))
+EVENTS_STAGE_TIMEOUT = float(os.getenv("RECOMMEND_EVENTS_TIMEOUT", 12))
+COORDINATES_STAGE_TIMEOUT = float(os.getenv("RECOMMEND_COORDINATES_TIMEOUT", 5))
+LLM_STAGE_TIMEOUT = float(os.getenv("RECOMMEND_LLM_TIMEOUT", 25))
+
+# 대체 장소를 함께 안내할 혼잡도 단계
+CROWDED_LEVELS = ("약간 붐빔", "붐빔")
+
+GREETING_MESSAGE = "안녕하세요! 어떤 종류의 문화 활동을 좋아하시나요? 예를 들어, 예술, 음악, 공연, 전시회 등 어떤 것에 관심이 있으신가요?"
+
 class ChatBot:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str,
+                 city_data: Optional[SeoulCityData] = None,
+                 llm_service: Optional[LLMService] = None,
+                 agent: Optional[CultureAgent] = None,
+                 alternative_engine: Optional[AlternativePlaceEngine] = None,
+                 event_ranker: Optional[EventRanker] = None):
         self._api_key = api_key
-        self._city_data = SeoulCityData()
-        self._llm_service = LLMService()
-        self._agent = CultureAgent()
-        
-        # API 키 설정
-        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        # 서비스 컨테이너가 공유 인스턴스를 주입하면 그대로 사용
+        if llm_service is None:
+            # API 키 설정
+            genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        self._city_data = city_data or SeoulCityData()
+        self._llm_service = llm_service or LLMService()
+        self._agent = agent or CultureAgent()
+        self._alternative_engine = alternative_engine
+        self._event_ranker = event_ranker
+        self._executor = ThreadPoolExecutor(max_workers=MAX_PIPELINE_WORKERS, thread_name_prefix="recommend")
 
     def handle_user_input(self, message: str, user_preferences: Dict[str, str]) -> str:
         """사용자 입력 처리"""
         # 기본 인사 처리
         if "안녕" in message:
-            return "안녕하세요! 어떤 종류의 문화 활동을 좋아하시나요? 예를 들어, 예술, 음악, 공연, 전시회 등 어떤 것에 관심이 있으신가요?"
+            return GREETING_MESSAGE
 
         # 현재 위치 기반 정보 가져오기 (사용자가 위치를 언급한 경우)
         location_info = {}
         for area in self._city_data.valid_areas:
             if area in message:
-                population_status = self._city_data.get_population_status(area)
-                traffic_status = self._city_data.get_traffic_status(area)
-                commercial_status = self._city_data.get_commercial_status(area)
-                location_info = {
-                    'area': area,
-                    'population': population_status,
-                    'traffic': traffic_status,
-                    'commercial': commercial_status
-                }
+                location_info = {'area': area, **self._city_data.get_area_status(area)}
                 break
 
         # 에이전트를 통한 분석 수행
@@ -53,8 +69,8 @@ class ChatBot:
                 user_preferences
             )
             
-            # 문화 행사 정보 가져오기
-            events = get_events(self._api_key, location_info['area'])
+            # 문화 행사 정보 가져오기 (사용자 조건으로 미리 순위화한 상위 행사)
+            events = self._get_ranked_events(location_info['area'], user_preferences)
             if events['success']:
                 personalized_events = self._agent.get_personalized_recommendation(
                     events['data'],
@@ -69,6 +85,12 @@ class ChatBot:
                     f"맞춤 행사 추천:\n{personalized_events}\n\n"
                     f"주의사항:\n{analysis.get('warnings', '')}"
                 )
+                # 붐비는 지역이면 덜 붐비는 대체 장소 안내 추가
+                alternatives = self._suggest_alternatives(
+                    location_info['area'], location_info['population'].get('congestion_level')
+                )
+                if alternatives:
+                    response += f"\n\n대체 장소:\n{alternatives['alternative_place']}"
                 return response
 
         # 위치 정보가 없는 경우 일반적인 LLM 응답
@@ -77,58 +99,175 @@ class ChatBot:
             message
         )
 
+    def stream_user_input(self, message: str, user_preferences: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+        """사용자 입력 처리 (스트리밍)
+
+        LLM 출력보다 먼저 지역 감지/혼잡도 상태를 보내고, 이후 섹션 경계와 본문 조각을 순서대로 보낸다.
+        이벤트: {"event": status|section|token|error|done, "data": {...}}
+        """
+        if "안녕" in message:
+            yield {"event": "token", "data": {"section": None, "text": GREETING_MESSAGE}}
+            yield {"event": "done", "data": {}}
+            return
+
+        area = next((area for area in self._city_data.valid_areas if area in message), None)
+        if area is None:
+            # 위치 정보가 없는 경우 일반적인 LLM 응답
+            yield {"event": "status", "data": {"stage": "general"}}
+            for kind, value in self._llm_service.stream_personalized_recommendation(user_preferences, message):
+                if kind == 'token':
+                    yield {"event": "token", "data": {"section": None, "text": value}}
+                else:
+                    yield {"event": "error", "data": {"section": None, "message": value}}
+            yield {"event": "done", "data": {}}
+            return
+
+        yield {"event": "status", "data": {"stage": "area_detected", "area": area}}
+        # 행사 후보 순위화는 상황 분석 스트리밍과 동시에 진행
+        events_future = self._executor.submit(self._get_ranked_events, area, user_preferences)
+
+        status = self._city_data.get_area_status(area)
+        population = status['population']
+        yield {"event": "status", "data": {
+            "stage": "congestion",
+            "area": area,
+            "congestion_level": population.get('congestion_level', '정보 없음'),
+            "congestion_message": population.get('congestion_message'),
+            "traffic_status": status['traffic'].get('status')
+        }}
+        # 붐비는 지역이면 LLM 응답을 기다리지 않고 대체 장소 후보부터 전달
+        alternatives = self._suggest_alternatives(area, population.get('congestion_level'))
+        if alternatives:
+            yield {"event": "status", "data": {"stage": "alternatives", "area": area, **alternatives}}
+
+        section = None
+        for kind, value in self._agent.stream_situation(
+            area, population, status['traffic'], status['commercial'], user_preferences
+        ):
+            if kind == 'section':
+                section = value
+                yield {"event": "section", "data": {"section": section}}
+            elif kind == 'token':
+                yield {"event": "token", "data": {"section": section, "text": value}}
+            else:
+                yield {"event": "error", "data": {"section": section, "message": value}}
+
+        try:
+            events = events_future.result(timeout=EVENTS_STAGE_TIMEOUT)
+        except FutureTimeoutError:
+            events = {"success": False, "error": "행사 정보를 제한 시간 안에 가져오지 못했습니다."}
+        except Exception as e:
+            logger.error(f"행사 조회 중 오류: {str(e)}")
+            events = {"success": False, "error": str(e)}
+
+        if events['success'] and events['data']:
+            yield {"event": "section", "data": {"section": "events"}}
+            for kind, value in self._agent.stream_personalized_recommendation(events['data'], user_preferences):
+                if kind == 'token':
+                    yield {"event": "token", "data": {"section": "events", "text": value}}
+                else:
+                    yield {"event": "error", "data": {"section": "events", "message": value}}
+        yield {"event": "done", "data": {}}
+
     def get_recommendations(self, location: str, user_preferences: Dict[str, str]) -> Dict[str, Any]:
-        """위치 기반 추천 정보 제공"""
+        """위치 기반 추천 정보 제공
+
+        지역 현황과 행사 조회를 동시에 시작하고, 각 LLM 호출은 자기 입력이 준비되는 즉시 실행한다.
+        제한 시간을 넘긴 단계는 기본값으로 대체하고 stages에 상태를 남긴다.
+        """
         try:
             # 가장 가까운 주요 지역 찾기
             main_area = CityInfo.find_nearest_location(location)
             if main_area == "위치를 찾을 수 없습니다.":
                 return {"error": main_area}
-                
-            # 지역 데이터 수집
-            population_status = self._city_data.get_population_status(main_area)
-            traffic_status = self._city_data.get_traffic_status(main_area)
-            commercial_status = self._city_data.get_commercial_status(main_area)
-            
-            # 에이전트 분석
-            agent_analysis = self._agent.analyze_situation(
-                main_area,
-                population_status,
-                traffic_status,
-                commercial_status,
-                user_preferences
-            )
-            
-            # 문화 행사 정보
-            events_result = get_events(self._api_key, main_area)
-            
-            # 맞춤 행사 추천 정보 생성
-            personalized_recommendation = None
-            if events_result['success'] and events_result['data']:
-                personalized_recommendation = self._agent.get_personalized_recommendation(
-                    events_result['data'],
-                    user_preferences
-                )
-            
+
+            def personalize(inputs: Dict[str, Any]) -> Optional[str]:
+                events_result = inputs['events']
+                if not (events_result['success'] and events_result['data']):
+                    return None
+                return self._agent.get_personalized_recommendation(events_result['data'], user_preferences)
+
+            results, stages = run_stages([
+                # 지역 데이터 수집 (CITYDATA 한 번 조회로 인구/교통/상권 추출)
+                Stage("city", lambda _: self._city_data.get_area_status(main_area),
+                      timeout=CITY_STAGE_TIMEOUT,
+                      fallback={"population": {}, "traffic": {}, "commercial": {}}),
+                # 문화 행사 정보 (사용자 조건으로 미리 순위화한 상위 행사)
+                Stage("events", lambda _: self._get_ranked_events(main_area, user_preferences),
+                      timeout=EVENTS_STAGE_TIMEOUT,
+                      fallback={"success": False, "error": "행사 정보를 제한 시간 안에 가져오지 못했습니다."}),
+                Stage("coordinates", lambda _: get_coordinates(main_area), timeout=COORDINATES_STAGE_TIMEOUT),
+                # 에이전트 분석
+                Stage("analysis", lambda inputs: self._agent.analyze_situation(
+                          main_area,
+                          inputs['city']['population'],
+                          inputs['city']['traffic'],
+                          inputs['city']['commercial'],
+                          user_preferences
+                      ),
+                      depends_on=("city",), timeout=LLM_STAGE_TIMEOUT,
+                      fallback=self._agent._get_default_response()),
+                # 맞춤 행사 추천 정보 생성
+                Stage("personalized", personalize, depends_on=("events",), timeout=LLM_STAGE_TIMEOUT),
+                # 붐비는 경우 혼잡 대응 안내와 대체 장소
+                Stage("congestion", lambda inputs: self._handle_crowded_area(main_area, inputs['city']),
+                      depends_on=("city",), timeout=LLM_STAGE_TIMEOUT)
+            ], self._executor)
+
+            city_status = results['city']
             # 반환 데이터 구성
             return {
                 "area": main_area,
                 "status": {
-                    "population": population_status,
-                    "traffic": traffic_status,
-                    "commercial": commercial_status,
-                    "coordinates": get_coordinates(main_area)
+                    "population": city_status['population'],
+                    "traffic": city_status['traffic'],
+                    "commercial": city_status['commercial'],
+                    "coordinates": results['coordinates']
                 },
-                "analysis": agent_analysis,
-                "events": events_result,
-                "personalized_recommendation": personalized_recommendation  # 맞춤 추천 정보 추가
+                "analysis": results['analysis'],
+                "events": results['events'],
+                "personalized_recommendation": results['personalized'],  # 맞춤 추천 정보 추가
+                "congestion": results['congestion'],  # 붐빌 때만 혼잡 대응 안내/대체 장소
+                "stages": stages,
+                "partial": any(stage['status'] != STAGE_OK for stage in stages.values())
             }
         except Exception as e:
             logger.error(f"추천 정보 생성 중 오류: {str(e)}")
             return {"error": f"추천 정보를 가져오는데 실패했습니다: {str(e)}"}
 
+    def close(self) -> None:
+        """추천 파이프라인 작업 스레드 정리 (실행 중인 작업은 기다리지 않음)"""
+        self._executor.shutdown(wait=False)
+
+    def _get_ranked_events(self, area: str, user_preferences: Dict[str, str]) -> Dict[str, Any]:
+        """진행 중 행사를 로컬 점수로 순위화 (카탈로그에 후보가 없으면 기존 행사 조회 사용)"""
+        if self._event_ranker is not None:
+            total_count, ranked = self._event_ranker.rank(area, user_preferences)
+            if total_count:
+                return {'success': True, 'total_count': total_count, 'data': ranked}
+        return get_events(self._api_key, area)
+
+    def _suggest_alternatives(self, area: str, congestion: Optional[str]) -> Optional[Dict[str, Any]]:
+        """붐비는 지역의 대체 장소 (LLM 없이 엔진으로만 선정, 붐비지 않거나 엔진이 없으면 None)"""
+        if self._alternative_engine is None or congestion not in CROWDED_LEVELS:
+            return None
+        alternatives = self._alternative_engine.recommend(area, congestion)
+        return {
+            "alternative_place": AlternativePlaceEngine.describe(area, alternatives),
+            "alternatives": alternatives
+        }
+
+    def _handle_crowded_area(self, area: str, city_status: Dict[str, Dict]) -> Optional[Dict[str, Any]]:
+        """추천 파이프라인 단계: 붐비는 경우에만 혼잡 대응 안내 생성"""
+        congestion = city_status['population'].get('congestion_level')
+        if congestion not in CROWDED_LEVELS:
+            return None
+        return self._handle_congestion(area, congestion, city_status['population'],
+                                       city_status['traffic'], phrase_with_llm=True)
+
     def _handle_congestion(self, area: str, congestion: str, 
-                         population_status: dict, traffic_status: dict) -> Dict[str, str]:
+                         population_status: dict, traffic_status: dict,
+                         phrase_with_llm: bool = False) -> Dict[str, Any]:
         """혼잡 상황 처리"""
         forecast = population_status.get("forecast", {})
         
@@ -136,11 +275,23 @@ class ChatBot:
             area, congestion, forecast, traffic_status
         )
 
-        alternative_place = self._llm_service.get_alternative_place(
-            area, self._city_data.valid_areas
-        )
+        # 대체 장소는 혼잡도 스냅샷 + 거리/분류 행렬로 결정적으로 선정 (LLM은 문장 다듬기만 선택적으로)
+        alternatives = []
+        if self._alternative_engine is not None:
+            alternatives = self._alternative_engine.recommend(area, congestion)
+            alternative_place = AlternativePlaceEngine.describe(area, alternatives)
+            if phrase_with_llm and alternatives:
+                phrased = self._llm_service.phrase_alternative_place(area, alternatives)
+                # LLM 오류 시 엔진이 만든 문장 유지
+                if phrased != LLM_ERROR_MESSAGE:
+                    alternative_place = phrased
+        else:
+            alternative_place = self._llm_service.get_alternative_place(
+                area, self._city_data.valid_areas
+            )
         
         return {
             "congestion_recommendation": recommendation,
-            "alternative_place": alternative_place
-        }
\ No newline at end of file
+            "alternative_place": alternative_place,
+            "alternatives": alternatives
+        }
@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from urllib.parse import quote
 from typing import Dict, List, Optional
@@ -6,6 +7,7 @@ import os
 from dotenv import load_dotenv
 import time
 import logging
+from app.api.services.single_flight import get_single_flight
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -20,6 +22,11 @@ class SeoulCityData:
             'Accept': 'application/json',
             'Content-Type': 'application/json; charset=utf-8'
         }
+        # 커넥션 재사용을 위한 세션 (여러 스레드에서 공유)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self.valid_areas = [
             "강남 MICE 관광특구", "강남역", "고속터미널역", "교대역", "선릉역",
             "신논현역·논현역", "역삼역", "압구정로데오거리", "청담동 명품거리", "가로수길",
@@ -60,10 +67,14 @@ class SeoulCityData:
         return f"{self._base_url}/{self._api_key}/json/citydata/1/5/{quote(area)}"
 
     def _fetch_data(self, area: str) -> Optional[Dict]:
-        """private: API로부터 데이터 가져오기"""
+        """private: API로부터 데이터 가져오기 (같은 지역 동시 요청은 한 번만 호출)"""
+        return get_single_flight("citydata").do(area, self._request_data, area)
+
+    def _request_data(self, area: str) -> Optional[Dict]:
+        """private: CITYDATA API 호출 (재시도 포함)"""
         try:
             for attempt in range(3):
-                response = requests.get(
+                response = self._session.get(
                     self._get_endpoint(area), 
                     headers=self._headers, 
                     verify=False,
@@ -100,6 +111,10 @@ class SeoulCityData:
         """API 키 getter"""
         return self._api_key
 
+    def close(self) -> None:
+        """HTTP 세션 종료"""
+        self._session.close()
+
     def get_population_status(self, area: str) -> Dict:
         """공개 인터페이스: 인구 현황 데이터"""
         data = self._fetch_data(area)
@@ -121,6 +136,17 @@ class SeoulCityData:
             return {}
         return self._extract_commercial_data(data)
 
+    def get_area_status(self, area: str) -> Dict[str, Dict]:
+        """공개 인터페이스: 인구/교통/상권 현황 (CITYDATA 한 번 조회)"""
+        data = self._fetch_data(area)
+        if not data:
+            return {"population": {}, "traffic": {}, "commercial": {}}
+        return {
+            "population": self._extract_population_data(data),
+            "traffic": self._extract_traffic_data(data),
+            "commercial": self._extract_commercial_data(data)
+        }
+
     def _extract_population_data(self, data: Dict) -> Dict:
         """private: 인구 데이터 추출"""
         try:
@@ -1,7 +1,8 @@
 import sqlite3
 import os
 import logging
-from typing import List, Dict
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
 from app.api.services.coordinates import AREA_COORDINATES  # 절대 경로로 수정
 
 # DB 절대경로로 설정
@@ -11,6 +12,18 @@ DB_PATH = "/home/ubuntu/myproject/backend/app/data/congestion.sqlite"
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 수집 시각('YYYY-MM-DD HH:MM', 서울 현지 시각)을 분 단위 정수로 바꿀 때의 기준 시각
+# 시간대 변환 없이 빼기만 하므로 분 % 1440 이 그대로 현지 시각의 분이 된다
+_EPOCH = datetime(1970, 1, 1)
+
+
+def timestamp_to_minute(timestamp: Optional[str]) -> Optional[int]:
+    """'YYYY-MM-DD HH:MM' → 1970-01-01 00:00 기준 분 (형식/값이 잘못되면 None)"""
+    try:
+        return (datetime.strptime(timestamp[:16], '%Y-%m-%d %H:%M') - _EPOCH) // timedelta(minutes=1)
+    except (TypeError, ValueError):
+        return None
+
 def init_db():
     """DB 초기화: 테이블이 없으면 생성"""
     try:
@@ -31,9 +44,18 @@ def init_db():
                 congestion_level TEXT NOT NULL,
                 timestamp TEXT NOT NULL,
                 latitude REAL,
-                longitude REAL
+                longitude REAL,
+                population_min INTEGER,
+                population_max INTEGER
             )
         """)
+
+        # 기존 테이블에 인구 컬럼이 없으면 추가
+        cursor.execute("PRAGMA table_info(congestion)")
+        columns = {row[1] for row in cursor.fetchall()}
+        for column in ("population_min", "population_max"):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE congestion ADD COLUMN {column} INTEGER")
         conn.commit()
         conn.close()
 
@@ -68,14 +90,17 @@ def insert_congestion_data(data: List[Dict]):
         area = item["area"]
         congestion_level = item["data"].get("congestion_level", "정보 없음")
         timestamp = item["data"].get("current_time", "정보 없음")
+        population_range = item["data"].get("population_range", {})
         lat, lng = AREA_COORDINATES.get(area, (None, None))
 
         cursor.execute(
             """
-            INSERT INTO congestion (area, congestion_level, timestamp, latitude, longitude)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO congestion (area, congestion_level, timestamp, latitude, longitude,
+                                    population_min, population_max)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
             """,
-            (area, congestion_level, timestamp, lat, lng)
+            (area, congestion_level, timestamp, lat, lng,
+             population_range.get("min"), population_range.get("max"))
         )
 
     conn.commit()
@@ -108,6 +133,25 @@ def get_congestion_data():
         logger.error(f"데이터 조회 오류: {e}")
         return []
 
+def get_congestion_rows_since(last_id: int) -> List[Tuple]:
+    """last_id 이후에 추가된 혼잡도 행 조회 (증분 집계용)"""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT id, area, congestion_level, timestamp, population_min, population_max
+            FROM congestion
+            WHERE id > ?
+            ORDER BY id
+        """, (last_id,))
+        rows = cursor.fetchall()
+        conn.close()
+        return rows
+
+    except sqlite3.Error as e:
+        logger.error(f"증분 데이터 조회 오류: {e}")
+        return []
+
 def get_area_congestion_data(area: str):
     """특정 지역 혼잡도 상세 조회"""
     try:
@@ -0,0 +1,105 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+def to_day(value: date) -> int:
+    """날짜 → 정수 일 번호 (date.toordinal)"""
+    return value.toordinal()
+
+
+def from_day(day: int) -> date:
+    """정수 일 번호 → 날짜"""
+    return date.fromordinal(day)
+
+
+def weekend_range(today: date) -> Tuple[date, date]:
+    """다가오는 주말 (오늘이 주말이면 이번 주말) 토요일~일요일"""
+    if today.weekday() == 6:
+        return today - timedelta(days=1), today
+    saturday = today + timedelta(days=5 - today.weekday())
+    return saturday, saturday + timedelta(days=1)
+
+
+class _Node(Generic[K]):
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, center: int, intervals: List[Tuple[int, int, K]]):
+        self.center = center
+        self.by_start = sorted(intervals, key=lambda item: item[0])                  # 시작일 오름차순
+        self.by_end = sorted(intervals, key=lambda item: item[1], reverse=True)      # 종료일 내림차순
+        self.left: Optional["_Node[K]"] = None
+        self.right: Optional["_Node[K]"] = None
+
+
+class IntervalIndex(Generic[K]):
+    """정적 중심 구간 트리 + 시작일 정렬 배열
+
+    - overlapping(d1, d2): [d1, d2]와 겹치는 구간, O(log n + k)
+    - starting_between(d1, d2): 시작일이 [d1, d2]인 구간, O(log n + k)
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[K, int, int]]):
+        items = [(start, end, key) for key, start, end in intervals if start <= end]
+        self._size = len(items)
+        self._root = self._build(items)
+        items.sort(key=lambda item: item[0])
+        self._starts = [start for start, _, _ in items]
+        self._start_keys = [key for _, _, key in items]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _build(self, items: List[Tuple[int, int, K]]) -> Optional[_Node[K]]:
+        """private: 중앙값 기준으로 재귀 분할 (중심을 포함하는 구간은 현재 노드에 보관)"""
+        if not items:
+            return None
+        endpoints = sorted(point for start, end, _ in items for point in (start, end))
+        center = endpoints[len(endpoints) // 2]
+        left = [item for item in items if item[1] < center]
+        right = [item for item in items if item[0] > center]
+        here = [item for item in items if item[0] <= center <= item[1]]
+        node = _Node(center, here)
+        node.left = self._build(left)
+        node.right = self._build(right)
+        return node
+
+    def overlapping(self, first_day: int, last_day: int) -> List[K]:
+        """[first_day, last_day] 기간과 하루라도 겹치는 구간의 키"""
+        result: List[K] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if last_day < node.center:
+                # 모든 구간이 중심을 포함하므로 시작일만 확인하면 됨
+                for start, _, key in node.by_start:
+                    if start > last_day:
+                        break
+                    result.append(key)
+                stack.append(node.left)
+            elif first_day > node.center:
+                # 종료일만 확인하면 됨
+                for _, end, key in node.by_end:
+                    if end < first_day:
+                        break
+                    result.append(key)
+                stack.append(node.right)
+            else:
+                result.extend(key for _, _, key in node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+        return result
+
+    def active_on(self, day: int) -> List[K]:
+        """해당 날짜에 진행 중인 구간의 키"""
+        return self.overlapping(day, day)
+
+    def starting_between(self, first_day: int, last_day: int) -> List[K]:
+        """시작일이 [first_day, last_day]인 구간의 키 (시작일 순)"""
+        lo = bisect_left(self._starts, first_day)
+        hi = bisect_right(self._starts, last_day)
+        return self._start_keys[lo:hi]
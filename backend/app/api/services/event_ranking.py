@@ -0,0 +1,149 @@
+import math
+import logging
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from app.api.services.area_registry import AREA_INDEX, CONGESTION_LEVELS
+from app.api.services.coordinates import AREA_COORDINATES
+from app.api.services.event_service import CulturalEventManager
+from app.api.services.event_store import EventStore
+from app.api.services.location_service import CityInfo
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_RADIUS_KM = 3.0
+DEFAULT_TOP_N = 5
+PROGRAM_SUMMARY_LENGTH = 60  # LLM 프롬프트에 넣을 프로그램 설명 최대 길이
+
+# 연령대별 선호 분류 (CODENAME 부분 일치)
+AGE_GROUP_CATEGORIES = {
+    "10대": ("콘서트", "뮤지컬", "축제", "교육/체험", "영화"),
+    "20대": ("콘서트", "전시/미술", "뮤지컬", "축제", "영화"),
+    "30대": ("전시/미술", "뮤지컬", "연극", "클래식", "교육/체험"),
+    "40대": ("클래식", "연극", "전시/미술", "교육/체험"),
+    "50대": ("클래식", "국악", "전통", "전시/미술", "독주/독창회"),
+    "60대 이상": ("클래식", "국악", "전통", "독주/독창회"),
+}
+
+CHILD_KEYWORDS = ("어린이", "아동", "유아", "가족", "키즈", "체험", "청소년")
+ADULT_KEYWORDS = ("19세", "성인", "미성년자 관람불가")
+
+# 이동수단별 거리 감쇠 척도 (km): 걸어서 다닐수록 가까운 행사를 더 선호
+# (키는 프론트엔드 이동수단 선택지와 같아야 함)
+DISTANCE_SCALE_KM = {"도보": 1.0, "자전거": 2.0, "대중교통": 2.5, "자동차": 4.0}
+
+# 점수 가중치
+CATEGORY_WEIGHT = 1.0
+INTEREST_WEIGHT = 1.5
+FREE_WEIGHT = 0.5
+DISTANCE_WEIGHT = 1.5
+UNKNOWN_DISTANCE_SCORE = 0.3  # 좌표가 없는 자치구 행사
+CHILD_WEIGHT = 1.0
+ADULT_PENALTY = 1.0
+CONGESTION_PENALTY = 0.4      # '여유' 대비 혼잡 단계당 감점
+
+
+def _district_of(area: str) -> Optional[str]:
+    """private: 주요 지역 → 자치구"""
+    for district, places in CulturalEventManager.DISTRICT_AREAS.items():
+        if area in places:
+            return district
+    return None
+
+
+def _is_free(event: Dict) -> bool:
+    """private: 무료 행사 여부 (요금 정보가 비어 있으면 알 수 없으므로 무료로 보지 않음)"""
+    fee = (event.get("USE_FEE") or "").strip()
+    return "무료" in fee
+
+
+class EventRanker:
+    """LLM 호출 전 진행 중 행사를 사용자 조건으로 빠르게 점수화해 상위 N개만 남기는 단계"""
+
+    def __init__(self, store: EventStore, level_provider: Callable[[], Sequence[int]],
+                 radius_km: float = DEFAULT_RADIUS_KM):
+        self._store = store
+        self._level_provider = level_provider
+        self._radius_km = radius_km
+
+    def candidates(self, area: str) -> List[Dict]:
+        """지역 주변(같은 자치구 + 반경 내) 진행 중 행사"""
+        coordinates = AREA_COORDINATES.get(area)
+        if coordinates is None:
+            return []
+        return self._store.active_events_around(_district_of(area), *coordinates, self._radius_km)
+
+    def score(self, event: Dict, user_preferences: Dict[str, str],
+              levels: Sequence[int]) -> Tuple[float, List[str]]:
+        """행사 점수와 근거"""
+        score, reasons = 0.0, []
+        codename = event.get("CODENAME") or ""
+        text = " ".join(event.get(field) or "" for field in ("TITLE", "PROGRAM", "CODENAME"))
+
+        preferred = AGE_GROUP_CATEGORIES.get(user_preferences.get("age_group", ""), ())
+        if any(category in codename for category in preferred):
+            score += CATEGORY_WEIGHT
+            reasons.append("연령대 선호 분류")
+
+        interests = [word.strip() for word in user_preferences.get("interests", "").split(",") if word.strip()]
+        if any(interest in text for interest in interests):
+            score += INTEREST_WEIGHT
+            reasons.append("관심사 일치")
+
+        if _is_free(event):
+            score += FREE_WEIGHT
+            reasons.append("무료")
+
+        distance = event.get("distance_km")
+        if distance is not None:
+            scale = DISTANCE_SCALE_KM.get(user_preferences.get("transportation", ""), 2.0)
+            score += DISTANCE_WEIGHT * math.exp(-distance / scale)
+        else:
+            score += UNKNOWN_DISTANCE_SCORE
+
+        if user_preferences.get("has_children") == "예":
+            if any(keyword in text for keyword in CHILD_KEYWORDS):
+                score += CHILD_WEIGHT
+                reasons.append("자녀 동반 적합")
+            if any(keyword in text for keyword in ADULT_KEYWORDS):
+                score -= ADULT_PENALTY
+
+        if event.get("latitude") is not None:
+            venue_area = CityInfo.find_nearest_area((event["latitude"], event["longitude"]))
+            level = levels[AREA_INDEX[venue_area]] if venue_area in AREA_INDEX else 0
+            if level > 1:
+                score -= CONGESTION_PENALTY * (level - 1)
+                reasons.append(f"행사장 주변 {CONGESTION_LEVELS[level]}")
+
+        return score, reasons
+
+    @staticmethod
+    def summarize(event: Dict, score: float, reasons: List[str]) -> Dict:
+        """LLM 프롬프트/응답용 압축 행사 정보"""
+        # 값이 비어 있는 필드는 빼서 format_event_data의 기본 문구('요금 정보 없음' 등)가 들어가게 함
+        fields = {field: value for field, value in event.items()
+                  if value is not None and not (isinstance(value, str) and not value.strip())}
+        program = fields.get("PROGRAM")
+        if program and len(program) > PROGRAM_SUMMARY_LENGTH:
+            fields["PROGRAM"] = program[:PROGRAM_SUMMARY_LENGTH] + "…"
+        summary = CulturalEventManager.format_event_data(fields)
+        if _is_free(event):
+            summary["USE_FEE"] = "무료"
+        if event.get("distance_km") is not None:
+            summary["DISTANCE_KM"] = event["distance_km"]
+        summary["SCORE"] = round(score, 3)
+        summary["REASONS"] = reasons
+        return summary
+
+    def rank(self, area: str, user_preferences: Dict[str, str], limit: int = DEFAULT_TOP_N,
+             events: Optional[List[Dict]] = None) -> Tuple[int, List[Dict]]:
+        """(후보 수, 점수 상위 limit개 압축 정보). events를 주면 그 목록을 순위화"""
+        events = self.candidates(area) if events is None else events
+        levels = self._level_provider()
+        scored = []
+        for event in events:
+            score, reasons = self.score(event, user_preferences, levels)
+            scored.append((score, event.get("TITLE") or "", event, reasons))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return len(scored), [self.summarize(event, score, reasons)
+                             for score, _, event, reasons in scored[:limit]]
@@ -0,0 +1,115 @@
+import re
+import math
+import threading
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 검색 대상 필드와 가중치 (제목 일치를 가장 중요하게 봄)
+FIELD_WEIGHTS = {"TITLE": 3.0, "CODENAME": 2.0, "PROGRAM": 1.0, "PLACE": 1.0}
+
+# BM25 매개변수
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD_PATTERN = re.compile(r"[0-9a-z]+|[^\W\d_a-z]+")
+_ASCII_WORD = re.compile(r"[0-9a-z]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """검색어/본문 → 색인어 (한글 등은 문자 바이그램, 영문·숫자는 단어 단위)"""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    terms = []
+    for word in _WORD_PATTERN.findall(text):
+        if _ASCII_WORD.fullmatch(word) or len(word) == 1:
+            terms.append(word)
+        else:
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+class EventSearchIndex:
+    """문화행사 역색인 (필드 가중 BM25)
+
+    행사 추가/삭제 시 해당 행사의 색인어만 갱신하므로 동기화 때마다 전체를 다시 만들 필요가 없다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Dict[str, float]] = {}  # 색인어 → {행사 키: 가중 빈도}
+        self._doc_terms: Dict[str, Counter] = {}           # 행사 키 → 색인어 빈도 (삭제용)
+        self._doc_lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    @staticmethod
+    def _weighted_terms(event: Dict) -> Counter:
+        """private: 필드 가중치를 곱한 색인어 빈도"""
+        terms: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(event.get(field) or ""):
+                terms[term] += weight
+        return terms
+
+    def _remove_locked(self, key: str) -> None:
+        """private: 색인에서 행사 제거 (잠금 보유 상태)"""
+        terms = self._doc_terms.pop(key, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(key)
+
+    def add(self, key: str, event: Dict) -> None:
+        """행사 추가 (이미 있으면 교체)"""
+        terms = self._weighted_terms(event)
+        with self._lock:
+            self._remove_locked(key)
+            for term, frequency in terms.items():
+                self._postings.setdefault(term, {})[key] = frequency
+            self._doc_terms[key] = terms
+            length = sum(terms.values())
+            self._doc_lengths[key] = length
+            self._total_length += length
+
+    def add_many(self, events: Iterable[Tuple[str, Dict]]) -> None:
+        """여러 행사 추가"""
+        for key, event in events:
+            self.add(key, event)
+
+    def remove(self, key: str) -> None:
+        """행사 제거"""
+        with self._lock:
+            self._remove_locked(key)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """검색어 → [(행사 키, 점수)] (점수 높은 순)"""
+        query_terms = Counter(tokenize(query))
+        if not query_terms:
+            return []
+
+        with self._lock:
+            doc_count = len(self._doc_lengths)
+            if not doc_count:
+                return []
+            average_length = self._total_length / doc_count
+            scores: Dict[str, float] = {}
+            for term, query_frequency in query_terms.items():
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, frequency in postings.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[key] / average_length)
+                    scores[key] = scores.get(key, 0.0) + (
+                        query_frequency * idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                    )
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked if limit is None else ranked[:limit]
@@ -1,8 +1,10 @@
 import requests
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
+from app.api.services.event_store import EventStore, get_event_store, parse_date_range
+from app.api.services.single_flight import get_single_flight
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -56,9 +58,10 @@ class CulturalEventManager:
         "중랑구": ["회기역"]
     }
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, event_store: Optional[EventStore] = None):
         self._api_key = api_key  # private
         self._base_url = "http://openapi.seoul.go.kr:8088"  # private
+        self._event_store = event_store or get_event_store()  # private
 
     @property
     def api_key(self) -> str:
@@ -80,25 +83,34 @@ class CulturalEventManager:
 
     def _is_event_active(self, date_str: str, current_date: datetime.date) -> bool:
         """이벤트 활성화 여부를 확인하는 private 메서드"""
-        try:
-            # 날짜 문자열에서 불필요한 문자 제거
-            date_range = date_str.split('~')
-            start_date_str = date_range[0].strip()  # 시작 날짜
-            end_date_str = date_range[1].strip() if len(date_range) > 1 else start_date_str  # 종료 날짜
-
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-
-            return start_date <= current_date <= end_date  # 현재 날짜가 시작일과 종료일 사이인지 확인
-        except ValueError:
+        date_range = parse_date_range(date_str)
+        if date_range is None:
             return False  # 날짜 형식이 잘못된 경우 False 반환
+        start_date, end_date = date_range
+        return start_date <= current_date <= end_date  # 현재 날짜가 시작일과 종료일 사이인지 확인
+
+    def fetch_event_page(self, start: int, end: int) -> dict:
+        """culturalEventInfo 원본 응답 한 구간 (start~end 행, 같은 구간 동시 요청은 한 번만 호출)"""
+        url = f"{self._base_url}/{self._api_key}/json/culturalEventInfo/{start}/{end}/"
+        return get_single_flight("cultural_events").do(url, self._make_api_request, url)
 
     # public interface
     def get_events_by_district(self, district: str, limit: int = 3) -> Dict[str, Any]:
-        """공개 인터페이스: 특정 자치구의 문화 행사 정보 조회"""
+        """공개 인터페이스: 특정 자치구의 문화 행사 정보 조회 (동기화된 로컬 카탈로그 우선)"""
+        if self._event_store.count():
+            total_count, events = self._event_store.query_events(district=district, limit=limit)
+            return {
+                'success': True,
+                'total_count': total_count,
+                'data': [self.format_event_data(event) for event in events]
+            }
+        # 아직 한 번도 동기화되지 않은 경우에만 API 직접 조회
+        return self._fetch_events_by_district(district, limit)
+
+    def _fetch_events_by_district(self, district: str, limit: int = 3) -> Dict[str, Any]:
+        """API에서 직접 특정 자치구의 문화 행사 정보 조회하는 private 메서드"""
         try:
-            url = f"{self._base_url}/{self._api_key}/json/culturalEventInfo/1/1000/"
-            data = self._make_api_request(url)
+            data = self.fetch_event_page(1, 1000)
             
             if not data or 'culturalEventInfo' not in data:
                 return {'success': False, 'error': '응답이 비어 있거나 유효하지 않습니다.', 'total_count': 0, 'data': []}
@@ -0,0 +1,608 @@
+import os
+import re
+import json
+import sqlite3
+import hashlib
+import threading
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.api.services.congestion_db import DB_PATH
+from app.api.services.event_index import IntervalIndex, to_day, weekend_range
+from app.api.services.event_search import EventSearchIndex
+from app.api.services.spatial_index import SpatialIndex, haversine_km
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 문화행사 DB 경로 (혼잡도 DB와 같은 디렉토리)
+EVENT_DB_PATH = os.path.join(os.path.dirname(DB_PATH), "cultural_events.sqlite")
+
+# 지오코딩에 실패한 행사장을 다시 시도하기까지의 기간 (일)
+GEOCODE_RETRY_DAYS = int(os.getenv("EVENT_GEOCODE_RETRY_DAYS", 7))
+
+# API 응답 필드 → 컬럼
+_EVENT_COLUMNS = {
+    "TITLE": "title",
+    "PLACE": "place",
+    "DATE": "date_text",
+    "CODENAME": "codename",
+    "GUNAME": "guname",
+    "USE_FEE": "use_fee",
+    "PROGRAM": "program",
+}
+
+
+def parse_date_range(date_str: str) -> Optional[Tuple[date, date]]:
+    """'YYYY-MM-DD~YYYY-MM-DD' → (시작일, 종료일) (형식이 잘못되면 None)"""
+    try:
+        date_range = (date_str or "").split('~')
+        start_date_str = date_range[0].strip()
+        end_date_str = date_range[1].strip() if len(date_range) > 1 else start_date_str
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        return start_date, end_date
+    except ValueError:
+        return None
+
+
+# 문화포털 상세 페이지 주소의 행사 코드 (페이지 순서가 바뀌어도 변하지 않는 식별자)
+_CULTCODE_PATTERN = re.compile(r"cultcode=(\d+)")
+
+
+# 서울 일대 좌표 범위 (범위를 벗어난 좌표는 잘못된 값으로 봄)
+_LAT_RANGE = (37.0, 38.0)
+_LNG_RANGE = (126.5, 127.5)
+
+
+def is_seoul_coordinate(lat: float, lng: float) -> bool:
+    """서울 일대 좌표인지 확인"""
+    return _LAT_RANGE[0] <= lat <= _LAT_RANGE[1] and _LNG_RANGE[0] <= lng <= _LNG_RANGE[1]
+
+
+def parse_event_coordinates(event: Dict) -> Optional[Tuple[float, float]]:
+    """API 행의 LAT/LOT 좌표 (위도·경도가 뒤바뀐 응답도 처리, 없으면 None)"""
+    try:
+        first, second = float(event.get("LAT") or ""), float(event.get("LOT") or "")
+    except ValueError:
+        return None
+    for lat, lng in ((first, second), (second, first)):
+        if is_seoul_coordinate(lat, lng):
+            return lat, lng
+    return None
+
+
+def content_hash(event: Dict) -> str:
+    """정규화한 행사 레코드 해시 (필드 순서·공백 차이는 무시)"""
+    normalized = {field: " ".join(str(value).split()) for field, value in event.items()
+                  if value not in (None, "")}
+    return hashlib.sha1(
+        json.dumps(normalized, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def make_event_key(event: Dict) -> str:
+    """행사 고유 키 (문화포털 행사 코드, 없으면 제목·장소·기간·자치구 해시)"""
+    match = _CULTCODE_PATTERN.search(event.get("HMPG_ADDR") or "")
+    if match:
+        return f"cult:{match.group(1)}"
+    identity = "|".join(str(event.get(field, "")).strip()
+                        for field in ("TITLE", "PLACE", "DATE", "GUNAME"))
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+class EventStore:
+    """문화행사 로컬 카탈로그 (SQLite)
+
+    주기 동기화 작업이 서울시 culturalEventInfo 응답을 적재하고,
+    행사 조회는 네트워크 대신 이 저장소에서 처리한다.
+    기간 조건은 적재 시 정수 일 번호로 변환해 둔 값으로 만든 메모리 구간 인덱스로 찾는다.
+    """
+
+    def __init__(self, db_path: str = EVENT_DB_PATH):
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        # 메모리 스냅샷 (쓰기 후 무효화, 다음 조회 시 재구성)
+        # 세대 번호는 무효화마다 증가: 재구성 중 쓰기가 끼어들면 낡은 결과를 설치하지 않음
+        self._generation = 0
+        self._index: Optional[IntervalIndex[str]] = None
+        self._events: Dict[str, Dict] = {}
+        self._spatial: Optional[SpatialIndex[str]] = None
+        # 전문 검색 색인 (최초 검색 시 구성, 이후 쓰기마다 증분 갱신)
+        self._search: Optional[EventSearchIndex] = None
+        self._search_lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """private: 연결 생성"""
+        return sqlite3.connect(self._db_path)
+
+    def _init_db(self) -> None:
+        """private: 테이블/인덱스 생성"""
+        try:
+            os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+            conn = self._connect()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cultural_events (
+                    event_key TEXT PRIMARY KEY,
+                    title TEXT,
+                    place TEXT,
+                    date_text TEXT,
+                    codename TEXT,
+                    guname TEXT,
+                    use_fee TEXT,
+                    program TEXT,
+                    start_date TEXT,
+                    end_date TEXT,
+                    start_day INTEGER,
+                    end_day INTEGER,
+                    latitude REAL,
+                    longitude REAL,
+                    geocode_attempted_at TEXT,
+                    raw_json TEXT,
+                    content_hash TEXT,
+                    deleted_at TEXT,
+                    synced_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS event_sync_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    synced_at TEXT NOT NULL,
+                    total_count INTEGER,
+                    catalog_digest TEXT
+                )
+            """)
+            # 기존 테이블에 정수 일 번호 컬럼이 없으면 추가 후 채움
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(cultural_events)")}
+            if "start_day" not in columns:
+                for column in ("start_day", "end_day"):
+                    conn.execute(f"ALTER TABLE cultural_events ADD COLUMN {column} INTEGER")
+                conn.execute("""
+                    UPDATE cultural_events
+                    SET start_day = CAST(julianday(start_date) - julianday('0001-01-01') + 1 AS INTEGER),
+                        end_day = CAST(julianday(end_date) - julianday('0001-01-01') + 1 AS INTEGER)
+                    WHERE start_date IS NOT NULL
+                """)
+            # 행사장 좌표 컬럼
+            if "latitude" not in columns:
+                for column in ("latitude", "longitude"):
+                    conn.execute(f"ALTER TABLE cultural_events ADD COLUMN {column} REAL")
+            # 행사장 지오코딩 시도 시각 (좌표를 못 찾은 장소를 반복 조회하지 않도록)
+            if "geocode_attempted_at" not in columns:
+                conn.execute("ALTER TABLE cultural_events ADD COLUMN geocode_attempted_at TEXT")
+            # 증분 동기화 컬럼 (내용 해시, 삭제 표시)
+            if "content_hash" not in columns:
+                for column in ("content_hash", "deleted_at"):
+                    conn.execute(f"ALTER TABLE cultural_events ADD COLUMN {column} TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_events_guname_dates "
+                         "ON cultural_events (guname, start_date, end_date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_events_dates "
+                         "ON cultural_events (start_date, end_date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_events_codename "
+                         "ON cultural_events (codename)")
+            conn.commit()
+            conn.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"문화행사 DB 초기화 오류: {e}")
+
+    def upsert_events(self, events: Iterable[Dict], synced_at: Optional[str] = None) -> int:
+        """API 행사 행 적재 (같은 키는 갱신, 삭제 표시 해제)"""
+        synced_at = synced_at or datetime.now().isoformat(timespec="seconds")
+        rows = []
+        keyed_events = []
+        for event in events:
+            keyed_events.append((make_event_key(event), event))
+            date_range = parse_date_range(event.get("DATE", ""))
+            start_date, end_date = date_range if date_range else (None, None)
+            lat, lng = parse_event_coordinates(event) or (None, None)
+            rows.append((
+                keyed_events[-1][0],
+                *(event.get(field) for field in _EVENT_COLUMNS),
+                start_date.isoformat() if start_date else None,
+                end_date.isoformat() if end_date else None,
+                to_day(start_date) if start_date else None,
+                to_day(end_date) if end_date else None,
+                lat,
+                lng,
+                json.dumps(event, ensure_ascii=False),
+                content_hash(event),
+                None,
+                synced_at
+            ))
+
+        if not rows:
+            return 0
+        columns = ["event_key", *_EVENT_COLUMNS.values(), "start_date", "end_date",
+                   "start_day", "end_day", "latitude", "longitude", "raw_json", "content_hash",
+                   "deleted_at", "synced_at"]
+        # 지오코딩으로 채운 좌표는 응답에 좌표가 없으면 유지하되, 장소/자치구가 바뀌면 지워서 다시 지오코딩
+        # (SET 식의 열 이름은 갱신 전 값을 가리킴)
+        same_venue = ("COALESCE(excluded.place, '') = COALESCE(place, '') "
+                      "AND COALESCE(excluded.guname, '') = COALESCE(guname, '')")
+        updates = ", ".join(
+            f"{column} = CASE WHEN {same_venue} THEN COALESCE(excluded.{column}, {column}) "
+            f"ELSE excluded.{column} END" if column in ("latitude", "longitude")
+            else f"{column} = excluded.{column}"
+            for column in columns[1:]
+        )
+        updates += f", geocode_attempted_at = CASE WHEN {same_venue} THEN geocode_attempted_at END"
+        try:
+            conn = self._connect()
+            conn.executemany(
+                f"INSERT INTO cultural_events ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT(event_key) DO UPDATE SET {updates}",
+                rows
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"문화행사 저장 오류: {e}")
+            return 0
+        self._invalidate()
+        if self._search is not None:
+            self._search.add_many(keyed_events)
+        return len(rows)
+
+    def apply_sync(self, events: Dict[str, Dict], complete: bool, total_count: int = 0) -> Dict[str, int]:
+        """동기화 결과 반영: 내용 해시가 바뀐 행사만 갱신하고, 사라진 행사는 삭제 표시
+
+        events는 {행사 키: API 행}. complete가 False(일부 페이지 실패)면 삭제 표시는 하지 않는다.
+        """
+        hashes = {key: content_hash(event) for key, event in events.items()}
+        try:
+            conn = self._connect()
+            existing = {key: (stored_hash, deleted_at) for key, stored_hash, deleted_at in conn.execute(
+                "SELECT event_key, content_hash, deleted_at FROM cultural_events"
+            )}
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"문화행사 조회 오류: {e}")
+            return {'inserted': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+
+        inserted = [key for key in events if key not in existing]
+        updated = [key for key in events
+                   if key in existing and (existing[key][0] != hashes[key] or existing[key][1])]
+        changed = inserted + updated
+        if changed:
+            self.upsert_events(events[key] for key in changed)
+
+        deleted = 0
+        if complete:
+            gone = [key for key, (_, deleted_at) in existing.items()
+                    if key not in events and not deleted_at]
+            deleted = self._tombstone(gone)
+            # 전체 카탈로그 요약 해시를 동기화 기준점으로 기록
+            digest = hashlib.sha1("".join(sorted(hashes.values())).encode("utf-8")).hexdigest()
+            self._set_watermark(total_count, digest)
+
+        return {
+            'inserted': len(inserted),
+            'updated': len(updated),
+            'unchanged': len(events) - len(changed),
+            'deleted': deleted
+        }
+
+    def _tombstone(self, keys: List[str]) -> int:
+        """private: 원본에서 사라진 행사 삭제 표시 (조회 대상에서 제외)"""
+        if not keys:
+            return 0
+        deleted_at = datetime.now().isoformat(timespec="seconds")
+        try:
+            conn = self._connect()
+            conn.executemany("UPDATE cultural_events SET deleted_at = ? WHERE event_key = ?",
+                             [(deleted_at, key) for key in keys])
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"문화행사 삭제 표시 오류: {e}")
+            return 0
+        self._invalidate()
+        if self._search is not None:
+            for key in keys:
+                self._search.remove(key)
+        return len(keys)
+
+    def purge_tombstones(self, older_than_days: int = 30) -> int:
+        """삭제 표시 후 오래된 행사 영구 삭제"""
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).isoformat(timespec="seconds")
+        try:
+            conn = self._connect()
+            purged = conn.execute(
+                "DELETE FROM cultural_events WHERE deleted_at IS NOT NULL AND deleted_at < ?", (cutoff,)
+            ).rowcount
+            conn.commit()
+            conn.close()
+            return purged
+        except sqlite3.Error as e:
+            logger.error(f"문화행사 삭제 오류: {e}")
+            return 0
+
+    def _set_watermark(self, total_count: int, digest: str) -> None:
+        """private: 마지막 전체 동기화 기준점 저장"""
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO event_sync_state (id, synced_at, total_count, catalog_digest) "
+                "VALUES (1, ?, ?, ?)",
+                (datetime.now().isoformat(timespec="seconds"), total_count, digest)
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"동기화 기준점 저장 오류: {e}")
+
+    def get_watermark(self) -> Optional[Dict]:
+        """마지막 전체 동기화 기준점 (시각, 원본 건수, 카탈로그 요약 해시)"""
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT synced_at, total_count, catalog_digest FROM event_sync_state WHERE id = 1"
+            ).fetchone()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"동기화 기준점 조회 오류: {e}")
+            return None
+        if row is None:
+            return None
+        return {'synced_at': row[0], 'total_count': row[1], 'catalog_digest': row[2]}
+
+    def venues_without_coordinates(self, limit: Optional[int] = None,
+                                   retry_after_days: int = GEOCODE_RETRY_DAYS) -> List[Tuple[str, str]]:
+        """좌표가 없는 행사장 (자치구, 장소명) 목록 (행사가 많은 장소부터, 최근에 시도한 장소 제외)"""
+        cutoff = (datetime.now() - timedelta(days=retry_after_days)).isoformat(timespec="seconds")
+        query = ("SELECT COALESCE(guname, ''), place FROM cultural_events "
+                 "WHERE latitude IS NULL AND deleted_at IS NULL AND place IS NOT NULL AND place != '' "
+                 "GROUP BY guname, place HAVING MAX(COALESCE(geocode_attempted_at, '')) < ? "
+                 "ORDER BY COUNT(*) DESC")
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        try:
+            conn = self._connect()
+            rows = conn.execute(query, (cutoff,)).fetchall()
+            conn.close()
+            return rows
+        except sqlite3.Error as e:
+            logger.error(f"문화행사 조회 오류: {e}")
+            return []
+
+    def mark_geocode_attempted(self, venues: Iterable[Tuple[str, str]]) -> None:
+        """행사장 지오코딩 시도 시각 기록 [(자치구, 장소명)] (결과와 관계없이 기록)"""
+        attempted_at = datetime.now().isoformat(timespec="seconds")
+        try:
+            conn = self._connect()
+            conn.executemany(
+                "UPDATE cultural_events SET geocode_attempted_at = ? "
+                "WHERE COALESCE(guname, '') = ? AND place = ? AND latitude IS NULL",
+                [(attempted_at, guname, place) for guname, place in venues]
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"지오코딩 시도 기록 오류: {e}")
+
+    def set_venue_coordinates(self, venues: Iterable[Tuple[str, str, float, float]]) -> int:
+        """행사장 좌표 저장 [(자치구, 장소명, 위도, 경도)] → 갱신된 행사 수"""
+        try:
+            conn = self._connect()
+            updated = 0
+            for guname, place, lat, lng in venues:
+                updated += conn.execute(
+                    "UPDATE cultural_events SET latitude = ?, longitude = ? "
+                    "WHERE COALESCE(guname, '') = ? AND place = ? AND latitude IS NULL",
+                    (lat, lng, guname, place)
+                ).rowcount
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"행사장 좌표 저장 오류: {e}")
+            return 0
+        if updated:
+            self._invalidate()
+        return updated
+
+    def _invalidate(self) -> None:
+        """private: 메모리 인덱스 무효화"""
+        with self._lock:
+            self._generation += 1
+            self._index = None
+            self._events = {}
+            self._spatial = None
+
+    def _snapshot(self) -> Tuple[IntervalIndex[str], Dict[str, Dict], SpatialIndex[str]]:
+        """private: 구간 인덱스, 행사 사전, 행사장 공간 인덱스 (없으면 DB에서 한 번 읽어 구성)"""
+        with self._lock:
+            if self._index is not None:
+                return self._index, self._events, self._spatial
+            generation = self._generation
+
+        columns = ", ".join(_EVENT_COLUMNS.values())
+        try:
+            conn = self._connect()
+            rows = conn.execute(
+                f"SELECT event_key, start_day, end_day, latitude, longitude, {columns} FROM cultural_events "
+                "WHERE start_day IS NOT NULL AND deleted_at IS NULL"
+            ).fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"문화행사 인덱스 적재 오류: {e}")
+            rows = []
+
+        events = {}
+        for event_key, start_day, end_day, lat, lng, *values in rows:
+            # 값이 없는 필드는 빼서 format_event_data의 기본값이 적용되도록 함
+            event = {field: value for field, value in zip(_EVENT_COLUMNS, values) if value is not None}
+            event["_key"], event["_start_day"], event["_end_day"] = event_key, start_day, end_day
+            event["_lat"], event["_lng"] = lat, lng
+            events[event_key] = event
+        index = IntervalIndex((key, event["_start_day"], event["_end_day"]) for key, event in events.items())
+        spatial = SpatialIndex((key, event["_lat"], event["_lng"]) for key, event in events.items()
+                               if event["_lat"] is not None)
+
+        with self._lock:
+            # 읽는 동안 쓰기가 있었으면 이번 결과는 이 호출에서만 쓰고 다음 조회에서 다시 구성
+            if self._generation == generation:
+                self._index, self._events, self._spatial = index, events, spatial
+        return index, events, spatial
+
+    def _filter(self, keys: Iterable[str], events: Dict[str, Dict], district: Optional[str],
+                codename: Optional[str]) -> List[Dict]:
+        """private: 자치구(GUNAME 일치 또는 장소명 포함)/분류 조건 적용"""
+        result = []
+        for key in keys:
+            event = events[key]
+            if district and not (event.get("GUNAME") == district or district in event.get("PLACE", "")):
+                continue
+            if codename and event.get("CODENAME") != codename:
+                continue
+            result.append(event)
+        return result
+
+    @staticmethod
+    def _public(events: List[Dict], limit: Optional[int]) -> List[Dict]:
+        """private: 내부 필드(_start_day 등)를 뺀 응답용 행사 목록"""
+        events = events if limit is None else events[:limit]
+        return [{field: value for field, value in event.items() if not field.startswith("_")}
+                for event in events]
+
+    def count(self) -> int:
+        """저장된 행사 수"""
+        try:
+            conn = self._connect()
+            total = conn.execute(
+                "SELECT COUNT(*) FROM cultural_events WHERE deleted_at IS NULL"
+            ).fetchone()[0]
+            conn.close()
+            return total
+        except sqlite3.Error as e:
+            logger.error(f"문화행사 조회 오류: {e}")
+            return 0
+
+    def query_events(self, district: Optional[str] = None, on_date: Optional[date] = None,
+                     codename: Optional[str] = None, limit: Optional[int] = None,
+                     until_date: Optional[date] = None) -> Tuple[int, List[Dict]]:
+        """진행 중 행사 (전체 건수, 제한된 목록, 최근 시작 순)
+
+        until_date를 주면 [on_date, until_date] 기간 중 하루라도 진행되는 행사를 찾는다.
+        district는 자치구명(GUNAME) 일치 또는 장소명 포함으로 판단한다.
+        """
+        first_day = to_day(on_date or datetime.now().date())
+        last_day = to_day(until_date) if until_date else first_day
+        index, events, _ = self._snapshot()
+        matched = self._filter(index.overlapping(first_day, last_day), events, district, codename)
+        matched.sort(key=lambda event: (-event["_start_day"], event.get("TITLE", "")))
+        return len(matched), self._public(matched, limit)
+
+    def upcoming_events(self, from_date: Optional[date] = None, days: int = 7,
+                        district: Optional[str] = None, codename: Optional[str] = None,
+                        limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+        """앞으로 days일 안에 시작하는 행사 (전체 건수, 제한된 목록, 시작일 순)"""
+        first_day = to_day(from_date or datetime.now().date()) + 1
+        index, events, _ = self._snapshot()
+        matched = self._filter(index.starting_between(first_day, first_day + days - 1),
+                               events, district, codename)
+        return len(matched), self._public(matched, limit)
+
+    def weekend_events(self, today: Optional[date] = None, district: Optional[str] = None,
+                       codename: Optional[str] = None,
+                       limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+        """다가오는 주말(토~일)에 진행되는 행사"""
+        saturday, sunday = weekend_range(today or datetime.now().date())
+        return self.query_events(district, saturday, codename, limit, until_date=sunday)
+
+    def _search_index(self) -> EventSearchIndex:
+        """private: 전문 검색 색인 (없으면 현재 카탈로그 전체로 구성)"""
+        with self._search_lock:
+            if self._search is not None:
+                return self._search
+            with self._lock:
+                generation = self._generation
+            _, events, _ = self._snapshot()
+            search = EventSearchIndex()
+            search.add_many(events.items())
+            with self._lock:
+                # 구성 중 쓰기가 있었으면 그 증분 갱신이 빠졌으므로 설치하지 않음
+                if self._generation == generation:
+                    self._search = search
+            return search
+
+    def search_events(self, query: str, district: Optional[str] = None,
+                      codename: Optional[str] = None, active_on: Optional[date] = None,
+                      limit: int = 10) -> Tuple[int, List[Dict]]:
+        """키워드 검색 (전체 건수, 점수 순 목록). active_on을 주면 그날 진행 중인 행사만"""
+        search = self._search_index()
+        _, events, _ = self._snapshot()
+        day = to_day(active_on) if active_on else None
+
+        matched = []
+        for key, score in search.search(query):
+            event = events.get(key)
+            if event is None:
+                continue
+            if day is not None and not event["_start_day"] <= day <= event["_end_day"]:
+                continue
+            matched.append((key, score))
+        filtered = self._filter((key for key, _ in matched), events, district, codename)
+        scores = dict(matched)
+        results = self._public(filtered, limit)
+        for result, event in zip(results, filtered):
+            result["score"] = round(scores[event["_key"]], 3)
+        return len(filtered), results
+
+    def events_near(self, lat: float, lng: float, radius_km: float, on_date: Optional[date] = None,
+                    codename: Optional[str] = None,
+                    limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+        """좌표 반경 내 진행 중 행사 (전체 건수, 가까운 순 목록, distance_km 포함)"""
+        _, events, spatial = self._snapshot()
+        day = to_day(on_date or datetime.now().date())
+        matched, distances = [], {}
+        for key, distance in spatial.within_radius(lat, lng, radius_km):
+            event = events[key]
+            if not event["_start_day"] <= day <= event["_end_day"]:
+                continue
+            if codename and event.get("CODENAME") != codename:
+                continue
+            matched.append(event)
+            distances[key] = distance
+
+        results = self._public(matched, limit)
+        for result, event in zip(results, matched):
+            result["latitude"], result["longitude"] = event["_lat"], event["_lng"]
+            result["distance_km"] = round(distances[event["_key"]], 3)
+        return len(matched), results
+
+    def active_events_around(self, district: Optional[str], lat: float, lng: float,
+                             radius_km: float, on_date: Optional[date] = None) -> List[Dict]:
+        """자치구 행사와 좌표 반경 내 행사를 합친 진행 중 후보 (distance_km는 좌표가 있을 때만)"""
+        index, events, spatial = self._snapshot()
+        day = to_day(on_date or datetime.now().date())
+        candidates = {event["_key"]: event for event in
+                      self._filter(index.active_on(day), events, district, None)} if district else {}
+        for key, _ in spatial.within_radius(lat, lng, radius_km):
+            event = events[key]
+            if event["_start_day"] <= day <= event["_end_day"]:
+                candidates[key] = event
+
+        results = []
+        for event in candidates.values():
+            result = self._public([event], None)[0]
+            if event["_lat"] is not None:
+                result["latitude"], result["longitude"] = event["_lat"], event["_lng"]
+                result["distance_km"] = round(haversine_km(lat, lng, event["_lat"], event["_lng"]), 3)
+            results.append(result)
+        return results
+
+
+_event_store: Optional[EventStore] = None
+_event_store_lock = threading.Lock()
+
+
+def get_event_store() -> EventStore:
+    """문화행사 저장소 싱글톤"""
+    global _event_store
+    with _event_store_lock:
+        if _event_store is None:
+            _event_store = EventStore()
+        return _event_store
@@ -0,0 +1,183 @@
+import os
+import time
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from app.api.services.event_service import CulturalEventManager
+from app.api.services.event_store import EventStore, get_event_store, make_event_key, is_seoul_coordinate
+from app.api.services.location_service import CityInfo
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 동기화 주기 (초)
+EVENT_SYNC_INTERVAL_SECONDS = int(os.getenv("EVENT_SYNC_INTERVAL_SECONDS", 6 * 3600))
+
+PAGE_SIZE = 1000          # 서울시 Open API 1회 최대 조회 건수
+MAX_PARALLEL_PAGES = 4    # 동시 요청 수 상한
+MAX_ATTEMPTS = 3          # 페이지별 최대 시도 횟수
+RETRY_BACKOFF_SECONDS = 1.0
+MAX_GEOCODE_PER_SYNC = 300  # 동기화 1회당 새로 지오코딩할 행사장 수 상한
+
+
+def _fetch_page(manager: CulturalEventManager, start: int) -> Tuple[Optional[dict], float, int]:
+    """private: 한 페이지 조회 (실패 시 지수 백오프 재시도) → (응답, 지연초, 시도 횟수)"""
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        started = time.perf_counter()
+        data = manager.fetch_event_page(start, start + PAGE_SIZE - 1)
+        latency = time.perf_counter() - started
+        if data and 'culturalEventInfo' in data:
+            return data['culturalEventInfo'], latency, attempt
+        logger.warning(f"문화행사 페이지 {start} 조회 실패 ({attempt}/{MAX_ATTEMPTS}회)")
+        if attempt < MAX_ATTEMPTS:
+            time.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+    return None, latency, MAX_ATTEMPTS
+
+
+def _latency_summary(latencies: List[float]) -> Dict:
+    """private: 페이지 지연 요약 (ms)"""
+    if not latencies:
+        return {"count": 0}
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1),
+        "total_ms": round(sum(ordered) * 1000, 1)
+    }
+
+
+def sync_cultural_events(api_key: str, store: Optional[EventStore] = None,
+                         max_workers: int = MAX_PARALLEL_PAGES) -> Dict:
+    """서울시 문화행사 API 전체 페이지 → 로컬 카탈로그 동기화
+
+    첫 페이지의 list_total_count로 전체 페이지 수를 구하고 나머지 페이지를
+    제한된 병렬도로 받아 행사 고유 키 기준으로 병합한 뒤,
+    내용 해시를 비교해 바뀐 행사만 카탈로그에 반영한다.
+    """
+    store = store or get_event_store()
+    manager = CulturalEventManager(api_key, event_store=store)
+    started = time.perf_counter()
+
+    first_page, latency, attempts = _fetch_page(manager, 1)
+    if first_page is None:
+        logger.error("문화행사 동기화 실패: 첫 페이지를 받지 못했습니다.")
+        return {'success': False, 'error': '첫 페이지 조회 실패'}
+
+    total_count = int(first_page.get('list_total_count', 0) or 0)
+    pages = {1: first_page.get('row', [])}
+    latencies = [latency]
+    retries = attempts - 1
+    failed_pages = []
+
+    remaining = list(range(PAGE_SIZE + 1, total_count + 1, PAGE_SIZE))
+    if remaining:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_fetch_page, manager, start): start for start in remaining}
+            for future in as_completed(futures):
+                start = futures[future]
+                page, latency, attempts = future.result()
+                latencies.append(latency)
+                retries += attempts - 1
+                if page is None:
+                    failed_pages.append(start)
+                else:
+                    pages[start] = page.get('row', [])
+
+    # 페이지 순서대로 병합 (같은 키가 여러 페이지에 있으면 뒤 페이지 값 사용)
+    events = {}
+    fetched = 0
+    for start in sorted(pages):
+        for event in pages[start]:
+            events[make_event_key(event)] = event
+            fetched += 1
+
+    # 내용이 바뀐 행사만 쓰고, 모든 페이지를 받은 경우에만 사라진 행사를 삭제 표시
+    changes = store.apply_sync(events, complete=not failed_pages and bool(events),
+                               total_count=total_count)
+    purged = store.purge_tombstones()
+
+    result = {
+        'success': not failed_pages,
+        'total_count': total_count,
+        'fetched_rows': fetched,
+        'unique_events': len(events),
+        **changes,
+        'purged': purged,
+        'failed_pages': sorted(failed_pages),
+        'retries': retries,
+        'page_latency': _latency_summary(latencies),
+        'duration_seconds': round(time.perf_counter() - started, 3)
+    }
+    logger.info(f"문화행사 동기화 완료: {result}")
+    return result
+
+
+def geocode_event_venues(store: Optional[EventStore] = None,
+                         limit: int = MAX_GEOCODE_PER_SYNC) -> Dict:
+    """좌표가 없는 행사장을 지오코딩 캐시를 거쳐 한 번만 좌표화
+
+    찾지 못했거나 서울 밖으로 나온 장소도 시도 시각을 남겨, 재시도 기간 동안
+    같은 장소가 매번 상한을 차지하지 않고 다음 장소로 넘어가게 한다.
+    """
+    store = store or get_event_store()
+    venues = store.venues_without_coordinates(limit)
+    located = []
+    for guname, place in venues:
+        query = f"{guname} {place}".strip()
+        coordinates = CityInfo.geocode(query)
+        if coordinates and is_seoul_coordinate(*coordinates):
+            located.append((guname, place, coordinates[0], coordinates[1]))
+
+    store.mark_geocode_attempted(venues)
+    updated = store.set_venue_coordinates(located)
+    result = {'venues': len(venues), 'located': len(located), 'events_updated': updated}
+    logger.info(f"행사장 지오코딩 완료: {result}")
+    return result
+
+
+class EventSyncWorker:
+    """백그라운드 문화행사 주기 동기화 (데몬 스레드)"""
+
+    def __init__(self, api_key: str, store: Optional[EventStore] = None,
+                 interval_seconds: int = EVENT_SYNC_INTERVAL_SECONDS):
+        self._api_key = api_key
+        self._store = store or get_event_store()
+        self._interval = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_result: Optional[Dict] = None
+
+    def start(self) -> None:
+        """동기화 스레드 시작 (시작 즉시 1회 실행)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="event-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """동기화 스레드 종료"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        """private: 주기 실행 루프"""
+        while not self._stop.is_set():
+            try:
+                self.last_result = sync_cultural_events(self._api_key, self._store)
+                self.last_result['geocoding'] = geocode_event_venues(self._store)
+            except Exception as e:
+                logger.error(f"문화행사 동기화 중 오류: {e}")
+                self.last_result = {'success': False, 'error': str(e)}
+            self._stop.wait(self._interval)
+
+
+if __name__ == "__main__":
+    # 수동 실행: python -m app.api.services.event_sync
+    from dotenv import load_dotenv
+    load_dotenv()
+    logger.info(sync_cultural_events(os.getenv("SEOUL_API_KEY")))
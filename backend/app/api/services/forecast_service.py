@@ -0,0 +1,142 @@
+import os
+import threading
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+import numpy as np
+from app.api.services.area_registry import AREA_INDEX, AREA_NAMES, get_level_code
+from app.api.services.congestion_db import DB_PATH
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 예측 행렬 저장 경로 (혼잡도 DB와 같은 디렉토리)
+FORECAST_PATH = os.path.join(os.path.dirname(DB_PATH), "forecast_matrix.npz")
+
+
+def _to_int(value) -> int:
+    """예측 인구 문자열 → 정수 (값이 없으면 0)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def build_forecast_matrix(area_results: List[Dict]) -> Dict[str, np.ndarray]:
+    """수집 결과 → 지역 × 예측시간 행렬
+
+    area_results는 collect_congestion_data의 반환값({"area", "data"} 리스트)
+    """
+    rows = [
+        (AREA_INDEX[item["area"]], item["data"].get("forecasts", []))
+        for item in area_results
+        if item["area"] in AREA_INDEX
+    ]
+    rows.sort(key=lambda row: row[0])
+
+    times = sorted({forecast.get("time") for _, forecasts in rows for forecast in forecasts
+                    if forecast.get("time") and forecast.get("time") != "정보 없음"})
+    time_index = {time: idx for idx, time in enumerate(times)}
+
+    shape = (len(rows), len(times))
+    levels = np.zeros(shape, dtype=np.uint8)
+    population_min = np.zeros(shape, dtype=np.int32)
+    population_max = np.zeros(shape, dtype=np.int32)
+
+    for row_idx, (_, forecasts) in enumerate(rows):
+        for forecast in forecasts:
+            col_idx = time_index.get(forecast.get("time"))
+            if col_idx is None:
+                continue
+            levels[row_idx, col_idx] = get_level_code(forecast.get("congestion_level"))
+            population_min[row_idx, col_idx] = _to_int(forecast.get("population_min"))
+            population_max[row_idx, col_idx] = _to_int(forecast.get("population_max"))
+
+    return {
+        "area_ids": np.asarray([area_id for area_id, _ in rows], dtype=np.uint16),
+        "times": np.asarray(times, dtype=str),
+        "levels": levels,
+        "population_min": population_min,
+        "population_max": population_max,
+        "generated_at": np.asarray(datetime.now().isoformat(timespec="seconds"))
+    }
+
+
+def save_forecast_matrix(matrix: Dict[str, np.ndarray], path: str = FORECAST_PATH) -> None:
+    """예측 행렬을 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(tmp_path, **matrix)
+        os.replace(tmp_path, path)
+        logger.info(f"예측 행렬 저장 완료: {matrix['levels'].shape}")
+    except OSError as e:
+        logger.error(f"예측 행렬 저장 오류: {e}")
+
+
+class ForecastMatrixStore:
+    """수집기가 저장한 예측 행렬을 읽어 캐싱 (파일이 바뀐 경우에만 다시 로드)"""
+
+    def __init__(self, path: str = FORECAST_PATH):
+        self._path = path
+        self._mtime: Optional[float] = None
+        self._matrix: Optional[Dict[str, np.ndarray]] = None
+        self._lock = threading.Lock()
+
+    def get_matrix(self) -> Optional[Dict[str, np.ndarray]]:
+        """최신 예측 행렬 (없으면 None)"""
+        with self._lock:
+            try:
+                mtime = os.path.getmtime(self._path)
+            except OSError:
+                return self._matrix
+
+            if mtime != self._mtime:
+                with np.load(self._path) as data:
+                    self._matrix = {key: data[key] for key in data.files}
+                self._mtime = mtime
+            return self._matrix
+
+    def get_payload(self) -> Optional[Dict]:
+        """JSON 응답용 압축 배열 형태 (행 우선 평탄화)"""
+        matrix = self.get_matrix()
+        if matrix is None:
+            return None
+
+        area_ids = matrix["area_ids"]
+        return {
+            "generated_at": str(matrix["generated_at"]),
+            "shape": list(matrix["levels"].shape),
+            "area_ids": area_ids.tolist(),
+            "areas": [AREA_NAMES[area_id] for area_id in area_ids],
+            "times": matrix["times"].tolist(),
+            "levels": matrix["levels"].ravel().tolist(),
+            "population_min": matrix["population_min"].ravel().tolist(),
+            "population_max": matrix["population_max"].ravel().tolist()
+        }
+
+    def get_arrays(self) -> Optional[Dict[str, np.ndarray]]:
+        """바이너리 응답용 배열 (시간축은 epoch 분)"""
+        matrix = self.get_matrix()
+        if matrix is None:
+            return None
+
+        return {
+            "area_ids": matrix["area_ids"],
+            "minutes": np.asarray(matrix["times"], dtype="datetime64[m]").astype(np.uint32),
+            "levels": matrix["levels"],
+            "population_min": matrix["population_min"],
+            "population_max": matrix["population_max"]
+        }
+
+
+_forecast_store: Optional[ForecastMatrixStore] = None
+
+
+def get_forecast_store() -> ForecastMatrixStore:
+    """예측 행렬 저장소 싱글톤"""
+    global _forecast_store
+    if _forecast_store is None:
+        _forecast_store = ForecastMatrixStore()
+    return _forecast_store
@@ -0,0 +1,158 @@
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+from app.api.services.area_registry import AREA_NAMES
+
+# 별칭/약칭 → 주요 지역명 (AREA_COORDINATES 키)
+AREA_ALIASES: Dict[str, str] = {
+    # 강남·서초
+    "강남": "강남역", "코엑스": "강남 MICE 관광특구", "삼성역": "강남 MICE 관광특구",
+    "고터": "고속터미널역", "압구정": "압구정로데오거리", "청담": "청담동 명품거리",
+    "신사동": "가로수길", "논현": "신논현역·논현역", "양재": "양재역",
+    "서래마을": "서리풀공원·몽마르뜨공원", "반포": "반포한강공원", "세빛섬": "반포한강공원",
+    # 송파·강동
+    "잠실": "잠실 관광특구", "롯데월드": "잠실 관광특구", "롯데타워": "잠실 관광특구",
+    "석촌호수": "잠실 관광특구", "잠실야구장": "잠실종합운동장", "암사동": "서울 암사동 유적",
+    # 마포·서대문
+    "홍대": "홍대 관광특구", "홍익대": "홍대 관광특구", "홍대입구": "홍대입구역(2호선)",
+    "연남": "연남동", "망원": "망원한강공원", "상암": "DMC(디지털미디어시티)",
+    "월드컵경기장": "월드컵공원", "하늘공원": "월드컵공원",
+    "신촌": "신촌·이대역", "이대": "신촌·이대역", "이화여대": "신촌·이대역",
+    # 종로·중구
+    "광화문": "광화문·덕수궁", "덕수궁": "광화문·덕수궁", "창덕궁": "창덕궁·종묘",
+    "종묘": "창덕궁·종묘", "종로": "종로·청계 관광특구", "청계천": "종로·청계 관광특구",
+    "북촌": "북촌한옥마을", "이화마을": "낙산공원·이화마을", "낙산공원": "낙산공원·이화마을",
+    "대학로": "혜화역", "명동": "명동 관광특구", "광장시장": "광장(전통)시장",
+    "남대문": "남대문시장", "서울시청": "서울광장", "시청": "서울광장", "시청광장": "서울광장",
+    "정동길": "덕수궁길·정동", "덕수궁길": "덕수궁길·정동", "덕수궁길·정동길": "덕수궁길·정동",
+    # 용산
+    "이태원": "이태원 관광특구", "경리단길": "해방촌·경리단길", "해방촌": "해방촌·경리단길",
+    "남산": "남산공원", "남산타워": "남산공원", "n서울타워": "남산공원",
+    "국립중앙박물관": "국립중앙박물관·용산가족공원", "용산가족공원": "국립중앙박물관·용산가족공원",
+    "앤틱가구거리": "이태원 앤틱가구거리",
+    # 동대문·성동·광진
+    "ddp": "DDP(동대문디자인플라자)", "동대문디자인플라자": "DDP(동대문디자인플라자)",
+    "동대문": "동대문 관광특구", "청량리": "청량리 제기동 일대 전통시장",
+    "경동시장": "청량리 제기동 일대 전통시장", "성수": "성수카페거리", "성수동": "성수카페거리",
+    "서울숲": "서울숲공원", "건대": "건대입구역", "건국대": "건대입구역", "왕십리": "왕십리역",
+    # 그 외
+    "여의도공원": "여의도", "더현대": "여의도", "타임스퀘어": "영등포 타임스퀘어",
+    "목동": "오목교역·목동운동장", "고척스카이돔": "고척돔", "서울대": "서울대입구역",
+    "샤로수길": "서울대입구역", "이수": "총신대입구(이수)역", "수유리": "수유리 먹자골목",
+    "북한산": "북한산우이역", "창동": "창동 신경제 중심지", "쌍문동": "쌍문동 맛집거리",
+    "외대": "외대앞", "성신여대": "성신여대입구역", "경희대": "회기역",
+}
+
+# 퍼지 매칭 최소 유사도 (경계 포함 문자 바이그램 Dice 계수)와 최소 공유 바이그램 수
+# 애매한 입력은 지역을 추측하지 않고 지오코더로 넘긴다 ('서울대공원' ≠ '서울숲공원')
+FUZZY_THRESHOLD = 0.8
+FUZZY_MIN_SHARED = 4
+# 접미사를 뗀 변형을 만들 최소 길이 ('서울역' → '서울'처럼 맨 지명이 되는 변형 방지)
+MIN_STEM_LENGTH = 3
+
+_STRIP_CHARS = re.compile(r"[\s·ㆍ•.,\-_/()\[\]]")
+_PARENTHESES = re.compile(r"\(.*?\)")
+_SUFFIXES = ("관광특구", "역")
+
+
+def normalize_name(text: str) -> str:
+    """지명 정규화: 유니코드 호환 정규화, 소문자, 공백·가운뎃점·괄호 제거"""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return _STRIP_CHARS.sub("", text)
+
+
+def _bigrams(text: str) -> Set[str]:
+    """문자 바이그램 집합 (앞뒤 경계 문자 포함: '강남' → ^강, 강남, 남$)"""
+    padded = f"^{text}$"
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+class Gazetteer:
+    """오프라인 지명 사전: 정확/별칭 일치 → 문자 바이그램 퍼지 매칭 순으로 지역 해석
+
+    퍼지 매칭은 거의 같은 긴 이름만 받아들이고, 그 밖의 입력은 None을 반환해
+    호출 측이 지오코더(카카오)로 넘기도록 한다.
+    """
+
+    def __init__(self, areas: Iterable[str], aliases: Dict[str, str],
+                 threshold: float = FUZZY_THRESHOLD, min_shared: int = FUZZY_MIN_SHARED):
+        self._threshold = threshold
+        self._min_shared = min_shared
+        # 정규화 형태 → 지역명 (정식 명칭이 별칭보다 우선)
+        self._forms: Dict[str, str] = {}
+        for area in areas:
+            for form in self._variants(area):
+                self._forms.setdefault(form, area)
+        for alias, area in aliases.items():
+            for form in self._variants(alias):
+                self._forms.setdefault(form, area)
+
+        # 바이그램 → 정규화 형태 역색인
+        self._gram_index: Dict[str, List[str]] = {}
+        self._form_grams: Dict[str, Set[str]] = {}
+        for form in self._forms:
+            grams = _bigrams(form)
+            self._form_grams[form] = grams
+            for gram in grams:
+                self._gram_index.setdefault(gram, []).append(form)
+
+    @staticmethod
+    def _variants(name: str) -> Set[str]:
+        """private: 이름의 정규화 변형 (괄호 내용 제거, '역'/'관광특구' 접미사 제거)"""
+        variants = {normalize_name(name), normalize_name(_PARENTHESES.sub("", name))}
+        for variant in list(variants):
+            for suffix in _SUFFIXES:
+                if variant.endswith(suffix) and len(variant) - len(suffix) >= MIN_STEM_LENGTH:
+                    variants.add(variant[:-len(suffix)])
+        variants.discard("")
+        return variants
+
+    @property
+    def aliases(self) -> Dict[str, str]:
+        """정규화 형태 → 지역명 전체"""
+        return dict(self._forms)
+
+    def resolve(self, query: str) -> Optional[Dict]:
+        """입력 문자열 → {'area', 'score', 'method'} (해석 불가 시 None)"""
+        variants = self._variants(query)
+        if not variants:
+            return None
+
+        for form in variants:
+            if form in self._forms:
+                return {"area": self._forms[form], "score": 1.0, "method": "exact"}
+
+        # 접미사를 뗀 가장 짧은 형태로 비교 ('부산역'이 '발산역'에 붙지 않도록)
+        normalized = min(variants, key=len)
+        query_grams = _bigrams(normalized)
+        shared: Dict[str, int] = {}
+        for gram in query_grams:
+            for form in self._gram_index.get(gram, ()):
+                shared[form] = shared.get(form, 0) + 1
+
+        best = None
+        for form, count in shared.items():
+            # 길이가 두 배 이상 차이 나면 다른 장소로 본다 ('서울역사박물관' ≠ '서울역')
+            if max(len(form), len(normalized)) > 2 * min(len(form), len(normalized)):
+                continue
+            if count < self._min_shared:
+                continue
+            score = 2 * count / (len(query_grams) + len(self._form_grams[form]))
+            if score >= self._threshold and (
+                best is None or (score, -abs(len(form) - len(normalized))) > best[0]
+            ):
+                best = ((score, -abs(len(form) - len(normalized))), form)
+
+        if best is None:
+            return None
+        return {"area": self._forms[best[1]], "score": round(best[0][0], 3), "method": "fuzzy"}
+
+
+# 모듈 로드 시 한 번 생성
+GAZETTEER = Gazetteer(AREA_NAMES, AREA_ALIASES)
+
+
+def resolve_area(query: str) -> Optional[str]:
+    """입력 문자열 → 주요 지역명 (네트워크 호출 없음)"""
+    match = GAZETTEER.resolve(query)
+    return match["area"] if match else None
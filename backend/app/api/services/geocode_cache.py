@@ -0,0 +1,175 @@
+import os
+import re
+import time
+import sqlite3
+import threading
+import unicodedata
+import logging
+from collections import OrderedDict
+from typing import Optional, Tuple
+from app.api.services.congestion_db import DB_PATH
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 지오코딩 캐시 DB 경로 (혼잡도 DB와 같은 디렉토리)
+GEOCODE_DB_PATH = os.path.join(os.path.dirname(DB_PATH), "geocode_cache.sqlite")
+
+POSITIVE_TTL_SECONDS = 30 * 24 * 3600  # 좌표 결과 유지 기간
+NEGATIVE_TTL_SECONDS = 24 * 3600       # '결과 없음' 유지 기간
+MAX_MEMORY_ENTRIES = 4096
+
+Coordinates = Tuple[float, float]
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키 정규화: 유니코드 호환 정규화, 소문자, 연속 공백 정리"""
+    query = unicodedata.normalize("NFKC", query or "")
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+class GeocodeCache:
+    """2단계 지오코딩 캐시 (메모리 LRU → SQLite)
+
+    값이 None인 항목은 '결과 없음' 응답을 저장한 음성 캐시이다.
+    """
+
+    def __init__(self, db_path: str = GEOCODE_DB_PATH, max_entries: int = MAX_MEMORY_ENTRIES):
+        self._db_path = db_path
+        self._max_entries = max_entries
+        # 정규화 키 → (만료 시각, 좌표 또는 None)
+        self._memory: "OrderedDict[str, Tuple[float, Optional[Coordinates]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """private: 캐시 테이블 생성"""
+        try:
+            os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+            conn = sqlite3.connect(self._db_path)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS geocode_cache (
+                    query TEXT PRIMARY KEY,
+                    latitude REAL,
+                    longitude REAL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+            conn.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"지오코딩 캐시 DB 초기화 오류: {e}")
+
+    def _remember(self, key: str, expires_at: float, coordinates: Optional[Coordinates]) -> None:
+        """private: 메모리 LRU에 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        with self._lock:
+            self._memory[key] = (expires_at, coordinates)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, query: str) -> Tuple[bool, Optional[Coordinates]]:
+        """(캐시 적중 여부, 좌표) 조회. 음성 캐시는 (True, None)"""
+        key = normalize_query(query)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and entry[0] > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry:
+                del self._memory[key]
+
+        try:
+            conn = sqlite3.connect(self._db_path)
+            row = conn.execute(
+                "SELECT latitude, longitude, expires_at FROM geocode_cache WHERE query = ?",
+                (key,)
+            ).fetchone()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"지오코딩 캐시 조회 오류: {e}")
+            row = None
+
+        if row and row[2] > now:
+            coordinates = (row[0], row[1]) if row[0] is not None else None
+            self._remember(key, row[2], coordinates)
+            with self._lock:
+                self.hits += 1
+            return True, coordinates
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, query: str, coordinates: Optional[Coordinates]) -> None:
+        """조회 결과 저장 (None이면 음성 캐시)"""
+        key = normalize_query(query)
+        ttl = POSITIVE_TTL_SECONDS if coordinates else NEGATIVE_TTL_SECONDS
+        expires_at = time.time() + ttl
+        self._remember(key, expires_at, coordinates)
+
+        lat, lng = coordinates if coordinates else (None, None)
+        try:
+            conn = sqlite3.connect(self._db_path)
+            conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache (query, latitude, longitude, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, lat, lng, expires_at)
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"지오코딩 캐시 저장 오류: {e}")
+
+    def warm_up(self) -> int:
+        """만료되지 않은 캐시를 메모리로 미리 적재하고 만료 항목은 정리"""
+        now = time.time()
+        try:
+            conn = sqlite3.connect(self._db_path)
+            conn.execute("DELETE FROM geocode_cache WHERE expires_at <= ?", (now,))
+            conn.commit()
+            rows = conn.execute(
+                "SELECT query, latitude, longitude, expires_at FROM geocode_cache "
+                "ORDER BY expires_at DESC LIMIT ?",
+                (self._max_entries,)
+            ).fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"지오코딩 캐시 적재 오류: {e}")
+            return 0
+
+        # 만료가 늦은(최근 저장된) 항목이 LRU 뒤쪽에 오도록 역순으로 적재
+        for query, lat, lng, expires_at in reversed(rows):
+            self._remember(query, expires_at, (lat, lng) if lat is not None else None)
+        logger.info(f"지오코딩 캐시 적재: {len(rows)}건")
+        return len(rows)
+
+    def stats(self) -> dict:
+        """캐시 적중률"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._memory),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0
+            }
+
+
+_geocode_cache: Optional[GeocodeCache] = None
+_geocode_cache_lock = threading.Lock()
+
+
+def get_geocode_cache() -> GeocodeCache:
+    """지오코딩 캐시 싱글톤"""
+    global _geocode_cache
+    with _geocode_cache_lock:
+        if _geocode_cache is None:
+            _geocode_cache = GeocodeCache()
+        return _geocode_cache
@@ -10,8 +10,8 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 logger = logging.getLogger(__name__)
 
 class HeatmapService:
-    def __init__(self):
-        self._city_data = SeoulCityData()
+    def __init__(self, city_data: Optional[SeoulCityData] = None):
+        self._city_data = city_data or SeoulCityData()
         self._coordinates = CityInfo.AREA_COORDINATES
         
     def get_congestion_data(self) -> dict:
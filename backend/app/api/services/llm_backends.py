@@ -0,0 +1,204 @@
+import os
+import re
+import math
+import time
+import random
+import hashlib
+import threading
+import logging
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional
+import google.generativeai as genai
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+GEMINI_MODEL_NAME = 'gemini-1.5-flash'
+
+# 스텁 백엔드 기본값 (부하 테스트 시 환경 변수로 조정)
+STUB_LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+STUB_STREAM_CHUNK_CHARS = 24
+
+
+class LLMBackendError(Exception):
+    """LLM 백엔드 호출 실패"""
+
+
+class LLMBackend(ABC):
+    """LLM 백엔드 인터페이스: 프롬프트 → 응답 텍스트 / 응답 조각"""
+
+    name = "base"
+
+    @abstractmethod
+    def generate(self, prompt: str, timeout: Optional[float] = None) -> str:
+        """응답 전체 텍스트"""
+
+    def stream(self, prompt: str, timeout: Optional[float] = None) -> Iterator[str]:
+        """응답 조각 (기본 구현은 전체 응답을 한 조각으로 반환)"""
+        yield self.generate(prompt, timeout)
+
+
+class GeminiBackend(LLMBackend):
+    """Google Gemini 백엔드 (API 키는 genai.configure로 미리 설정)"""
+
+    name = "gemini"
+
+    def __init__(self, model_name: str = GEMINI_MODEL_NAME):
+        self._model = genai.GenerativeModel(model_name)
+
+    @staticmethod
+    def _request_options(timeout: Optional[float]) -> dict:
+        """private: 호출 제한 시간 옵션"""
+        return {"timeout": timeout} if timeout is not None else {}
+
+    def generate(self, prompt: str, timeout: Optional[float] = None) -> str:
+        response = self._model.generate_content(prompt, request_options=self._request_options(timeout))
+        return response.text
+
+    def stream(self, prompt: str, timeout: Optional[float] = None) -> Iterator[str]:
+        for chunk in self._model.generate_content(prompt, stream=True,
+                                                  request_options=self._request_options(timeout)):
+            yield chunk.text
+
+
+class StubLLMBackend(LLMBackend):
+    """오프라인 부하 테스트용 스텁 백엔드
+
+    응답 본문은 프롬프트에서 결정적으로 만들어진다 (같은 프롬프트 → 같은 응답).
+    지연 시간과 실패는 seed로 재현 가능한 난수로 주입한다.
+    - latency: fixed(median) / uniform(median ± spread×median) / normal(σ = spread×median) /
+      lognormal(중앙값 median, σ = spread)
+    """
+
+    name = "stub"
+
+    def __init__(self, latency_ms: float = 800.0, distribution: str = "lognormal",
+                 spread: float = 0.5, failure_rate: float = 0.0, seed: Optional[int] = None):
+        if distribution not in STUB_LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 분포: {distribution}")
+        self._latency_ms = max(0.0, latency_ms)
+        self._distribution = distribution
+        self._spread = max(0.0, spread)
+        self._failure_rate = min(1.0, max(0.0, failure_rate))
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _sample_latency(self) -> float:
+        """private: 지연 시간 표본 (초)"""
+        median = self._latency_ms
+        with self._lock:
+            if self._distribution == "fixed":
+                value = median
+            elif self._distribution == "uniform":
+                value = self._random.uniform(median * (1 - self._spread), median * (1 + self._spread))
+            elif self._distribution == "normal":
+                value = self._random.gauss(median, median * self._spread)
+            else:
+                value = median * math.exp(self._random.gauss(0.0, self._spread))
+        return max(0.0, value) / 1000.0
+
+    def _should_fail(self) -> bool:
+        """private: 실패 주입 여부"""
+        with self._lock:
+            return self._random.random() < self._failure_rate
+
+    def _wait(self, seconds: float, timeout: Optional[float]) -> None:
+        """private: 지연 흉내 (제한 시간을 넘기면 실제 API처럼 시간 초과 오류)"""
+        if timeout is not None and seconds > timeout:
+            time.sleep(timeout)
+            raise LLMBackendError("스텁 LLM 응답 시간 초과")
+        time.sleep(seconds)
+
+    def generate(self, prompt: str, timeout: Optional[float] = None) -> str:
+        self._wait(self._sample_latency(), timeout)
+        if self._should_fail():
+            raise LLMBackendError("스텁 LLM 실패 주입")
+        return render_stub_response(prompt)
+
+    def stream(self, prompt: str, timeout: Optional[float] = None) -> Iterator[str]:
+        # 전체 지연의 1/3을 첫 조각까지, 나머지를 조각마다 나눠 기다림
+        latency = self._sample_latency()
+        text = render_stub_response(prompt)
+        chunks = [text[i:i + STUB_STREAM_CHUNK_CHARS] for i in range(0, len(text), STUB_STREAM_CHUNK_CHARS)]
+        if timeout is not None and latency > timeout:
+            # generate와 같이 전체 응답이 제한 시간을 넘으면 시간 초과 (첫 조각 전까지만 보지 않음)
+            self._wait(latency, timeout)
+        self._wait(latency / 3, timeout)
+        if self._should_fail():
+            raise LLMBackendError("스텁 LLM 실패 주입")
+        step = (latency * 2 / 3) / max(1, len(chunks))
+        for chunk in chunks:
+            yield chunk
+            time.sleep(step)
+
+
+def _pick(options: List[str], prompt: str) -> str:
+    """private: 프롬프트 해시로 고정된 선택"""
+    digest = int(hashlib.md5(prompt.encode("utf-8")).hexdigest(), 16)
+    return options[digest % len(options)]
+
+
+def _field(prompt: str, label: str, default: str) -> str:
+    """private: 프롬프트의 '라벨: 값' 줄에서 값 추출"""
+    match = re.search(rf"{re.escape(label)}:\s*(.+)", prompt)
+    return match.group(1).strip() if match else default
+
+
+def render_stub_response(prompt: str) -> str:
+    """프롬프트 종류별 템플릿 응답 (상황 분석은 _parse_agent_response가 읽는 '### 섹션' 형식)"""
+    if "[현재 상황 평가]" in prompt:
+        area = _field(prompt, "분석 지역", "해당 지역")
+        congestion = _field(prompt, "인구 혼잡도", "정보 없음")
+        transportation = _field(prompt, "이동수단", "도보")
+        return (
+            f"### 현재 상황 평가\n"
+            f"- {area}의 인구 혼잡도는 '{congestion}' 수준입니다.\n"
+            f"- {_pick(['전시·공연 관람', '산책과 카페', '전통시장 탐방'], prompt)} 위주의 활동을 추천합니다.\n\n"
+            f"### 최적의 방문 시간대\n"
+            f"- {_pick(['오전 10시~12시', '오후 2시~4시', '저녁 7시 이후'], prompt)}가 비교적 한적합니다.\n"
+            f"- 권장 체류 시간은 약 {_pick(['1시간', '2시간', '3시간'], prompt)}입니다.\n\n"
+            f"### 추천 동선\n"
+            f"- {area} 주요 출입구에서 시작해 핵심 관람 지점을 거쳐 휴식 공간으로 이동하세요.\n"
+            f"- {transportation} 기준 예상 소요 시간은 약 {_pick(['40분', '1시간', '1시간 30분'], prompt)}입니다.\n\n"
+            f"### 방문객 안내사항\n"
+            f"1. 편의시설 정보: 화장실과 휴식 공간은 안내 지도를 확인하세요.\n"
+            f"2. 안전/편의 정보: 혼잡 시간대에는 안전요원 안내를 따라주세요.\n"
+            f"3. 기타 유용한 정보: 주차 공간이 부족할 수 있으니 대중교통을 권장합니다."
+        )
+    if "다음 문화 행사들 중에서" in prompt:
+        titles = re.findall(r"행사:\s*(.+)", prompt)
+        title = titles[0].strip() if titles else "추천 행사"
+        return (
+            f"1. {title}: 사용자의 연령대와 이동수단을 고려할 때 가장 접근성이 좋은 행사입니다.\n"
+            f"2. 자녀 동반 여부와 관람 시간을 함께 고려해 여유 있게 방문하세요."
+        )
+    if "[대체장소명]: [이유]" in prompt:
+        candidates = re.findall(r"^\s*-\s*(.+?)\s*\(", prompt, flags=re.MULTILINE)
+        if not candidates:
+            listed = re.search(r"주요 관광지/상권 목록입니다:\s*\n\s*(.+)", prompt)
+            candidates = [name.strip() for name in listed.group(1).split(",")] if listed else ["인근 지역"]
+        return f"{candidates[0]}: 가까우면서 비슷한 성격의 장소로, 현재 비교적 덜 붐빕니다."
+    return (
+        f"{_pick(['가까운 미술관 전시', '야외 공연', '문화센터 체험 프로그램'], prompt)}을(를) 추천합니다. "
+        f"이동수단과 자녀 동반 여부를 고려해 혼잡하지 않은 시간대에 방문해 보세요."
+    )
+
+
+def create_llm_backend(kind: Optional[str] = None) -> LLMBackend:
+    """환경 변수(LLM_BACKEND=gemini|stub)에 따라 백엔드 생성"""
+    kind = (kind or os.getenv("LLM_BACKEND", "gemini")).lower()
+    if kind == "stub":
+        seed = os.getenv("LLM_STUB_SEED")
+        backend = StubLLMBackend(
+            latency_ms=float(os.getenv("LLM_STUB_LATENCY_MS", 800)),
+            distribution=os.getenv("LLM_STUB_LATENCY_DIST", "lognormal"),
+            spread=float(os.getenv("LLM_STUB_LATENCY_SPREAD", 0.5)),
+            failure_rate=float(os.getenv("LLM_STUB_FAILURE_RATE", 0)),
+            seed=int(seed) if seed else None
+        )
+        logger.info("스텁 LLM 백엔드 사용 (오프라인 부하 테스트 모드)")
+        return backend
+    if kind != "gemini":
+        raise ValueError(f"지원하지 않는 LLM 백엔드: {kind}")
+    return GeminiBackend()
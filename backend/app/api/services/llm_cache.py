@@ -0,0 +1,195 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from app.api.services.congestion_db import DB_PATH
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# LLM 응답 캐시 DB 경로 (혼잡도 DB와 같은 디렉토리, LLM_CACHE_PERSIST=0이면 메모리만 사용)
+LLM_CACHE_DB_PATH = os.path.join(os.path.dirname(DB_PATH), "llm_cache.sqlite")
+
+# 실시간 데이터 갱신 주기와 맞춘 스냅샷 구간 (같은 구간 안의 같은 입력만 캐시 적중)
+SNAPSHOT_WINDOW_SECONDS = int(os.getenv("LLM_CACHE_WINDOW_SECONDS", 600))
+TTL_SECONDS = SNAPSHOT_WINDOW_SECONDS
+MAX_MEMORY_ENTRIES = 2048
+
+
+def snapshot_version(now: Optional[float] = None) -> str:
+    """현재 데이터 스냅샷 구간 번호"""
+    return str(int((now if now is not None else time.time()) // SNAPSHOT_WINDOW_SECONDS))
+
+
+def _normalize(value: Any) -> Any:
+    """private: 캐시 키용 입력 정규화 (유니코드 호환 정규화, 연속 공백 정리)"""
+    if isinstance(value, str):
+        return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", value)).strip()
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def make_cache_key(namespace: str, inputs: Dict[str, Any], version: Optional[str] = None) -> str:
+    """(용도, 프롬프트 입력, 스냅샷 버전) → 캐시 키"""
+    payload = json.dumps(
+        {"ns": namespace, "v": version or snapshot_version(), "in": _normalize(inputs)},
+        ensure_ascii=False, sort_keys=True, default=str
+    )
+    return f"{namespace}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class LLMResponseCache:
+    """LLM 응답 캐시 (메모리 LRU → 선택적 SQLite)
+
+    값은 JSON으로 직렬화 가능한 응답(문자열 또는 파싱된 dict)이다.
+    """
+
+    def __init__(self, db_path: Optional[str] = LLM_CACHE_DB_PATH,
+                 max_entries: int = MAX_MEMORY_ENTRIES, ttl_seconds: int = TTL_SECONDS):
+        self._db_path = db_path
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        # 캐시 키 → (만료 시각, 응답)
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self._db_path:
+            self._init_db()
+
+    def _init_db(self) -> None:
+        """private: 캐시 테이블 생성 (실패 시 메모리 캐시만 사용)"""
+        try:
+            os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+            conn = sqlite3.connect(self._db_path)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+            conn.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"LLM 캐시 DB 초기화 오류: {e}")
+            self._db_path = None
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        """private: 메모리 LRU에 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._max_entries:
+                self._memory.popitem(last=False)
+                self.evictions += 1
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(적중 여부, 응답)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and entry[0] > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry:
+                del self._memory[key]
+
+        row = None
+        if self._db_path:
+            try:
+                conn = sqlite3.connect(self._db_path)
+                row = conn.execute(
+                    "SELECT response, expires_at FROM llm_cache WHERE cache_key = ?", (key,)
+                ).fetchone()
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"LLM 캐시 조회 오류: {e}")
+
+        if row and row[1] > now:
+            value = json.loads(row[0])
+            self._remember(key, row[1], value)
+            with self._lock:
+                self.hits += 1
+            return True, value
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, key: str, value: Any) -> None:
+        """응답 저장"""
+        expires_at = time.time() + self._ttl
+        self._remember(key, expires_at, value)
+        if not self._db_path:
+            return
+        try:
+            conn = sqlite3.connect(self._db_path)
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (cache_key, response, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), expires_at)
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"LLM 캐시 저장 오류: {e}")
+
+    def purge_expired(self) -> int:
+        """만료된 항목 정리"""
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._memory.items() if expires_at <= now]
+            for key in expired:
+                del self._memory[key]
+        if not self._db_path:
+            return len(expired)
+        try:
+            conn = sqlite3.connect(self._db_path)
+            deleted = conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+            conn.commit()
+            conn.close()
+            return max(len(expired), deleted)
+        except sqlite3.Error as e:
+            logger.error(f"LLM 캐시 정리 오류: {e}")
+            return len(expired)
+
+    def stats(self) -> Dict:
+        """캐시 적중률"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._memory),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "persistent": bool(self._db_path),
+                "snapshot_version": snapshot_version()
+            }
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """LLM 응답 캐시 싱글톤"""
+    global _llm_cache
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            persist = os.getenv("LLM_CACHE_PERSIST", "1") != "0"
+            _llm_cache = LLMResponseCache(LLM_CACHE_DB_PATH if persist else None)
+        return _llm_cache
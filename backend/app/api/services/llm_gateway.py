@@ -0,0 +1,227 @@
+import os
+import time
+import heapq
+import itertools
+import threading
+import contextvars
+import logging
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+from app.api.services.llm_backends import LLMBackend, create_llm_backend
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 우선순위 (값이 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0  # 사용자 채팅/추천 요청
+PRIORITY_BATCH = 1        # 미리 계산해 두는 배치 작업
+
+MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 4))
+REQUESTS_PER_SECOND = float(os.getenv("LLM_QPS", 5))
+TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", 250000))
+CALL_TIMEOUT_SECONDS = float(os.getenv("LLM_CALL_TIMEOUT_SECONDS", 25))  # 대기 + 호출 전체 제한 시간
+WAIT_SAMPLE_SIZE = 500
+
+_current_priority = contextvars.ContextVar("llm_priority", default=PRIORITY_INTERACTIVE)
+
+
+class LLMGatewayError(Exception):
+    """LLM 게이트웨이 오류"""
+
+
+class LLMDeadlineExceeded(LLMGatewayError):
+    """대기열/속도 제한 대기 중 제한 시간 초과"""
+
+
+@contextmanager
+def llm_priority(priority: int):
+    """이 블록 안의 LLM 호출 우선순위 지정 (예: 배치 사전 계산은 PRIORITY_BATCH)
+
+    추천 파이프라인 단계는 호출 컨텍스트를 복사해 실행하므로 단계 스레드에도 적용된다.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 추정 (한국어 기준 약 2자당 1토큰)"""
+    return len(text) // 2 + 1
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한 (예약 방식: 필요한 만큼 미리 차감하고 기다릴 시간을 반환)"""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        self._rate = rate_per_second
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """amount만큼 예약하고 사용 가능해질 때까지 기다릴 시간(초) 반환"""
+        if self._rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= min(amount, self._capacity)
+            return max(0.0, -self._tokens / self._rate)
+
+    def refund(self, amount: float) -> None:
+        """사용하지 못한 예약 반환"""
+        if self._rate <= 0:
+            return
+        with self._lock:
+            self._tokens = min(self._capacity, self._tokens + min(amount, self._capacity))
+
+
+class LLMGateway:
+    """LLM 호출 관문: 동시 호출 수 제한, QPS/토큰 속도 제한, 우선순위 대기열, 호출별 제한 시간
+
+    대화형 요청이 배치 작업보다 먼저 슬롯을 얻고, 같은 우선순위는 도착 순서대로 처리한다.
+    """
+
+    def __init__(self, backend: Optional[LLMBackend] = None,
+                 max_concurrency: int = MAX_CONCURRENCY,
+                 requests_per_second: float = REQUESTS_PER_SECOND,
+                 tokens_per_minute: float = TOKENS_PER_MINUTE,
+                 call_timeout: float = CALL_TIMEOUT_SECONDS):
+        # 실제 호출 대상 (LLM_BACKEND=stub이면 오프라인 스텁)
+        self._backend = backend or create_llm_backend()
+        self._max_concurrency = max(1, max_concurrency)
+        self._call_timeout = call_timeout
+        self._request_bucket = TokenBucket(requests_per_second, max(1.0, requests_per_second))
+        self._token_bucket = TokenBucket(tokens_per_minute / 60.0, tokens_per_minute / 6.0)
+
+        self._cond = threading.Condition()
+        self._waiting: List[Tuple[int, int]] = []  # (우선순위, 도착 순번) 힙
+        self._sequence = itertools.count()
+        self._active = 0
+
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+        self._counts = {"completed": 0, "failed": 0, "deadline_exceeded": 0}
+        self._by_priority: Dict[int, int] = {}
+
+    def _acquire(self, priority: int, deadline: float) -> None:
+        """private: 우선순위 순으로 동시 호출 슬롯 획득"""
+        ticket = (priority, next(self._sequence))
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while self._active >= self._max_concurrency or self._waiting[0] != ticket:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise LLMDeadlineExceeded("LLM 대기열에서 제한 시간을 초과했습니다.")
+                    self._cond.wait(remaining)
+            except LLMDeadlineExceeded:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._counts["deadline_exceeded"] += 1
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._active += 1
+            self._by_priority[priority] = self._by_priority.get(priority, 0) + 1
+            # 남은 슬롯이 있으면 다음 순서가 바로 들어올 수 있도록 깨움
+            self._cond.notify_all()
+
+    @staticmethod
+    def _wait_for(bucket: TokenBucket, amount: float, deadline: float) -> None:
+        """private: 버킷 예약 후 대기 (제한 시간 안에 차례가 오지 않으면 예약 반환 후 예외)"""
+        delay = bucket.reserve(amount)
+        if time.monotonic() + delay > deadline:
+            bucket.refund(amount)
+            raise LLMDeadlineExceeded("LLM 호출 속도 제한 대기 중 제한 시간을 초과했습니다.")
+        if delay:
+            time.sleep(delay)
+
+    def _release(self, failed: bool) -> None:
+        """private: 슬롯 반환"""
+        with self._cond:
+            self._active -= 1
+            self._counts["failed" if failed else "completed"] += 1
+            self._cond.notify_all()
+
+    def _admit(self, prompt: str, timeout: Optional[float], priority: Optional[int]) -> float:
+        """private: 슬롯 획득 → QPS/토큰 속도 제한 통과 후 남은 제한 시간(초) 반환"""
+        started = time.monotonic()
+        deadline = started + (timeout if timeout is not None else self._call_timeout)
+        self._acquire(priority if priority is not None else _current_priority.get(), deadline)
+        try:
+            self._wait_for(self._request_bucket, 1, deadline)
+            self._wait_for(self._token_bucket, estimate_tokens(prompt), deadline)
+        except LLMDeadlineExceeded:
+            with self._cond:
+                self._active -= 1
+                self._counts["deadline_exceeded"] += 1
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._waits.append(time.monotonic() - started)
+        return max(0.1, deadline - time.monotonic())
+
+    def generate(self, prompt: str, timeout: Optional[float] = None, priority: Optional[int] = None) -> str:
+        """응답 전체 텍스트 (제한 시간은 대기열 대기 + 호출 전체, priority 생략 시 llm_priority 블록 값)"""
+        remaining = self._admit(prompt, timeout, priority)
+        failed = True
+        try:
+            text = self._backend.generate(prompt, timeout=remaining)
+            failed = False
+            return text
+        finally:
+            self._release(failed)
+
+    def stream(self, prompt: str, timeout: Optional[float] = None, priority: Optional[int] = None) -> Iterator[str]:
+        """응답 조각 스트리밍 (마지막 조각을 받을 때까지 슬롯 점유)"""
+        remaining = self._admit(prompt, timeout, priority)
+        failed = True
+        try:
+            for text in self._backend.stream(prompt, timeout=remaining):
+                yield text
+            failed = False
+        finally:
+            self._release(failed)
+
+    def stats(self) -> Dict:
+        """대기열 길이, 대기 시간, 처리 건수"""
+        with self._cond:
+            waits = sorted(self._waits)
+            return {
+                "backend": self._backend.name,
+                "queue_depth": len(self._waiting),
+                "queue_depth_by_priority": {
+                    "interactive": sum(1 for priority, _ in self._waiting if priority == PRIORITY_INTERACTIVE),
+                    "batch": sum(1 for priority, _ in self._waiting if priority != PRIORITY_INTERACTIVE)
+                },
+                "active": self._active,
+                "max_concurrency": self._max_concurrency,
+                "wait_ms": {
+                    "p50": round(waits[len(waits) // 2] * 1000, 1) if waits else 0.0,
+                    "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+                    "max": round(waits[-1] * 1000, 1) if waits else 0.0
+                },
+                "admitted": {"interactive": self._by_priority.get(PRIORITY_INTERACTIVE, 0),
+                             "batch": sum(count for priority, count in self._by_priority.items()
+                                          if priority != PRIORITY_INTERACTIVE)},
+                **self._counts
+            }
+
+
+_llm_gateway: Optional[LLMGateway] = None
+_llm_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """LLM 게이트웨이 싱글톤 (모든 LLM 호출이 같은 한도를 공유)"""
+    global _llm_gateway
+    with _llm_gateway_lock:
+        if _llm_gateway is None:
+            _llm_gateway = LLMGateway()
+        return _llm_gateway
@@ -1,26 +1,73 @@
 import os
 import google.generativeai as genai
 import logging
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from app.api.services.llm_cache import LLMResponseCache, make_cache_key
+from app.api.services.single_flight import get_single_flight
+from app.api.services.llm_gateway import LLMGateway, get_llm_gateway
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+LLM_ERROR_MESSAGE = "AI 응답을 생성하는 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요."
+
+
 class LLMService:
-    def __init__(self):
+    def __init__(self, cache: Optional[LLMResponseCache] = None, gateway: Optional[LLMGateway] = None):
         self._api_key = os.getenv("GEMINI_API_KEY")
         genai.configure(api_key=self._api_key)
-        self._model = genai.GenerativeModel('gemini-1.5-flash')
+        # 모든 호출은 게이트웨이의 동시 호출/속도 제한을 거침
+        self._gateway = gateway or get_llm_gateway()
+        self._cache = cache
 
     def ask_llm(self, question: str) -> str:
         """LLM API 호출"""
         try:
-            response = self._model.generate_content(question)
-            return response.text
+            return self._gateway.generate(question)
         except Exception as e:
             logger.error(f"API 호출 중 오류 발생: {str(e)}")
-            return f"AI 응답을 생성하는 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요."
+            return LLM_ERROR_MESSAGE
+
+    def _ask_cached(self, namespace: str, inputs: Dict[str, Any], prompt: str) -> str:
+        """private: 같은 스냅샷 구간의 같은 입력이면 캐시된 응답 사용, 동시 요청은 호출 하나로 합침"""
+        key = make_cache_key(namespace, inputs)
+        if self._cache is not None:
+            hit, cached = self._cache.get(key)
+            if hit:
+                return cached
+        return get_single_flight("llm").do(key, self._ask_and_store, key, prompt)
+
+    def _ask_and_store(self, key: str, prompt: str) -> str:
+        """private: LLM 호출 후 캐시에 저장 (오류 응답은 캐시하지 않음)"""
+        answer = self.ask_llm(prompt)
+        if self._cache is not None and answer != LLM_ERROR_MESSAGE:
+            self._cache.put(key, answer)
+        return answer
+
+    def _stream_cached(self, namespace: str, inputs: Dict[str, Any], prompt: str) -> Iterator[Tuple[str, str]]:
+        """private: 스트리밍 호출 ('token', 본문 조각) / ('error', 메시지)
+
+        캐시 적중 시 저장된 응답을 한 조각으로 반환한다. 도중에 실패하면 그때까지 보낸 조각과
+        관계없이 오류를 알리고, 잘린 응답은 캐시하지 않는다.
+        """
+        key = make_cache_key(namespace, inputs)
+        if self._cache is not None:
+            hit, cached = self._cache.get(key)
+            if hit:
+                yield 'token', cached
+                return
+        chunks = []
+        try:
+            for text in self._gateway.stream(prompt):
+                chunks.append(text)
+                yield 'token', text
+        except Exception as e:
+            logger.error(f"스트리밍 API 호출 중 오류 발생 ({len(chunks)}개 조각 전송 후): {str(e)}")
+            yield 'error', LLM_ERROR_MESSAGE
+            return
+        if self._cache is not None:
+            self._cache.put(key, "".join(chunks))
 
     def get_congestion_recommendation(self, area: str, congestion: str, forecast: dict, traffic_status: dict) -> str:
         """혼잡도 관련 추천사항 생성"""
@@ -55,7 +102,10 @@ class LLMService:
         위 상황들을 종합적으로 고려하여 방문객들이 더 나은 경험을 할 수 있도록
         가장 효율적인 3가지 구체적인 대안을 추천해주세요.
         """
-        return self.ask_llm(prompt)
+        return self._ask_cached("congestion", {
+            "area": area, "congestion": congestion, "walking": walking_condition,
+            "traffic": traffic_condition, "speed": traffic_speed
+        }, prompt)
 
     def get_alternative_place(self, area: str, valid_areas: list) -> str:
         """대체 장소 추천"""
@@ -68,11 +118,49 @@ class LLMService:
         다음 형식으로 답변해주세요:
         [대체장소명]: [이유]
         """
-        return self.ask_llm(prompt)
-        
+        return self._ask_cached("alternative", {"area": area, "valid_areas": list(valid_areas)}, prompt)
+
+    def phrase_alternative_place(self, area: str, alternatives: List[Dict[str, Any]]) -> str:
+        """엔진이 고른 대체 장소 후보를 자연스러운 문장으로 다듬기 (후보 밖 장소 추천 금지)"""
+        candidates = "\n".join(
+            f"- {alt['area']} ({alt['category']}, {alt['distance_km']}km, 혼잡도 {alt['congestion_level']})"
+            for alt in alternatives
+        )
+        prompt = f"""
+        현재 {area}이(가) 붐비는 상황입니다.
+        아래 후보 중 첫 번째 장소를 대체 장소로 안내하는 문장을 작성해주세요.
+        후보 목록에 없는 장소는 언급하지 마세요.
+        {candidates}
+        다음 형식으로 답변해주세요:
+        [대체장소명]: [이유]
+        """
+        return self._ask_cached("alternative_phrase", {"area": area, "candidates": candidates}, prompt)
+
+
     def get_personalized_recommendation(self, user_preferences: Dict[str, str], prompt: str) -> str:
         """사용자 맞춤형 추천 생성"""
-        context = f"""
+        return self._ask_cached("personalized", self._personalized_inputs(user_preferences, prompt),
+                                self._personalized_prompt(user_preferences, prompt))
+
+    def stream_personalized_recommendation(self, user_preferences: Dict[str, str],
+                                           prompt: str) -> Iterator[Tuple[str, str]]:
+        """사용자 맞춤형 추천 스트리밍: ('token', 본문 조각) / ('error', 메시지)"""
+        return self._stream_cached("personalized", self._personalized_inputs(user_preferences, prompt),
+                                   self._personalized_prompt(user_preferences, prompt))
+
+    @staticmethod
+    def _personalized_inputs(user_preferences: Dict[str, str], prompt: str) -> Dict[str, Any]:
+        """private: 맞춤형 추천 캐시 키 입력"""
+        return {
+            "preferences": {key: user_preferences.get(key) for key in
+                            ('gender', 'age_group', 'has_children', 'transportation')},
+            "prompt": prompt
+        }
+
+    @staticmethod
+    def _personalized_prompt(user_preferences: Dict[str, str], prompt: str) -> str:
+        """private: 맞춤형 추천 프롬프트"""
+        return f"""
         사용자 정보:
         - 성별: {user_preferences.get('gender', '남성')}
         - 나이대: {user_preferences.get('age_group', '20대')}
@@ -84,5 +172,3 @@ class LLMService:
         
         사용자의 특성과 선호도를 고려하여 문화 활동을 추천해주세요.
         특히 이동수단과 자녀 동반 여부를 중요하게 고려해주세요."""
-        
-        return self.ask_llm(context)
\ No newline at end of file
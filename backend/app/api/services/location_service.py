@@ -3,13 +3,21 @@ import requests
 import math
 import os
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
+import numpy as np
+from app.api.services.spatial_index import SpatialIndex, haversine_matrix_km
+from app.api.services.geocode_cache import get_geocode_cache, normalize_query
+from app.api.services.single_flight import get_single_flight
+from app.api.services.gazetteer import resolve_area
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 카카오 API 요청 타임아웃 (초)
+KAKAO_TIMEOUT_SECONDS = 5
+
 class CityInfo:
     # 서울시 주요 지역 좌표 정보 (위도, 경도)
     AREA_COORDINATES = {
@@ -196,7 +204,21 @@ class CityInfo:
         return R * c
 
     def get_coordinates_from_kakao(self, location_name: str) -> Optional[Tuple[float, float]]:
-        """위치 이름으로 좌표 얻기"""
+        """위치 이름으로 좌표 얻기 (지오코딩 캐시 우선)"""
+        hit, cached = get_geocode_cache().get(location_name)
+        if hit:
+            return cached
+        return self._fetch_kakao_coordinates(location_name)
+
+    def _fetch_kakao_coordinates(self, location_name: str) -> Optional[Tuple[float, float]]:
+        """private: 캐시와 같은 정규화 키로 동시 요청을 합쳐 카카오 API 호출"""
+        return get_single_flight("geocode").do(
+            normalize_query(location_name), self._request_kakao_coordinates, location_name
+        )
+
+    def _request_kakao_coordinates(self, location_name: str) -> Optional[Tuple[float, float]]:
+        """private: 카카오 키워드 검색 API 호출 후 결과를 캐시에 저장"""
+        cache = get_geocode_cache()
         url = f"{self._base_url}/keyword.json"
         headers = {
             "Authorization": f"KakaoAK {self._api_key}"
@@ -206,14 +228,19 @@ class CityInfo:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = requests.get(url, headers=headers, params=params,
+                                    timeout=KAKAO_TIMEOUT_SECONDS)
             response.raise_for_status()
             
             data = response.json()
             if data['documents']:
                 # 첫 번째 결과의 좌표를 반환 (float로 변환)
-                return (float(data['documents'][0]['y']), float(data['documents'][0]['x']))
+                coordinates = (float(data['documents'][0]['y']), float(data['documents'][0]['x']))
+                cache.put(location_name, coordinates)
+                return coordinates
             logger.warning(f"위치 '{location_name}'에 대한 결과가 없습니다.")
+            # '결과 없음'도 캐싱 (네트워크 오류는 캐싱하지 않음)
+            cache.put(location_name, None)
         except requests.exceptions.RequestException as e:
             logger.error(f"API 요청 실패: {str(e)}")
         except Exception as e:
@@ -222,31 +249,80 @@ class CityInfo:
         return None
 
     # Public interfaces
+    @classmethod
+    def resolve_local(cls, location_name: str) -> Optional[str]:
+        """공개 인터페이스: 정식 명칭/별칭을 오프라인 지명 사전으로 주요 지역명에 매핑 (애매하면 None)"""
+        if location_name in cls.AREA_COORDINATES:
+            return location_name
+        return resolve_area(location_name)
+
+    @classmethod
+    def geocode(cls, location_name: str) -> Optional[Tuple[float, float]]:
+        """공개 인터페이스: 캐시에 있으면 바로 반환하고, 없을 때만 카카오 API 호출"""
+        hit, cached = get_geocode_cache().get(location_name)
+        if hit:
+            return cached
+        return cls()._fetch_kakao_coordinates(location_name)
+
     @classmethod
     def find_nearest_location(cls, user_location: str) -> str:
         """공개 인터페이스: 가장 가까운 지역 찾기"""
-        # 먼저 AREA_COORDINATES에서 직접 조회
-        user_coordinates = cls._get_area_coordinates().get(user_location)
+        # 먼저 AREA_COORDINATES/지명 사전(정식 명칭·별칭)에서 직접 조회
+        local_area = cls.resolve_local(user_location)
+        if local_area:
+            return local_area
         
-        # 직접 조회 실패하면 카카오 API 이용
-        if not user_coordinates:
-            city_info = cls()  # API 호출을 위한 인스턴스 생성
-            user_coordinates = city_info.get_coordinates_from_kakao(user_location)
+        # 직접 조회 실패하면 카카오 API 이용 (캐시 우선)
+        user_coordinates = cls.geocode(user_location)
         
         if user_coordinates is None:
             return "위치를 찾을 수 없습니다."
 
-        nearest_location = None
-        min_distance = float('inf')
+        return cls.find_nearest_area(user_coordinates)
 
-        # 주요 지역과의 거리 계산
-        for location, coordinates in cls._get_area_coordinates().items():
-            distance = cls._calculate_distance(user_coordinates, coordinates)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_location = location
+    @classmethod
+    def find_nearest_area(cls, coordinates: Tuple[float, float]) -> Optional[str]:
+        """공개 인터페이스: 좌표에서 가장 가까운 주요 지역"""
+        nearest = _AREA_SPATIAL_INDEX.nearest(*coordinates)
+        return nearest[0] if nearest else None
 
-        return nearest_location
+    @classmethod
+    def find_nearest_areas(cls, coordinates: Tuple[float, float], k: int = 5) -> List[Dict]:
+        """공개 인터페이스: 좌표에서 가까운 주요 지역 k곳"""
+        return [
+            {'area': area, 'distance_km': round(distance, 3)}
+            for area, distance in _AREA_SPATIAL_INDEX.nearest_k(*coordinates, k)
+        ]
+
+    @classmethod
+    def find_areas_within_radius(cls, coordinates: Tuple[float, float],
+                                 radius_km: float) -> List[Dict]:
+        """공개 인터페이스: 반경 내 주요 지역 (가까운 순)"""
+        return [
+            {'area': area, 'distance_km': round(distance, 3)}
+            for area, distance in _AREA_SPATIAL_INDEX.within_radius(*coordinates, radius_km)
+        ]
+
+    @classmethod
+    def find_nearest_areas_batch(cls, points: np.ndarray,
+                                 chunk_size: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """공개 인터페이스: N×2 (위도, 경도) 배열 → 가장 가까운 지역 ID/거리(km) 배열
+
+        지역 ID는 AREA_COORDINATES 등록 순서(area_registry.AREA_NAMES와 동일)
+        메모리 사용을 제한하기 위해 chunk_size 행씩 나누어 거리 행렬을 계산한다.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        area_ids = np.empty(len(points), dtype=np.int64)
+        distances = np.empty(len(points), dtype=np.float64)
+
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start:start + chunk_size]
+            matrix = haversine_matrix_km(chunk[:, 0], chunk[:, 1], _AREA_LATS, _AREA_LNGS)
+            nearest = matrix.argmin(axis=1)
+            area_ids[start:start + len(chunk)] = nearest
+            distances[start:start + len(chunk)] = matrix[np.arange(len(chunk)), nearest]
+
+        return area_ids, distances
 
     def get_location_info(self, location: str) -> Dict:
         """공개 인터페이스: 위치 정보 조회"""
@@ -265,35 +341,32 @@ class CityInfo:
                 'lat': coordinates[0],
                 'lng': coordinates[1]
             },
-            'nearest_location': self.find_nearest_location(location)
+            'nearest_location': self.find_nearest_area(coordinates)
         }
 
+# 주요 지역 공간 인덱스 (모듈 로드 시 한 번 생성)
+_AREA_SPATIAL_INDEX = SpatialIndex.from_mapping(CityInfo.AREA_COORDINATES)
+_AREA_LATS = np.array([lat for lat, _ in CityInfo.AREA_COORDINATES.values()])
+_AREA_LNGS = np.array([lng for _, lng in CityInfo.AREA_COORDINATES.values()])
+
 def get_coordinates(location: str) -> Optional[Dict[str, float]]:
     """카카오 API를 사용하여 위치의 좌표를 가져옵니다."""
     try:
-        # 먼저 AREA_COORDINATES에서 검색
-        if location in CityInfo.AREA_COORDINATES:
-            lat, lng = CityInfo.AREA_COORDINATES[location]
+        # 먼저 AREA_COORDINATES/지명 사전에서 검색
+        local_area = CityInfo.resolve_local(location)
+        if local_area:
+            lat, lng = CityInfo.AREA_COORDINATES[local_area]
             return {
                 'lat': lat,
                 'lng': lng
             }
         
-        # 없으면 API 요청
-        load_dotenv()
-        KAKAO_API_KEY = os.getenv("KAKAO_REST_API_KEY")
-        url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-        headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-        params = {"query": location}
-        
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-        result = response.json()
-        if result['documents']:
+        # 없으면 API 요청 (지오코딩 캐시 우선)
+        coordinates = CityInfo.geocode(location)
+        if coordinates:
             return {
-                'lat': float(result['documents'][0]['y']),
-                'lng': float(result['documents'][0]['x'])
+                'lat': coordinates[0],
+                'lng': coordinates[1]
             }
         return None
     except Exception as e:
@@ -0,0 +1,115 @@
+import json
+import struct
+import logging
+from typing import Dict, List, Optional
+import numpy as np
+from fastapi import Request
+from fastapi.responses import Response
+from app.api.services.area_registry import AREA_INDEX, AREA_TABLE_VERSION, get_level_code
+from app.api.services.congestion_db import timestamp_to_minute
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 바이너리 페이로드 형식
+#   MAGIC(4바이트) | 헤더 길이(uint32 LE) | JSON 헤더 | 배열 본문
+# 헤더의 fields에 각 배열의 dtype/shape/offset(본문 시작 기준)이 들어 있고,
+# 모든 배열은 리틀엔디언이며 8바이트 경계에 정렬되어 JS TypedArray로 바로 읽을 수 있다.
+MAGIC = b"SCC1"
+BINARY_MEDIA_TYPE = "application/octet-stream"
+ALIGNMENT = 8
+
+# 인구 값 양자화 단위 (uint16 × 10명)
+POPULATION_SCALE = 10
+
+
+def wants_binary(request: Request, format: Optional[str] = None) -> bool:
+    """쿼리 파라미터(format=binary) 또는 Accept 헤더로 바이너리 응답 여부 결정"""
+    if format:
+        return format.lower() == "binary"
+    return BINARY_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _padding(length: int) -> int:
+    """private: 정렬에 필요한 패딩 길이"""
+    return (-length) % ALIGNMENT
+
+
+def encode_arrays(arrays: Dict[str, np.ndarray], meta: Optional[Dict] = None) -> bytes:
+    """이름 → 배열 묶음을 바이너리 페이로드로 인코딩"""
+    fields = []
+    chunks: List[bytes] = []
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        data = array.tobytes()
+        fields.append({
+            "name": name,
+            "dtype": array.dtype.name,
+            "shape": list(array.shape),
+            "offset": offset
+        })
+        chunks.append(data + b"\0" * _padding(len(data)))
+        offset += len(chunks[-1])
+
+    header = json.dumps(
+        {"area_table": AREA_TABLE_VERSION, **(meta or {}), "fields": fields},
+        ensure_ascii=False
+    ).encode("utf-8")
+    # 본문 시작 위치(8 + 헤더 길이)가 정렬되도록 헤더를 공백으로 채움
+    header += b" " * _padding(len(MAGIC) + 4 + len(header))
+    return MAGIC + struct.pack("<I", len(header)) + header + b"".join(chunks)
+
+
+def binary_response(arrays: Dict[str, np.ndarray], meta: Optional[Dict] = None) -> Response:
+    """바이너리 페이로드 응답 생성"""
+    return Response(
+        content=encode_arrays(arrays, meta),
+        media_type=BINARY_MEDIA_TYPE,
+        headers={"X-Area-Table-Version": AREA_TABLE_VERSION, "Vary": "Accept"}
+    )
+
+
+def quantize_population(values: np.ndarray) -> np.ndarray:
+    """인구 값 → uint16 (POPULATION_SCALE 단위, 범위 초과 시 최대값으로 제한)"""
+    scaled = np.rint(np.asarray(values, dtype=np.float64) / POPULATION_SCALE)
+    return np.clip(scaled, 0, np.iinfo(np.uint16).max).astype(np.uint16)
+
+
+def to_smallest_uint(values: np.ndarray) -> np.ndarray:
+    """음이 아닌 정수 배열을 값 범위에 맞는 가장 작은 부호 없는 정수형으로 변환"""
+    values = np.asarray(values)
+    peak = int(values.max()) if values.size else 0
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if peak <= np.iinfo(dtype).max:
+            return values.astype(dtype)
+    return values.astype(np.uint64)
+
+
+def timestamps_to_minutes(timestamps: List[str]) -> np.ndarray:
+    """'YYYY-MM-DD HH:MM' 문자열 → epoch 분(uint32, 형식/값 오류는 0)"""
+    minutes = np.zeros(len(timestamps), dtype=np.uint32)
+    for idx, timestamp in enumerate(timestamps):
+        minute = timestamp_to_minute(timestamp)
+        if minute is not None:
+            minutes[idx] = max(0, minute)
+    return minutes
+
+
+def encode_congestion_rows(rows: List[Dict]) -> Optional[Dict[str, np.ndarray]]:
+    """get_congestion_data 결과 → 열 단위 배열 (좌표는 정적 지역 테이블 참조)
+
+    지역 테이블에 없는 지역이 있으면 ID로 나타낼 수 없으므로 None (호출 측은 JSON으로 응답)
+    """
+    unknown = sorted({row["area"] for row in rows if row["area"] not in AREA_INDEX})
+    if unknown:
+        logger.warning(f"지역 테이블에 없는 지역 {len(unknown)}곳이 있어 JSON으로 응답: {unknown[:10]}")
+        return None
+    return {
+        "area_ids": np.asarray([AREA_INDEX[row["area"]] for row in rows], dtype=np.uint16),
+        "levels": np.asarray([get_level_code(row["congestion_level"]) for row in rows],
+                             dtype=np.uint8),
+        "minutes": timestamps_to_minutes([row["timestamp"] for row in rows])
+    }
@@ -0,0 +1,100 @@
+import os
+import time
+import logging
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 동시 요청들의 단계가 모두 바로 시작되도록 넉넉하게 둠 (대부분 외부 응답 대기 또는 동시 요청 병합 대기)
+MAX_PIPELINE_WORKERS = int(os.getenv("RECOMMEND_PIPELINE_WORKERS", 64))
+
+# 단계 상태
+STAGE_OK = "ok"
+STAGE_TIMEOUT = "timeout"
+STAGE_ERROR = "error"
+STAGE_SKIPPED = "skipped"  # 선행 단계 실패로 실행하지 않음
+
+
+class Stage:
+    """파이프라인 단계: 선행 단계 결과(dict)를 받아 값을 반환하는 함수"""
+
+    __slots__ = ("name", "func", "depends_on", "timeout", "fallback")
+
+    def __init__(self, name: str, func: Callable[[Dict[str, Any]], Any],
+                 depends_on: Sequence[str] = (), timeout: float = 10.0, fallback: Any = None):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.timeout = timeout
+        self.fallback = fallback
+
+
+def run_stages(stages: List[Stage], executor: ThreadPoolExecutor) -> Tuple[Dict[str, Any], Dict[str, Dict]]:
+    """의존 관계를 따라 독립 단계를 동시에 실행
+
+    각 단계는 선행 단계가 모두 끝나는 즉시 시작되고, 단계별 제한 시간을 넘기거나 실패하면
+    fallback 값으로 대체된다 (그 단계에 의존하는 단계는 건너뜀).
+    반환: (단계 이름 → 결과, 단계 이름 → {status, elapsed_ms})
+    """
+    by_name = {stage.name: stage for stage in stages}
+    results: Dict[str, Any] = {}
+    report: Dict[str, Dict] = {}
+    running: Dict[Future, Tuple[Stage, float]] = {}
+    waiting = list(stages)
+
+    def finish(stage: Stage, status: str, value: Any, started: Optional[float]) -> None:
+        results[stage.name] = value
+        elapsed = round((time.monotonic() - started) * 1000, 1) if started is not None else 0.0
+        report[stage.name] = {"status": status, "elapsed_ms": elapsed}
+        if status != STAGE_OK:
+            logger.warning(f"파이프라인 단계 '{stage.name}' {status} ({elapsed}ms)")
+
+    while waiting or running:
+        # 선행 단계가 모두 끝난 단계 시작 (선행 단계가 실패했으면 건너뜀)
+        for stage in list(waiting):
+            if not all(name in report for name in stage.depends_on):
+                continue
+            waiting.remove(stage)
+            if any(report[name]["status"] != STAGE_OK for name in stage.depends_on):
+                finish(stage, STAGE_SKIPPED, stage.fallback, None)
+                continue
+            inputs = {name: results[name] for name in stage.depends_on}
+            # 호출한 쪽의 컨텍스트(LLM 우선순위 등)를 작업 스레드에 그대로 전달
+            context = contextvars.copy_context()
+            running[executor.submit(context.run, stage.func, inputs)] = (stage, time.monotonic())
+
+        if not running:
+            if waiting:
+                # 존재하지 않는 단계에 의존하는 경우
+                for stage in waiting:
+                    missing = [name for name in stage.depends_on if name not in by_name]
+                    logger.error(f"파이프라인 단계 '{stage.name}'의 선행 단계 없음: {missing}")
+                    finish(stage, STAGE_SKIPPED, stage.fallback, None)
+                waiting = []
+            continue
+
+        now = time.monotonic()
+        next_deadline = min(started + stage.timeout for stage, started in running.values())
+        done, _ = wait(list(running), timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+
+        for future in done:
+            stage, started = running.pop(future)
+            try:
+                finish(stage, STAGE_OK, future.result(), started)
+            except Exception as e:
+                logger.error(f"파이프라인 단계 '{stage.name}' 오류: {str(e)}")
+                finish(stage, STAGE_ERROR, stage.fallback, started)
+
+        # 제한 시간을 넘긴 단계는 결과를 기다리지 않음 (작업 스레드는 끝날 때까지 계속 실행됨)
+        now = time.monotonic()
+        for future, (stage, started) in list(running.items()):
+            if now - started >= stage.timeout:
+                running.pop(future)
+                future.cancel()
+                finish(stage, STAGE_TIMEOUT, stage.fallback, started)
+
+    return results, report
@@ -0,0 +1,150 @@
+import threading
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from app.api.services.area_registry import AREA_NAMES, AREA_INDEX, CONGESTION_LEVELS, LEVEL_CODES
+from app.api.services.congestion_db import get_congestion_rows_since, timestamp_to_minute
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DAYS_PER_WEEK = 7
+HOURS_PER_DAY = 24
+
+
+class CongestionProfileStore:
+    """지역별 요일×시간대(7×24) 혼잡도 프로필 저장소
+
+    DB에 새로 쌓인 행만 읽어와 누적 배열에 더하는 방식으로 증분 갱신한다.
+    """
+
+    def __init__(self):
+        n_areas = len(AREA_NAMES)
+        shape = (n_areas, DAYS_PER_WEEK, HOURS_PER_DAY)
+        self._level_counts = np.zeros(shape + (len(CONGESTION_LEVELS),), dtype=np.int64)
+        self._population_sum = np.zeros(shape, dtype=np.float64)
+        self._population_samples = np.zeros(shape, dtype=np.int64)
+        self._last_row_id = 0
+        self._lock = threading.Lock()
+
+    @property
+    def last_row_id(self) -> int:
+        return self._last_row_id
+
+    def refresh(self) -> int:
+        """DB에서 마지막으로 읽은 행 이후의 데이터만 반영"""
+        with self._lock:
+            rows = get_congestion_rows_since(self._last_row_id)
+            if not rows:
+                return 0
+            self._ingest(rows)
+            self._last_row_id = rows[-1][0]
+            return len(rows)
+
+    def ingest(self, rows: List[Tuple]) -> None:
+        """(id, area, congestion_level, timestamp, population_min, population_max) 행 반영"""
+        with self._lock:
+            self._ingest(rows)
+
+    def _ingest(self, rows: List[Tuple]) -> None:
+        """private: 행 묶음을 벡터 연산으로 누적 (시각을 해석할 수 없는 행은 건너뜀)"""
+        parsed = []
+        for _, area, level, timestamp, pop_min, pop_max in rows:
+            minute = timestamp_to_minute(timestamp)
+            if area in AREA_INDEX and minute is not None:
+                parsed.append((AREA_INDEX[area], LEVEL_CODES.get(level, 0), minute, pop_min, pop_max))
+        if len(parsed) < len(rows):
+            logger.debug(f"프로필 반영 제외 행: {len(rows) - len(parsed)}건")
+        if not parsed:
+            return
+
+        area_ids, level_codes, minutes, pop_min, pop_max = zip(*parsed)
+        area_ids = np.asarray(area_ids, dtype=np.intp)
+        level_codes = np.asarray(level_codes, dtype=np.intp)
+
+        minutes = np.asarray(minutes, dtype=np.int64)
+        hours = (minutes // 60) % HOURS_PER_DAY
+        # 1970-01-01은 목요일 → 월요일=0 기준으로 보정
+        weekdays = (minutes // (60 * 24) + 3) % DAYS_PER_WEEK
+
+        np.add.at(self._level_counts, (area_ids, weekdays, hours, level_codes), 1)
+
+        pop_min = np.asarray([np.nan if v is None else v for v in pop_min], dtype=np.float64)
+        pop_max = np.asarray([np.nan if v is None else v for v in pop_max], dtype=np.float64)
+        midpoints = (pop_min + pop_max) / 2
+        has_population = ~np.isnan(midpoints)
+        index = (area_ids[has_population], weekdays[has_population], hours[has_population])
+        np.add.at(self._population_sum, index, midpoints[has_population])
+        np.add.at(self._population_samples, index, 1)
+
+    def _build_profile(self, level_counts: np.ndarray, population_sum: np.ndarray,
+                       population_samples: np.ndarray) -> Dict:
+        """private: 누적 배열 → 분포/평균 행렬"""
+        totals = level_counts.sum(axis=-1, keepdims=True)
+        distribution = np.divide(level_counts, totals, out=np.zeros(level_counts.shape),
+                                 where=totals > 0)
+        mean_population = np.divide(population_sum, population_samples,
+                                    out=np.zeros(population_sum.shape),
+                                    where=population_samples > 0)
+        return {
+            "levels": CONGESTION_LEVELS,
+            "distribution": np.round(distribution, 3).tolist(),
+            "mean_population": np.rint(mean_population).astype(np.int64).tolist(),
+            "samples": totals[..., 0].tolist()
+        }
+
+    def get_area_profile(self, area: str) -> Optional[Dict]:
+        """단일 지역의 7×24 프로필"""
+        area_id = AREA_INDEX.get(area)
+        if area_id is None:
+            return None
+        with self._lock:
+            profile = self._build_profile(
+                self._level_counts[area_id].copy(),
+                self._population_sum[area_id].copy(),
+                self._population_samples[area_id].copy()
+            )
+        return {"area": area, "area_id": area_id, **profile}
+
+    def get_all_profiles(self) -> Dict:
+        """전체 지역 프로필 (지역 × 7 × 24 배열)"""
+        with self._lock:
+            profile = self._build_profile(
+                self._level_counts.copy(),
+                self._population_sum.copy(),
+                self._population_samples.copy()
+            )
+        return {"areas": AREA_NAMES, **profile}
+
+    def get_all_arrays(self) -> Dict[str, np.ndarray]:
+        """전체 지역 누적 배열 (바이너리 응답용: 단계별 횟수, 평균 인구)"""
+        with self._lock:
+            level_counts = self._level_counts.copy()
+            mean_population = np.divide(self._population_sum, self._population_samples,
+                                        out=np.zeros(self._population_sum.shape),
+                                        where=self._population_samples > 0)
+        return {"level_counts": level_counts, "mean_population": mean_population}
+
+    def get_area_population_means(self) -> np.ndarray:
+        """지역 ID 순서의 전체 기간 평균 인구 (표본 없으면 0)"""
+        with self._lock:
+            population_sum = self._population_sum.sum(axis=(1, 2))
+            samples = self._population_samples.sum(axis=(1, 2))
+        return np.divide(population_sum, samples, out=np.zeros(population_sum.shape),
+                         where=samples > 0)
+
+
+_profile_store: Optional[CongestionProfileStore] = None
+_profile_store_lock = threading.Lock()
+
+
+def get_profile_store() -> CongestionProfileStore:
+    """프로필 저장소 싱글톤 (최초 호출 시 DB 전체를 한 번 적재)"""
+    global _profile_store
+    with _profile_store_lock:
+        if _profile_store is None:
+            _profile_store = CongestionProfileStore()
+            loaded = _profile_store.refresh()
+            logger.info(f"혼잡도 프로필 초기 적재: {loaded}행")
+        return _profile_store
@@ -0,0 +1,98 @@
+import os
+import logging
+from dotenv import load_dotenv
+from app.api.services import area_registry
+from app.api.services.city_service import SeoulCityData
+from app.api.services.llm_service import LLMService
+from app.api.services.agent_service import CultureAgent
+from app.api.services.chat_service import ChatBot
+from app.api.services.heatmap_service import HeatmapService
+from app.api.services.congestion_db import init_db
+from app.api.services.profile_service import get_profile_store
+from app.api.services.forecast_service import get_forecast_store
+from app.api.services.statistics_service import get_congestion_statistics
+from app.api.services.geocode_cache import get_geocode_cache
+from app.api.services.alternative_service import AlternativePlaceEngine
+from app.api.services.area_distance import get_area_distances
+from app.api.services.suggest_service import get_location_trie, popularity_from_means
+from app.api.services.event_store import get_event_store
+from app.api.services.event_sync import EventSyncWorker
+from app.api.services.event_ranking import EventRanker
+from app.api.services.llm_cache import get_llm_cache
+from app.api.services.llm_gateway import get_llm_gateway
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """앱 수명 동안 공유되는 서비스 모음
+
+    FastAPI startup 시 한 번 생성되어 app.state.services에 보관된다.
+    요청마다 ChatBot/HeatmapService를 새로 만들지 않고 이 인스턴스들을 재사용한다.
+    """
+
+    def __init__(self):
+        load_dotenv()
+        self.seoul_api_key = os.getenv("SEOUL_API_KEY")
+
+        self.city_data = SeoulCityData()
+        # 같은 데이터 구간의 같은 입력이면 Gemini 호출 없이 응답 재사용
+        self.llm_cache = get_llm_cache()
+        # LLMService가 genai.configure로 키를 설정하고, LLM 호출은 모두 공유 게이트웨이를 거침
+        self.llm_gateway = get_llm_gateway()
+        self.llm_service = LLMService(cache=self.llm_cache, gateway=self.llm_gateway)
+        self.agent = CultureAgent(cache=self.llm_cache, gateway=self.llm_gateway)
+        self.heatmap_service = HeatmapService(city_data=self.city_data)
+
+        init_db()
+        self.profile_store = get_profile_store()
+        self.forecast_store = get_forecast_store()
+        self.statistics = get_congestion_statistics()
+        self.geocode_cache = get_geocode_cache()
+        self.area_distances = get_area_distances()
+        self.location_trie = get_location_trie()
+        self.event_store = get_event_store()
+        self.event_sync = EventSyncWorker(self.seoul_api_key, self.event_store)
+        # 새로 수집된 혼잡도가 반영되도록 일정 시간이 지나면 통계를 갱신하는 조회 함수 사용
+        self.event_ranker = EventRanker(self.event_store, self.statistics.get_fresh_area_level_codes)
+        self.alternative_engine = AlternativePlaceEngine(
+            self.statistics.get_fresh_area_level_codes,
+            distance_matrix=self.area_distances.matrix
+        )
+
+        self.chat_bot = ChatBot(
+            self.seoul_api_key,
+            city_data=self.city_data,
+            llm_service=self.llm_service,
+            agent=self.agent,
+            alternative_engine=self.alternative_engine,
+            event_ranker=self.event_ranker
+        )
+
+    def warm_up(self) -> None:
+        """시작 시점 초기화: 지역 레지스트리, 캐시 적재"""
+        logger.info(f"지역 레지스트리: {len(area_registry.AREA_NAMES)}개 지역")
+        self.refresh_congestion()
+        # 자동완성 순위에 지역별 평균 인구를 인기도로 반영
+        self.location_trie.rebuild(
+            popularity_from_means(self.profile_store.get_area_population_means())
+        )
+        self.geocode_cache.warm_up()
+        self.llm_cache.purge_expired()
+        self.event_sync.start()
+        if self.forecast_store.get_matrix() is None:
+            logger.info("예측 행렬이 아직 없습니다. 다음 수집 이후 제공됩니다.")
+        logger.info("✅ 서비스 컨테이너 준비 완료")
+
+    def refresh_congestion(self) -> None:
+        """DB에 새로 쌓인 혼잡도 행을 프로필/통계에 반영"""
+        self.profile_store.refresh()
+        self.statistics.refresh()
+
+    def close(self) -> None:
+        """종료 시 백그라운드 동기화/추천 작업 스레드 중지, HTTP 세션 정리"""
+        self.event_sync.stop()
+        self.chat_bot.close()
+        self.city_data.close()
@@ -0,0 +1,122 @@
+import threading
+import logging
+from typing import Any, Callable, Dict, Optional
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """진행 중인 호출 하나 (먼저 온 요청이 실행하고 나머지는 완료를 기다림)"""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """같은 키의 동시 호출을 하나로 합치기
+
+    키가 같은 호출이 진행 중이면 새로 실행하지 않고 그 결과(또는 예외)를 함께 받는다.
+    완료된 결과는 보관하지 않으므로 재사용은 각 캐시가 담당한다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """키 단위로 func 실행 (진행 중인 같은 키 호출이 있으면 그 결과 공유)"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                call.waiters += 1
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters:
+                logger.debug(f"[{self.name}] 동시 요청 {call.waiters}건이 같은 호출 결과를 공유")
+            call.done.set()
+
+    def stats(self) -> Dict:
+        """실행/공유 횟수"""
+        with self._lock:
+            total = self.executions + self.shared
+            return {
+                "in_flight": len(self._calls),
+                "executions": self.executions,
+                "shared": self.shared,
+                "shared_rate": round(self.shared / total, 3) if total else 0.0
+            }
+
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """이름별 단일 호출 그룹 싱글톤 (citydata, cultural_events, geocode, llm 등)"""
+    with _groups_lock:
+        if name not in _groups:
+            _groups[name] = SingleFlight(name)
+        return _groups[name]
+
+
+def single_flight_stats() -> Dict[str, Dict]:
+    """그룹별 실행/공유 횟수"""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {group.name: group.stats() for group in groups}
+
+
+if __name__ == "__main__":
+    # 수동 점검: python -m app.api.services.single_flight
+    # 동시에 들어온 같은 키 요청 N건이 실제 호출 1건으로 합쳐지는지 확인
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    REQUESTS = 50
+    group = SingleFlight("check")
+    started = threading.Barrier(REQUESTS)
+
+    def slow_upstream() -> str:
+        time.sleep(0.5)
+        return "ok"
+
+    def request(_: int) -> str:
+        started.wait()
+        return group.do("여의도", slow_upstream)
+
+    with ThreadPoolExecutor(max_workers=REQUESTS) as executor:
+        results = list(executor.map(request, range(REQUESTS)))
+    stats = group.stats()
+    assert results == ["ok"] * REQUESTS, results
+    assert stats["executions"] == 1, stats
+    logger.info(f"동시 요청 {REQUESTS}건 → 실행 {stats['executions']}건: {stats}")
@@ -0,0 +1,167 @@
+import math
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+# 평면 근사 오차(서울 범위에서 0.1% 미만)를 흡수하기 위한 여유 비율
+_PLANAR_SLACK = 1.01
+
+K = TypeVar("K", bound=Hashable)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이 거리 (km)"""
+    dlat = math.radians(lat2 - lat1)
+    dlng = math.radians(lng2 - lng1)
+    a = (math.sin(dlat / 2) ** 2
+         + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlng / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def haversine_matrix_km(lats1: np.ndarray, lngs1: np.ndarray,
+                        lats2: np.ndarray, lngs2: np.ndarray) -> np.ndarray:
+    """N개 좌표 × M개 좌표 거리 행렬 (km, 브로드캐스팅)"""
+    lat1 = np.radians(np.asarray(lats1, dtype=np.float64))[:, None]
+    lng1 = np.radians(np.asarray(lngs1, dtype=np.float64))[:, None]
+    lat2 = np.radians(np.asarray(lats2, dtype=np.float64))[None, :]
+    lng2 = np.radians(np.asarray(lngs2, dtype=np.float64))[None, :]
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class SpatialIndex(Generic[K]):
+    """격자 기반 공간 인덱스
+
+    좌표를 기준 위도에서 평면(km)으로 투영해 cell_km 크기의 격자에 나누어 담고,
+    질의 지점에서 가까운 격자부터 링 단위로 넓혀가며 후보를 찾은 뒤
+    하버사인 거리로 정확히 정렬한다.
+    """
+
+    def __init__(self, points: Iterable[Tuple[K, float, float]], cell_km: float = 1.5):
+        self._points: List[Tuple[K, float, float]] = list(points)
+        self._cell_km = cell_km
+        self._ref_lat = (sum(lat for _, lat, _ in self._points) / len(self._points)
+                         if self._points else 37.5665)
+        self._cos_ref = math.cos(math.radians(self._ref_lat))
+
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        for idx, (_, lat, lng) in enumerate(self._points):
+            self._cells.setdefault(self._cell_of(lat, lng), []).append(idx)
+
+        if self._cells:
+            xs = [cx for cx, _ in self._cells]
+            ys = [cy for _, cy in self._cells]
+            self._bounds = (min(xs), max(xs), min(ys), max(ys))
+        else:
+            self._bounds = (0, 0, 0, 0)
+
+    @classmethod
+    def from_mapping(cls, coordinates: Dict[K, Tuple[float, float]],
+                     cell_km: float = 1.5) -> "SpatialIndex[K]":
+        """{키: (위도, 경도)} → 인덱스"""
+        return cls(((key, lat, lng) for key, (lat, lng) in coordinates.items()), cell_km)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _project(self, lat: float, lng: float) -> Tuple[float, float]:
+        """private: 위경도 → 평면 좌표 (km)"""
+        x = math.radians(lng) * self._cos_ref * EARTH_RADIUS_KM
+        y = math.radians(lat) * EARTH_RADIUS_KM
+        return x, y
+
+    def _cell_of(self, lat: float, lng: float) -> Tuple[int, int]:
+        """private: 좌표가 속한 격자"""
+        x, y = self._project(lat, lng)
+        return math.floor(x / self._cell_km), math.floor(y / self._cell_km)
+
+    def _ring(self, cx: int, cy: int, r: int) -> Iterable[int]:
+        """private: 중심 격자에서 체비쇼프 거리 r인 격자들의 점 인덱스"""
+        if r == 0:
+            yield from self._cells.get((cx, cy), ())
+            return
+        for dx in range(-r, r + 1):
+            yield from self._cells.get((cx + dx, cy - r), ())
+            yield from self._cells.get((cx + dx, cy + r), ())
+        for dy in range(-r + 1, r):
+            yield from self._cells.get((cx - r, cy + dy), ())
+            yield from self._cells.get((cx + r, cy + dy), ())
+
+    def _max_ring(self, cx: int, cy: int) -> int:
+        """private: 모든 격자를 덮는 데 필요한 링 반경"""
+        min_x, max_x, min_y, max_y = self._bounds
+        return max(abs(cx - min_x), abs(cx - max_x), abs(cy - min_y), abs(cy - max_y))
+
+    def nearest_k(self, lat: float, lng: float, k: int = 1) -> List[Tuple[K, float]]:
+        """가장 가까운 k개 [(키, 거리km)] (가까운 순)"""
+        if not self._points or k <= 0:
+            return []
+
+        cx, cy = self._cell_of(lat, lng)
+        found: List[Tuple[float, int]] = []
+        for r in range(self._max_ring(cx, cy) + 1):
+            for idx in self._ring(cx, cy, r):
+                _, p_lat, p_lng = self._points[idx]
+                found.append((haversine_km(lat, lng, p_lat, p_lng), idx))
+            # 링 r까지 확인했으면 아직 보지 않은 점은 최소 r*cell_km 이상 떨어져 있음
+            if len(found) >= k:
+                found.sort()
+                if found[k - 1][0] <= r * self._cell_km / _PLANAR_SLACK:
+                    break
+        found.sort()
+        return [(self._points[idx][0], distance) for distance, idx in found[:k]]
+
+    def nearest(self, lat: float, lng: float) -> Optional[Tuple[K, float]]:
+        """가장 가까운 점 (키, 거리km)"""
+        result = self.nearest_k(lat, lng, 1)
+        return result[0] if result else None
+
+    def within_radius(self, lat: float, lng: float, radius_km: float) -> List[Tuple[K, float]]:
+        """반경 내 점 [(키, 거리km)] (가까운 순)"""
+        if not self._points:
+            return []
+
+        cx, cy = self._cell_of(lat, lng)
+        max_ring = min(math.ceil(radius_km * _PLANAR_SLACK / self._cell_km),
+                       self._max_ring(cx, cy))
+        found = []
+        for r in range(max_ring + 1):
+            for idx in self._ring(cx, cy, r):
+                key, p_lat, p_lng = self._points[idx]
+                distance = haversine_km(lat, lng, p_lat, p_lng)
+                if distance <= radius_km:
+                    found.append((key, distance))
+        found.sort(key=lambda item: item[1])
+        return found
+
+
+if __name__ == "__main__":
+    # 벤치마크: python -m app.api.services.spatial_index
+    import random
+    import time
+    from app.api.services.coordinates import AREA_COORDINATES
+
+    def brute_force_nearest(lat: float, lng: float) -> str:
+        return min(AREA_COORDINATES,
+                   key=lambda name: haversine_km(lat, lng, *AREA_COORDINATES[name]))
+
+    random.seed(0)
+    queries = [(random.uniform(37.45, 37.68), random.uniform(126.80, 127.16)) for _ in range(20000)]
+
+    start = time.perf_counter()
+    index = SpatialIndex.from_mapping(AREA_COORDINATES)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    expected = [brute_force_nearest(lat, lng) for lat, lng in queries]
+    brute_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [index.nearest(lat, lng)[0] for lat, lng in queries]
+    index_s = time.perf_counter() - start
+
+    assert expected == actual, "인덱스 결과가 전수 탐색과 다릅니다."
+    print(f"지역 수: {len(index)}, 인덱스 생성: {build_ms:.2f}ms")
+    print(f"전수 탐색: {len(queries) / brute_s:,.0f} 질의/초")
+    print(f"격자 인덱스: {len(queries) / index_s:,.0f} 질의/초 ({brute_s / index_s:.1f}배)")
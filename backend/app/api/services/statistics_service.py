@@ -0,0 +1,202 @@
+import os
+import time
+import threading
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from app.api.services.area_registry import AREA_INDEX, AREA_NAMES, CONGESTION_LEVELS, LEVEL_CODES
+from app.api.services.congestion_db import get_congestion_rows_since, timestamp_to_minute
+from app.api.services.event_service import CulturalEventManager
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+POPULATION_WINDOW_MINUTES = 24 * 60  # 인구 통계 집계 구간
+LEVEL_CHANGE_WINDOW_MINUTES = 60      # 혼잡도 변화 집계 구간
+# 추천/대체 장소 계산 시 이보다 오래된 집계면 DB의 새 행을 먼저 반영 (증분 조회라 비용이 작음)
+REFRESH_INTERVAL_SECONDS = float(os.getenv("STATISTICS_REFRESH_SECONDS", 60))
+
+
+class CongestionStatistics:
+    """수집 데이터가 들어올 때마다 갱신되는 혼잡도 통계
+
+    - 지역별 현재 혼잡도 → 전체/자치구별 단계 카운트
+    - 최근 24시간 인구(중간값) 최소/최대/평균 (단조 덱)
+    - 최근 1시간 혼잡도 단계가 바뀐 지역 수
+    조회는 누적된 값을 그대로 반환하므로 전체 테이블을 다시 읽지 않는다.
+    """
+
+    def __init__(self):
+        n_levels = len(CONGESTION_LEVELS)
+        self._area_levels: List[Optional[int]] = [None] * len(AREA_NAMES)
+        self._area_minutes: List[int] = [0] * len(AREA_NAMES)
+        self._city_counts = [0] * n_levels
+        self._district_counts = {
+            district: [0] * n_levels for district in CulturalEventManager.DISTRICT_AREAS
+        }
+        # 한 지역이 여러 구에 걸쳐 등록된 경우(예: 혜화역)도 모두 반영
+        self._area_districts: Dict[int, List[str]] = {}
+        for district, areas in CulturalEventManager.DISTRICT_AREAS.items():
+            for area in areas:
+                if area in AREA_INDEX:
+                    self._area_districts.setdefault(AREA_INDEX[area], []).append(district)
+
+        self._population_window: Deque[Tuple[int, float]] = deque()
+        self._population_min: Deque[Tuple[int, float]] = deque()
+        self._population_max: Deque[Tuple[int, float]] = deque()
+        self._population_sum = 0.0
+
+        self._level_changes: Deque[Tuple[int, int]] = deque()
+        self._changed_areas: Dict[int, int] = {}
+
+        self._latest_minute = 0
+        self._latest_timestamp: Optional[str] = None
+        self._last_row_id = 0
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> int:
+        """DB에서 마지막으로 읽은 행 이후의 데이터만 반영"""
+        with self._lock:
+            rows = get_congestion_rows_since(self._last_row_id)
+            for row in rows:
+                self._ingest_row(row)
+            if rows:
+                self._last_row_id = rows[-1][0]
+            self._refreshed_at = time.monotonic()
+            return len(rows)
+
+    def ingest(self, rows: List[Tuple]) -> None:
+        """(id, area, congestion_level, timestamp, population_min, population_max) 행 반영"""
+        with self._lock:
+            for row in rows:
+                self._ingest_row(row)
+
+    def _ingest_row(self, row: Tuple) -> None:
+        """private: 행 하나를 통계에 반영 (상수 시간)"""
+        _, area, level, timestamp, pop_min, pop_max = row
+        area_id = AREA_INDEX.get(area)
+        minute = timestamp_to_minute(timestamp)
+        if area_id is None or minute is None:
+            return
+
+        if minute > self._latest_minute:
+            self._latest_minute = minute
+            self._latest_timestamp = timestamp[:16]
+
+        # 현재 혼잡도 카운트 갱신 (해당 지역의 더 최신 행이 이미 반영된 경우 제외)
+        code = LEVEL_CODES.get(level, 0)
+        previous = self._area_levels[area_id]
+        if minute >= self._area_minutes[area_id] and previous != code:
+            if previous is not None:
+                self._update_counts(area_id, previous, -1)
+                # 덱이 시각 순서를 유지하도록 늦게 도착한 변화는 최신 시각으로 기록
+                self._level_changes.append((self._latest_minute, area_id))
+                self._changed_areas[area_id] = self._changed_areas.get(area_id, 0) + 1
+            self._update_counts(area_id, code, 1)
+            self._area_levels[area_id] = code
+        self._area_minutes[area_id] = max(self._area_minutes[area_id], minute)
+
+        # 인구 구간 통계 갱신 (이미 구간을 벗어난 늦은 행은 제외)
+        # 단조 덱/구간 덱은 시각 순서 입력을 전제로 하므로 늦게 도착한 행은 최신 시각으로 기록
+        in_window = minute > self._latest_minute - POPULATION_WINDOW_MINUTES
+        if in_window and pop_min is not None and pop_max is not None:
+            midpoint = (pop_min + pop_max) / 2
+            sample_minute = self._latest_minute
+            self._population_window.append((sample_minute, midpoint))
+            self._population_sum += midpoint
+            while self._population_min and self._population_min[-1][1] >= midpoint:
+                self._population_min.pop()
+            self._population_min.append((sample_minute, midpoint))
+            while self._population_max and self._population_max[-1][1] <= midpoint:
+                self._population_max.pop()
+            self._population_max.append((sample_minute, midpoint))
+
+        self._evict()
+
+    def _update_counts(self, area_id: int, code: int, delta: int) -> None:
+        """private: 전체/자치구 카운트 증감"""
+        self._city_counts[code] += delta
+        for district in self._area_districts.get(area_id, []):
+            self._district_counts[district][code] += delta
+
+    def _evict(self) -> None:
+        """private: 집계 구간을 벗어난 항목 제거"""
+        population_start = self._latest_minute - POPULATION_WINDOW_MINUTES
+        while self._population_window and self._population_window[0][0] <= population_start:
+            _, midpoint = self._population_window.popleft()
+            self._population_sum -= midpoint
+        while self._population_min and self._population_min[0][0] <= population_start:
+            self._population_min.popleft()
+        while self._population_max and self._population_max[0][0] <= population_start:
+            self._population_max.popleft()
+
+        change_start = self._latest_minute - LEVEL_CHANGE_WINDOW_MINUTES
+        while self._level_changes and self._level_changes[0][0] <= change_start:
+            _, area_id = self._level_changes.popleft()
+            self._changed_areas[area_id] -= 1
+            if not self._changed_areas[area_id]:
+                del self._changed_areas[area_id]
+
+    @staticmethod
+    def _to_level_dict(counts: List[int]) -> Dict[str, int]:
+        """private: 코드 배열 → 혼잡도별 카운트"""
+        return {level: counts[code] for code, level in enumerate(CONGESTION_LEVELS)}
+
+    def get_statistics(self) -> Dict:
+        """현재 통계 조회"""
+        with self._lock:
+            samples = len(self._population_window)
+            return {
+                "as_of": self._latest_timestamp,
+                "total": sum(self._city_counts),
+                "counts": self._to_level_dict(self._city_counts),
+                "districts": {
+                    district: self._to_level_dict(counts)
+                    for district, counts in self._district_counts.items()
+                },
+                "population": {
+                    "window_minutes": POPULATION_WINDOW_MINUTES,
+                    "samples": samples,
+                    "min": self._population_min[0][1] if samples else 0,
+                    "max": self._population_max[0][1] if samples else 0,
+                    "mean": round(self._population_sum / samples, 1) if samples else 0
+                },
+                "level_changes": {
+                    "window_minutes": LEVEL_CHANGE_WINDOW_MINUTES,
+                    "changes": len(self._level_changes),
+                    "areas": len(self._changed_areas)
+                }
+            }
+
+    def get_area_level_codes(self) -> List[int]:
+        """지역 ID 순서의 현재 혼잡도 코드 (정보 없으면 0)"""
+        with self._lock:
+            return [code or 0 for code in self._area_levels]
+
+    def get_fresh_area_level_codes(self) -> List[int]:
+        """get_area_level_codes와 같되, 마지막 갱신 후 REFRESH_INTERVAL_SECONDS가 지났으면 먼저 갱신"""
+        refreshed_at = self._refreshed_at
+        if refreshed_at is None or time.monotonic() - refreshed_at >= REFRESH_INTERVAL_SECONDS:
+            try:
+                self.refresh()
+            except Exception as e:
+                # 갱신 실패 시 마지막 집계로 계속 응답
+                logger.error(f"혼잡도 통계 갱신 실패: {str(e)}")
+        return self.get_area_level_codes()
+
+
+_statistics: Optional[CongestionStatistics] = None
+_statistics_lock = threading.Lock()
+
+
+def get_congestion_statistics() -> CongestionStatistics:
+    """혼잡도 통계 싱글톤 (최초 호출 시 DB 전체를 한 번 적재)"""
+    global _statistics
+    with _statistics_lock:
+        if _statistics is None:
+            _statistics = CongestionStatistics()
+            loaded = _statistics.refresh()
+            logger.info(f"혼잡도 통계 초기 적재: {loaded}행")
+        return _statistics
@@ -0,0 +1,155 @@
+import threading
+import unicodedata
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+from app.api.services.area_registry import AREA_NAMES
+from app.api.services.event_service import CulturalEventManager
+from app.api.services.gazetteer import AREA_ALIASES, normalize_name
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 노드마다 미리 정렬해 두는 후보 수 (지역 중복 제거 여유분 포함)
+NODE_TOP_K = 24
+DEFAULT_LIMIT = 8
+
+# 같은 점수일 때 표시 우선순위 (정식 지역명 > 자치구 > 별칭)
+_TYPE_PRIORITY = {"area": 0, "district": 1, "alias": 2}
+
+_HANGUL_BASE = 0xAC00
+_INITIALS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_MEDIALS = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_FINALS = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+# 정규화(NFKC)로 바뀐 첫가끝 자모 → 호환 자모 ('ㄱ'만 입력한 경우)
+_CONJOINING_TO_COMPAT = {
+    unicodedata.normalize("NFKC", jamo): jamo for jamo in set(_INITIALS + _MEDIALS + _FINALS.strip())
+}
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 자모로 분해 ('강남' → 'ㄱㅏㅇㄴㅏㅁ', 입력 중인 글자도 접두어로 일치)"""
+    result = []
+    for char in text:
+        code = ord(char) - _HANGUL_BASE
+        if 0 <= code < 11172:
+            result.append(_INITIALS[code // 588])
+            result.append(_MEDIALS[(code % 588) // 28])
+            if code % 28:
+                result.append(_FINALS[code % 28])
+        else:
+            result.append(_CONJOINING_TO_COMPAT.get(char, char))
+    return "".join(result)
+
+
+class _TrieNode:
+    __slots__ = ("children", "top", "exact")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.top: List[int] = []    # 이 접두어로 시작하는 상위 후보
+        self.exact: List[int] = []  # 키가 이 노드에서 끝나는 항목
+
+
+class LocationTrie:
+    """지역명·자치구명·별칭 접두어 트라이
+
+    각 노드에 해당 접두어로 시작하는 항목 중 상위 후보 ID를 미리 정렬해 두어
+    조회는 입력 길이만큼 노드를 따라간 뒤 목록을 잘라내는 것으로 끝난다.
+    """
+
+    def __init__(self, popularity: Optional[Dict[str, float]] = None):
+        self._lock = threading.Lock()
+        self._entries = self._collect_entries()
+        self.rebuild(popularity or {})
+
+    @staticmethod
+    def _collect_entries() -> List[Dict]:
+        """private: 자동완성 항목 목록 (표시 이름, 대상 지역, 종류)"""
+        entries = [{"label": area, "area": area, "type": "area"} for area in AREA_NAMES]
+        for district, areas in CulturalEventManager.DISTRICT_AREAS.items():
+            entries.append({"label": district, "area": None, "areas": areas, "type": "district"})
+        for alias, area in AREA_ALIASES.items():
+            entries.append({"label": alias, "area": area, "type": "alias"})
+        return entries
+
+    def _popularity_of(self, entry: Dict, popularity: Dict[str, float]) -> float:
+        """private: 항목 인기도 (자치구는 소속 지역 합)"""
+        if entry["type"] == "district":
+            return sum(popularity.get(area, 0.0) for area in entry["areas"])
+        return popularity.get(entry["area"], 0.0)
+
+    def rebuild(self, popularity: Dict[str, float]) -> None:
+        """인기도를 반영해 트라이를 다시 구성"""
+        ranked: List[Tuple[Tuple, int, str]] = []
+        for entry_id, entry in enumerate(self._entries):
+            key = to_jamo(normalize_name(entry["label"]))
+            if key:
+                rank = (-self._popularity_of(entry, popularity), _TYPE_PRIORITY[entry["type"]], len(key), entry["label"])
+                ranked.append((rank, entry_id, key))
+        # 순위가 높은 항목부터 넣으면 각 노드의 목록이 자연히 정렬된 상태가 됨
+        ranked.sort()
+
+        root = _TrieNode()
+        for _, entry_id, key in ranked:
+            node = root
+            for char in key:
+                node = node.children.setdefault(char, _TrieNode())
+                if len(node.top) < NODE_TOP_K:
+                    node.top.append(entry_id)
+            node.exact.append(entry_id)
+
+        with self._lock:
+            self._root = root
+
+    def suggest(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Dict]:
+        """입력 접두어 → 자동완성 후보 (완전 일치 > 인기도 순, 대상 지역 중복 제거)"""
+        key = to_jamo(normalize_name(query))
+        if not key:
+            return []
+
+        with self._lock:
+            node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        # 입력과 완전히 같은 항목을 맨 앞으로
+        candidates = node.exact + [entry_id for entry_id in node.top if entry_id not in node.exact]
+
+        results, seen = [], set()
+        for entry_id in candidates:
+            entry = self._entries[entry_id]
+            target = entry["area"] or entry["label"]
+            if target in seen:
+                continue
+            seen.add(target)
+            # 별칭은 정식 지역명으로 보여주고 일치한 별칭을 함께 반환
+            results.append({
+                "label": entry["area"] or entry["label"],
+                "area": entry["area"],
+                "type": entry["type"],
+                "matched": entry["label"]
+            })
+            if len(results) >= limit:
+                break
+        return results
+
+
+def popularity_from_means(area_means: Sequence[float]) -> Dict[str, float]:
+    """지역 ID 순서의 평균 인구 → {지역명: 인기도}"""
+    return {area: float(value) for area, value in zip(AREA_NAMES, area_means)}
+
+
+_location_trie: Optional[LocationTrie] = None
+_location_trie_lock = threading.Lock()
+
+
+def get_location_trie() -> LocationTrie:
+    """자동완성 트라이 싱글톤"""
+    global _location_trie
+    with _location_trie_lock:
+        if _location_trie is None:
+            _location_trie = LocationTrie()
+        return _location_trie
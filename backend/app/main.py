@@ -2,10 +2,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
-from app.api.routes import chat_routes, recommendation_routes, map_routes
+from app.api.routes import chat_routes, recommendation_routes, map_routes, location_routes, event_routes
 import os
 from dotenv import load_dotenv
 from app.api.services.congestion_db import get_congestion_data
+from app.api.services.service_container import ServiceContainer
 
 
 # 환경변수 로드
@@ -26,10 +27,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 앱 수명 동안 공유할 서비스 생성 및 워밍업
+@app.on_event("startup")
+def startup_services():
+    services = ServiceContainer()
+    services.warm_up()
+    app.state.services = services
+
+@app.on_event("shutdown")
+def shutdown_services():
+    app.state.services.close()
+
 # 라우터 등록
 app.include_router(chat_routes.router, prefix="/api/chat", tags=["chat"])
 app.include_router(recommendation_routes.router, prefix="/api/recommendation", tags=["recommendation"])
 app.include_router(map_routes.router, prefix="/api/map", tags=["map"])
+app.include_router(location_routes.router, prefix="/api/location", tags=["location"])
+app.include_router(event_routes.router, prefix="/api/events", tags=["events"])
 
 # React 정적 파일 서빙
 app.mount("/", StaticFiles(directory="static", html=True), name="static")
@@ -53,4 +53,13 @@ class EventsResponse(BaseModel):
     success: bool
     total_count: int
     data: List[CulturalEvent]
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+
+# 좌표 일괄 매핑 모델
+class NearestAreaBatchRequest(BaseModel):
+    points: List[List[float]]  # [[위도, 경도], ...]
+
+class NearestAreaBatchResponse(BaseModel):
+    area_ids: List[int]
+    areas: List[str]
+    distances_km: List[float]
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# backend 디렉토리에서 `python -m pytest`로 실행 (app 패키지를 최상위에서 import)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
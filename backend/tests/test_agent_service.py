@@ -0,0 +1,53 @@
+import random
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from app.api.services.agent_service import SECTION_HEADERS, SectionSplitter
+
+RESPONSE = (
+    "### [현재 상황 평가]\n강남역은 지금 약간 붐빕니다.\n"
+    "**최적의 방문 시간대:** 오후 3시 이후가 좋습니다.\n"
+    "## 추천 동선\n1. 강남역 → 2. 신논현역\n"
+    "# 방문객 안내사항 :\n주말에는 더 혼잡합니다."
+)
+
+
+def split(text, chunks):
+    """조각 목록을 섹션별 본문으로 모음"""
+    splitter = SectionSplitter(SECTION_HEADERS)
+    events = []
+    for chunk in chunks:
+        events.extend(splitter.feed(chunk))
+    events.extend(splitter.flush())
+    sections, current = [], None
+    for kind, value in events:
+        if kind == 'section':
+            current = [value, ""]
+            sections.append(current)
+        elif current is not None:
+            current[1] += value
+    return sections
+
+
+def random_chunks(text, rng):
+    cuts = sorted(rng.sample(range(1, len(text)), rng.randint(1, 20)))
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+
+def test_sections_are_found_with_decoration_stripped():
+    sections = split(RESPONSE, [RESPONSE])
+    assert [name for name, _ in sections] == ['situation', 'best_time', 'route', 'warnings']
+    assert sections[0][1].startswith("강남역은")
+    assert sections[1][1].strip() == "오후 3시 이후가 좋습니다."
+    assert sections[3][1] == "주말에는 더 혼잡합니다."
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_result_does_not_depend_on_chunk_boundaries(seed):
+    expected = split(RESPONSE, [RESPONSE])
+    assert split(RESPONSE, random_chunks(RESPONSE, random.Random(seed))) == expected
+
+
+def test_single_character_chunks():
+    assert split(RESPONSE, list(RESPONSE)) == split(RESPONSE, [RESPONSE])
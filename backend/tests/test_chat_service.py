@@ -0,0 +1,94 @@
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from app.api.services.alternative_service import AlternativePlaceEngine  # noqa: E402
+from app.api.services.area_registry import AREA_NAMES, AREA_INDEX, LEVEL_CODES  # noqa: E402
+from app.api.services.chat_service import ChatBot  # noqa: E402
+from app.api.services.location_service import CityInfo  # noqa: E402
+import app.api.services.chat_service as chat_service  # noqa: E402
+
+
+class FakeCity:
+    valid_areas = ["강남역", "역삼역"]
+
+    def __init__(self, level):
+        self.level = level
+
+    def get_area_status(self, area):
+        return {"population": {"congestion_level": self.level}, "traffic": {}, "commercial": {}}
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = []
+
+    def get_congestion_recommendation(self, area, congestion, forecast, traffic_status):
+        self.calls.append("congestion")
+        return "혼잡 대응 안내"
+
+    def phrase_alternative_place(self, area, alternatives):
+        self.calls.append("phrase")
+        return f"{alternatives[0]['area']}: 덜 붐빕니다."
+
+
+class FakeAgent:
+    def analyze_situation(self, *args):
+        return {"situation": "", "best_time": "", "route": "", "warnings": ""}
+
+    def get_personalized_recommendation(self, events, preferences):
+        return "추천"
+
+    @staticmethod
+    def _get_default_response():
+        return {}
+
+
+def quiet_levels():
+    levels = [LEVEL_CODES["여유"]] * len(AREA_NAMES)
+    levels[AREA_INDEX["강남역"]] = LEVEL_CODES["붐빔"]
+    return levels
+
+
+@pytest.fixture
+def make_bot(monkeypatch):
+    monkeypatch.setattr(CityInfo, "find_nearest_location", classmethod(lambda cls, location: "강남역"))
+    monkeypatch.setattr(chat_service, "get_coordinates", lambda area: None)
+    bots = []
+
+    def make(level):
+        llm = FakeLLM()
+        bot = ChatBot("key", city_data=FakeCity(level), llm_service=llm, agent=FakeAgent(),
+                      alternative_engine=AlternativePlaceEngine(quiet_levels))
+        bot._get_ranked_events = lambda area, preferences: {"success": True, "data": [{"TITLE": "행사"}]}
+        bots.append(bot)
+        return bot, llm
+
+    yield make
+    for bot in bots:
+        bot.close()
+
+
+def test_recommendation_includes_alternatives_when_crowded(make_bot):
+    bot, llm = make_bot("붐빔")
+    result = bot.get_recommendations("강남", {})
+    assert result["stages"]["congestion"]["status"] == "ok"
+    congestion = result["congestion"]
+    assert congestion["alternatives"]
+    assert congestion["alternative_place"].endswith("덜 붐빕니다.")
+    assert sorted(llm.calls) == ["congestion", "phrase"]
+
+
+def test_recommendation_skips_alternatives_when_not_crowded(make_bot):
+    bot, llm = make_bot("여유")
+    assert bot.get_recommendations("강남", {})["congestion"] is None
+    assert llm.calls == []
+
+
+def test_stream_sends_alternatives_status_when_crowded(make_bot, monkeypatch):
+    bot, _ = make_bot("붐빔")
+    monkeypatch.setattr(bot._agent, "stream_situation", lambda *args: iter(()), raising=False)
+    monkeypatch.setattr(bot._agent, "stream_personalized_recommendation", lambda *args: iter(()), raising=False)
+    events = list(bot.stream_user_input("강남역 가고 싶어요", {}))
+    stages = [event["data"].get("stage") for event in events if event["event"] == "status"]
+    assert stages == ["area_detected", "congestion", "alternatives"]
@@ -0,0 +1,54 @@
+import random
+from datetime import date
+import pytest
+from app.api.services.event_index import IntervalIndex, from_day, to_day, weekend_range
+
+
+def random_intervals(count, seed=0):
+    rng = random.Random(seed)
+    base = to_day(date(2026, 1, 1))
+    intervals = []
+    for idx in range(count):
+        start = base + rng.randint(0, 365)
+        intervals.append((f"e{idx}", start, start + rng.choice([0, 0, 1, 3, 7, 30, 120])))
+    return intervals
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_overlapping_matches_brute_force(seed):
+    intervals = random_intervals(500, seed)
+    index = IntervalIndex(intervals)
+    rng = random.Random(seed + 100)
+    base = to_day(date(2026, 1, 1))
+    for _ in range(200):
+        first = base + rng.randint(-30, 400)
+        last = first + rng.choice([0, 1, 6, 30])
+        expected = {key for key, start, end in intervals if start <= last and end >= first}
+        actual = index.overlapping(first, last)
+        assert len(actual) == len(set(actual))
+        assert set(actual) == expected
+        assert set(index.active_on(first)) == {key for key, start, end in intervals if start <= first <= end}
+
+
+def test_starting_between_matches_brute_force():
+    intervals = random_intervals(300)
+    index = IntervalIndex(intervals)
+    base = to_day(date(2026, 3, 1))
+    keys = index.starting_between(base, base + 13)
+    assert set(keys) == {key for key, start, _ in intervals if base <= start <= base + 13}
+    starts = {key: start for key, start, _ in intervals}
+    assert [starts[key] for key in keys] == sorted(starts[key] for key in keys)
+
+
+def test_invalid_intervals_are_dropped():
+    index = IntervalIndex([("ok", 10, 12), ("backwards", 12, 10)])
+    assert len(index) == 1
+    assert index.active_on(11) == ["ok"]
+    assert IntervalIndex([]).overlapping(0, 100) == []
+
+
+def test_day_conversion_and_weekend_range():
+    assert from_day(to_day(date(2026, 10, 19))) == date(2026, 10, 19)
+    assert weekend_range(date(2026, 10, 19)) == (date(2026, 10, 24), date(2026, 10, 25))  # 월요일
+    assert weekend_range(date(2026, 10, 24)) == (date(2026, 10, 24), date(2026, 10, 25))  # 토요일
+    assert weekend_range(date(2026, 10, 25)) == (date(2026, 10, 24), date(2026, 10, 25))  # 일요일
@@ -0,0 +1,21 @@
+from app.api.services.event_ranking import EventRanker, PROGRAM_SUMMARY_LENGTH
+
+
+def test_summarize_keeps_default_fee_text_when_fee_is_missing():
+    for fee in (None, "", "  "):
+        event = {"TITLE": "가을 음악회", "PLACE": "세종문화회관", "USE_FEE": fee, "PROGRAM": None}
+        summary = EventRanker.summarize(event, 1.0, [])
+        assert summary["USE_FEE"] == "요금 정보 없음"
+        assert summary["PROGRAM"] == "프로그램 정보 없음"
+
+
+def test_summarize_marks_free_and_keeps_paid_fee():
+    assert EventRanker.summarize({"USE_FEE": "무료 (사전 예약)"}, 1.0, [])["USE_FEE"] == "무료"
+    assert EventRanker.summarize({"USE_FEE": "R석 50,000원"}, 1.0, [])["USE_FEE"] == "R석 50,000원"
+
+
+def test_summarize_truncates_long_program():
+    summary = EventRanker.summarize({"PROGRAM": "가" * (PROGRAM_SUMMARY_LENGTH + 10)}, 0.5, ["무료"])
+    assert summary["PROGRAM"] == "가" * PROGRAM_SUMMARY_LENGTH + "…"
+    assert summary["SCORE"] == 0.5
+    assert summary["REASONS"] == ["무료"]
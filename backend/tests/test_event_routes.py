@@ -0,0 +1,34 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api.routes import event_routes
+from app.api.services.event_store import EventStore
+
+
+def test_handlers_run_in_threadpool():
+    # 색인 구성/점수 계산이 이벤트 루프를 막지 않도록 일반 함수여야 함
+    assert not asyncio.iscoroutinefunction(event_routes.search_events)
+    assert not asyncio.iscoroutinefunction(event_routes.get_nearby_events)
+
+
+@pytest.fixture
+def client(tmp_path):
+    store = EventStore(str(tmp_path / "events.sqlite"))
+    store.upsert_events([{"TITLE": "가을 국악 한마당", "PLACE": "국립국악원", "GUNAME": "서초구",
+                          "DATE": "2026-10-01~2026-12-31", "CODENAME": "국악"}])
+    app = FastAPI()
+    app.include_router(event_routes.router, prefix="/api/events")
+
+    class Services:
+        event_store = store
+
+    app.state.services = Services()
+    return TestClient(app)
+
+
+def test_search_route(client):
+    response = client.get("/api/events/search", params={"q": "국악"})
+    assert response.status_code == 200
+    assert [event["TITLE"] for event in response.json()["data"]] == ["가을 국악 한마당"]
+    assert client.get("/api/events/search", params={"q": " "}).status_code == 400
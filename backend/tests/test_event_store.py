@@ -0,0 +1,129 @@
+from datetime import date
+import pytest
+from app.api.services import event_store
+from app.api.services.event_store import EventStore, make_event_key
+
+TODAY = date(2026, 10, 19)
+
+
+def make_event(title, place="세종문화회관", guname="종로구", date_text="2026-10-01~2026-12-31", **fields):
+    return {"TITLE": title, "PLACE": place, "GUNAME": guname, "DATE": date_text, **fields}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EventStore(str(tmp_path / "events.sqlite"))
+
+
+def titles(store, **kwargs):
+    _, events = store.query_events(on_date=TODAY, **kwargs)
+    return sorted(event["TITLE"] for event in events)
+
+
+def test_write_during_snapshot_rebuild_is_not_hidden(store, monkeypatch):
+    store.upsert_events([make_event("기존 공연")])
+    original = event_store.IntervalIndex
+    raced = []
+
+    def interval_index_with_concurrent_write(items):
+        # DB를 읽은 뒤 스냅샷을 설치하기 전에 동기화 쓰기가 끼어든 상황
+        if not raced:
+            raced.append(True)
+            store.upsert_events([make_event("새 공연")])
+        return original(items)
+
+    monkeypatch.setattr(event_store, "IntervalIndex", interval_index_with_concurrent_write)
+    assert titles(store) == ["기존 공연"]
+    assert titles(store) == ["기존 공연", "새 공연"]
+
+
+def test_write_during_search_index_build_is_not_lost(store, monkeypatch):
+    store.upsert_events([make_event("가을 국악 공연")])
+    original = event_store.EventSearchIndex
+    raced = []
+
+    class SearchIndexWithConcurrentWrite(original):
+        def add_many(self, events):
+            super().add_many(events)
+            if not raced:
+                raced.append(True)
+                store.upsert_events([make_event("겨울 국악 축제")])
+
+    monkeypatch.setattr(event_store, "EventSearchIndex", SearchIndexWithConcurrentWrite)
+    store.search_events("국악")
+    monkeypatch.setattr(event_store, "EventSearchIndex", original)
+    total, events = store.search_events("국악")
+    assert total == 2
+    assert {event["TITLE"] for event in events} == {"가을 국악 공연", "겨울 국악 축제"}
+
+
+def test_geocoded_coordinates_survive_updates_at_the_same_venue(store):
+    event = make_event("상설 전시", USE_FEE="무료")
+    store.upsert_events([event])
+    store.mark_geocode_attempted([("종로구", "세종문화회관")])
+    store.set_venue_coordinates([("종로구", "세종문화회관", 37.5725, 126.9760)])
+    store.upsert_events([{**event, "USE_FEE": "5,000원"}])
+    _, events = store.events_near(37.5725, 126.9760, 0.5, on_date=TODAY)
+    assert [event["TITLE"] for event in events] == ["상설 전시"]
+    assert store.venues_without_coordinates() == []
+
+
+def test_venue_change_clears_coordinates_and_geocode_attempt(store):
+    event = make_event("상설 전시", HMPG_ADDR="https://culture.seoul.go.kr/view?cultcode=123")
+    store.upsert_events([event])
+    store.mark_geocode_attempted([("종로구", "세종문화회관")])
+    store.set_venue_coordinates([("종로구", "세종문화회관", 37.5725, 126.9760)])
+
+    # 같은 행사 코드로 장소만 바뀐 갱신
+    store.upsert_events([{**event, "PLACE": "예술의전당", "GUNAME": "서초구"}])
+    _, events = store.events_near(37.5725, 126.9760, 0.5, on_date=TODAY)
+    assert events == []
+    assert store.venues_without_coordinates() == [("서초구", "예술의전당")]
+
+
+def keyed(*events):
+    return {make_event_key(event): event for event in events}
+
+
+def test_apply_sync_reports_inserted_updated_unchanged(store):
+    concert, exhibit = make_event("가을 음악회"), make_event("사진전", place="서울시립미술관", guname="중구")
+    assert store.apply_sync(keyed(concert, exhibit), complete=True, total_count=2) == {
+        "inserted": 2, "updated": 0, "unchanged": 0, "deleted": 0
+    }
+    # 공백 차이만 있는 행은 변경으로 보지 않음
+    same_concert = {**concert, "PROGRAM": None, "TITLE": " 가을  음악회 "}
+    changed_exhibit = {**exhibit, "USE_FEE": "무료"}
+    result = store.apply_sync({make_event_key(concert): same_concert, **keyed(changed_exhibit)},
+                              complete=True, total_count=2)
+    assert result == {"inserted": 0, "updated": 1, "unchanged": 1, "deleted": 0}
+    _, events = store.query_events(on_date=TODAY)
+    assert {event["TITLE"]: event.get("USE_FEE") for event in events}["사진전"] == "무료"
+
+
+def test_apply_sync_tombstones_missing_events_and_revives_them(store):
+    concert, exhibit = make_event("가을 음악회"), make_event("사진전")
+    store.apply_sync(keyed(concert, exhibit), complete=True, total_count=2)
+    first_watermark = store.get_watermark()
+
+    result = store.apply_sync(keyed(concert), complete=True, total_count=1)
+    assert result["deleted"] == 1
+    assert titles(store) == ["가을 음악회"]
+    assert store.count() == 1
+    assert store.search_events("사진전")[0] == 0
+    assert store.get_watermark()["catalog_digest"] != first_watermark["catalog_digest"]
+
+    # 다시 나타난 행사는 삭제 표시를 해제
+    result = store.apply_sync(keyed(concert, exhibit), complete=True, total_count=2)
+    assert result == {"inserted": 0, "updated": 1, "unchanged": 1, "deleted": 0}
+    assert titles(store) == ["가을 음악회", "사진전"]
+    assert store.get_watermark()["catalog_digest"] == first_watermark["catalog_digest"]
+
+
+def test_incomplete_sync_does_not_tombstone(store):
+    concert, exhibit = make_event("가을 음악회"), make_event("사진전")
+    store.apply_sync(keyed(concert, exhibit), complete=True, total_count=2)
+    watermark = store.get_watermark()
+    result = store.apply_sync(keyed(concert), complete=False)
+    assert result["deleted"] == 0
+    assert titles(store) == ["가을 음악회", "사진전"]
+    assert store.get_watermark() == watermark
@@ -0,0 +1,58 @@
+import pytest
+from app.api.services.gazetteer import GAZETTEER, normalize_name, resolve_area
+
+
+@pytest.mark.parametrize("query, area", [
+    ("강남역", "강남역"),
+    ("강남", "강남역"),
+    ("홍대입구역", "홍대입구역(2호선)"),
+    ("서울역", "서울역"),
+    ("여의도역", "여의도"),
+    ("동대문", "동대문 관광특구"),
+    ("명동", "명동 관광특구"),
+    ("DDP", "DDP(동대문디자인플라자)"),
+    ("북촌 한옥마을", "북촌한옥마을"),
+])
+def test_exact_and_alias_matches(query, area):
+    match = GAZETTEER.resolve(query)
+    assert match == {"area": area, "score": 1.0, "method": "exact"}
+
+
+@pytest.mark.parametrize("query", [
+    "서울",        # '서울역'의 접미사를 뗀 변형으로 잡히면 안 됨
+    "서울대공원",  # 과천 소재, '서울숲공원'과 비슷하지만 다른 장소
+    "강남구",      # 자치구 이름은 '강남역'이 아님
+    "종로3가",
+    "광화문광장",
+    "갱남역",      # 오타는 지오코더가 처리
+])
+def test_ambiguous_queries_fall_through_to_geocoder(query):
+    assert resolve_area(query) is None
+
+
+def test_fuzzy_match_requires_near_identical_long_name():
+    match = GAZETTEER.resolve("북촌한옥마을길")
+    assert match["area"] == "북촌한옥마을"
+    assert match["method"] == "fuzzy"
+    assert match["score"] >= 0.8
+
+
+def test_normalize_name():
+    assert normalize_name(" 신촌·이대역 ") == "신촌이대역"
+    assert normalize_name("ＤＤＰ(동대문디자인플라자)") == "ddp동대문디자인플라자"
+
+
+def test_find_nearest_location_uses_geocoder_for_unresolved_names(monkeypatch):
+    from app.api.services.location_service import CityInfo
+
+    queried = []
+
+    def fake_geocode(name):
+        queried.append(name)
+        return CityInfo.AREA_COORDINATES["광화문·덕수궁"]
+
+    monkeypatch.setattr(CityInfo, "geocode", staticmethod(fake_geocode))
+    assert CityInfo.find_nearest_location("강남") == "강남역"
+    assert queried == []
+    assert CityInfo.find_nearest_location("광화문광장") == "광화문·덕수궁"
+    assert queried == ["광화문광장"]
@@ -0,0 +1,122 @@
+import threading
+import time
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from app.api.services.llm_backends import LLMBackend, LLMBackendError, StubLLMBackend
+from app.api.services.llm_gateway import (
+    PRIORITY_BATCH, PRIORITY_INTERACTIVE, LLMDeadlineExceeded, LLMGateway, llm_priority
+)
+
+
+class GatedBackend(LLMBackend):
+    """'hold' 프롬프트는 gate가 열릴 때까지 붙잡고, 나머지는 처리 순서만 기록"""
+
+    name = "gated"
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.order = []
+
+    def generate(self, prompt, timeout=None):
+        if prompt == "hold":
+            self.gate.wait(5)
+        self.order.append(prompt)
+        return prompt
+
+
+def make_gateway(backend, **kwargs):
+    options = {"max_concurrency": 1, "requests_per_second": 0, "tokens_per_minute": 0, "call_timeout": 5}
+    options.update(kwargs)
+    return LLMGateway(backend=backend, **options)
+
+
+def wait_for_queue(gateway, depth):
+    deadline = time.monotonic() + 2
+    while gateway.stats()["queue_depth"] < depth:
+        assert time.monotonic() < deadline, "대기열이 기대 길이에 도달하지 않음"
+        time.sleep(0.005)
+
+
+def test_interactive_is_admitted_before_earlier_batch():
+    backend = GatedBackend()
+    gateway = make_gateway(backend)
+    threads = [threading.Thread(target=gateway.generate, args=("hold",))]
+    threads[0].start()
+    while gateway.stats()["active"] == 0:
+        time.sleep(0.005)
+
+    for prompt, priority, depth in (("batch", PRIORITY_BATCH, 1), ("interactive", PRIORITY_INTERACTIVE, 2)):
+        thread = threading.Thread(target=gateway.generate, args=(prompt,), kwargs={"priority": priority})
+        thread.start()
+        threads.append(thread)
+        wait_for_queue(gateway, depth)
+
+    assert gateway.stats()["queue_depth_by_priority"] == {"interactive": 1, "batch": 1}
+    backend.gate.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert backend.order == ["hold", "interactive", "batch"]
+    stats = gateway.stats()
+    assert stats["admitted"] == {"interactive": 2, "batch": 1}
+    assert stats["completed"] == 3 and stats["queue_depth"] == 0 and stats["active"] == 0
+
+
+def test_queue_wait_past_deadline_raises_and_frees_ticket():
+    backend = GatedBackend()
+    gateway = make_gateway(backend)
+    holder = threading.Thread(target=gateway.generate, args=("hold",))
+    holder.start()
+    while gateway.stats()["active"] == 0:
+        time.sleep(0.005)
+
+    with pytest.raises(LLMDeadlineExceeded):
+        gateway.generate("late", timeout=0.05)
+    assert gateway.stats()["queue_depth"] == 0
+
+    backend.gate.set()
+    holder.join(5)
+    assert gateway.generate("next") == "next"
+    stats = gateway.stats()
+    assert stats["deadline_exceeded"] == 1
+    assert backend.order == ["hold", "next"]
+
+
+def test_rate_limit_wait_past_deadline_raises():
+    gateway = make_gateway(GatedBackend(), requests_per_second=1)
+    assert gateway.generate("first") == "first"
+    with pytest.raises(LLMDeadlineExceeded):
+        gateway.generate("second", timeout=0.1)
+    stats = gateway.stats()
+    assert stats["active"] == 0 and stats["deadline_exceeded"] == 1
+
+
+def test_llm_priority_block_sets_default_priority():
+    gateway = make_gateway(GatedBackend())
+    with llm_priority(PRIORITY_BATCH):
+        gateway.generate("batch")
+    gateway.generate("interactive")
+    assert gateway.stats()["admitted"] == {"interactive": 1, "batch": 1}
+
+
+def test_backend_failure_releases_slot():
+    gateway = make_gateway(StubLLMBackend(latency_ms=0, distribution="fixed", failure_rate=1.0))
+    with pytest.raises(LLMBackendError):
+        gateway.generate("질문")
+    stats = gateway.stats()
+    assert stats["failed"] == 1 and stats["active"] == 0
+
+
+def test_stub_stream_times_out_like_generate():
+    backend = StubLLMBackend(latency_ms=200, distribution="fixed")
+    with pytest.raises(LLMBackendError):
+        list(backend.stream("질문", timeout=0.05))
+    fast = StubLLMBackend(latency_ms=0, distribution="fixed")
+    assert "".join(fast.stream("질문")) == fast.generate("질문")
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        LLMBackend()
@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from app.api.services.llm_cache import LLMResponseCache  # noqa: E402
+from app.api.services.llm_service import LLMService, LLM_ERROR_MESSAGE  # noqa: E402
+
+
+class FailingStreamGateway:
+    def __init__(self, chunks, fail=True):
+        self.chunks = chunks
+        self.fail = fail
+
+    def stream(self, prompt, timeout=None, priority=None):
+        yield from self.chunks
+        if self.fail:
+            raise RuntimeError("연결 끊김")
+
+
+def make_service(gateway):
+    return LLMService(cache=LLMResponseCache(db_path=None), gateway=gateway)
+
+
+def test_mid_stream_failure_is_reported_and_not_cached():
+    service = make_service(FailingStreamGateway(["첫 조각 ", "둘째 조각"]))
+    events = list(service.stream_personalized_recommendation({}, "전시 추천"))
+    assert events == [("token", "첫 조각 "), ("token", "둘째 조각"), ("error", LLM_ERROR_MESSAGE)]
+
+    service._gateway = FailingStreamGateway(["완성된 응답"], fail=False)
+    assert list(service.stream_personalized_recommendation({}, "전시 추천")) == [("token", "완성된 응답")]
+
+
+def test_completed_stream_is_cached():
+    service = make_service(FailingStreamGateway(["가", "나"], fail=False))
+    assert list(service.stream_personalized_recommendation({}, "공연")) == [("token", "가"), ("token", "나")]
+    service._gateway = FailingStreamGateway([], fail=True)
+    assert list(service.stream_personalized_recommendation({}, "공연")) == [("token", "가나")]
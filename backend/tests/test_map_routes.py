@@ -0,0 +1,61 @@
+import asyncio
+import sqlite3
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api.routes import map_routes
+from app.api.services import congestion_db
+from app.api.services.area_distance import get_area_distances
+from app.api.services.statistics_service import CongestionStatistics
+
+
+@pytest.mark.parametrize("handler", [
+    map_routes.get_congestion_data_route,
+    map_routes.get_area_congestion,
+    map_routes.get_congestion_statistics,
+    map_routes.get_congestion_profiles,
+    map_routes.get_area_congestion_profile,
+    map_routes.get_nearest_areas_batch,
+    map_routes.get_nearby_areas,
+])
+def test_blocking_handlers_run_in_threadpool(handler):
+    assert not asyncio.iscoroutinefunction(handler)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(congestion_db, "DB_PATH", str(tmp_path / "congestion.sqlite"))
+    congestion_db.init_db()
+    conn = sqlite3.connect(congestion_db.DB_PATH)
+    conn.executemany(
+        "INSERT INTO congestion (area, congestion_level, timestamp, population_min, population_max) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [("강남역", "붐빔", "2026-10-19 14:00", 30000, 32000),
+         ("역삼역", "여유", "2026-10-19 14:00", 5000, 6000)]
+    )
+    conn.commit()
+    conn.close()
+
+    app = FastAPI()
+    app.include_router(map_routes.router, prefix="/api/map")
+
+    class Services:
+        statistics = CongestionStatistics()
+        area_distances = get_area_distances()
+
+    app.state.services = Services()
+    return TestClient(app)
+
+
+def test_statistics_route_refreshes_from_db(client):
+    result = client.get("/api/map/statistics").json()
+    assert result["total"] == 2
+    assert result["counts"]["붐빔"] == 1
+    assert result["population"]["samples"] == 2
+
+
+def test_nearby_route_includes_congestion(client):
+    result = client.get("/api/map/nearby", params={"area": "강남", "radius_km": 2}).json()
+    assert result["area"] == "강남역"
+    levels = {item["area"]: item["congestion_level"] for item in result["areas"]}
+    assert levels["역삼역"] == "여유"
@@ -0,0 +1,72 @@
+import json
+import struct
+import numpy as np
+from app.api.services.area_registry import AREA_INDEX, AREA_TABLE_VERSION, LEVEL_CODES
+from app.api.services.congestion_db import timestamp_to_minute
+from app.api.services.payload_codec import (
+    ALIGNMENT, MAGIC, POPULATION_SCALE, encode_arrays, encode_congestion_rows,
+    quantize_population, timestamps_to_minutes, to_smallest_uint
+)
+
+
+def decode(payload):
+    """클라이언트와 같은 방식으로 페이로드 해석 (헤더 JSON + 정렬된 배열 본문)"""
+    assert payload[:4] == MAGIC
+    (header_length,) = struct.unpack("<I", payload[4:8])
+    body_start = 8 + header_length
+    assert body_start % ALIGNMENT == 0
+    header = json.loads(payload[8:body_start])
+    body = payload[body_start:]
+    arrays = {}
+    for field in header["fields"]:
+        assert field["offset"] % ALIGNMENT == 0
+        dtype = np.dtype(field["dtype"]).newbyteorder("<")
+        count = int(np.prod(field["shape"]))
+        arrays[field["name"]] = np.frombuffer(
+            body, dtype=dtype, count=count, offset=field["offset"]
+        ).reshape(field["shape"])
+    return header, arrays
+
+
+def test_encode_arrays_round_trip():
+    arrays = {
+        "levels": np.array([1, 2, 3], dtype=np.uint8),
+        "matrix": np.arange(12, dtype=np.float32).reshape(3, 4),
+        "counts": np.array([70000], dtype=np.uint32),
+    }
+    header, decoded = decode(encode_arrays(arrays, {"population_scale": POPULATION_SCALE}))
+    assert header["area_table"] == AREA_TABLE_VERSION
+    assert header["population_scale"] == POPULATION_SCALE
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(decoded[name], array)
+        assert decoded[name].dtype == array.dtype
+
+
+def test_congestion_rows_round_trip():
+    rows = [
+        {"area": "강남역", "congestion_level": "붐빔", "timestamp": "2026-10-19 14:05"},
+        {"area": "여의도", "congestion_level": "여유", "timestamp": "2026-10-19 14:10:59"},
+    ]
+    _, decoded = decode(encode_arrays(encode_congestion_rows(rows)))
+    assert decoded["area_ids"].tolist() == [AREA_INDEX["강남역"], AREA_INDEX["여의도"]]
+    assert decoded["levels"].tolist() == [LEVEL_CODES["붐빔"], LEVEL_CODES["여유"]]
+    assert decoded["minutes"].tolist() == [timestamp_to_minute("2026-10-19 14:05"),
+                                           timestamp_to_minute("2026-10-19 14:10")]
+
+
+def test_unknown_areas_fall_back_to_json():
+    rows = [{"area": "없는 지역", "congestion_level": "여유", "timestamp": "2026-10-19 14:05"}]
+    assert encode_congestion_rows(rows) is None
+
+
+def test_timestamps_to_minutes_parses_each_row():
+    minutes = timestamps_to_minutes(["2025-13-40 99:99", "2026-10-19 14:05", None, "", "2026-02-30 10:00"])
+    assert minutes.dtype == np.uint32
+    assert minutes.tolist() == [0, timestamp_to_minute("2026-10-19 14:05"), 0, 0, 0]
+
+
+def test_quantization_helpers():
+    assert quantize_population(np.array([0, 14, 15, 10 ** 9])).tolist() == [0, 1, 2, 65535]
+    assert to_smallest_uint(np.array([1, 255])).dtype == np.uint8
+    assert to_smallest_uint(np.array([256])).dtype == np.uint16
+    assert to_smallest_uint(np.array([70000])).dtype == np.uint32
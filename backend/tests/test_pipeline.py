@@ -0,0 +1,79 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from app.api.services.pipeline import (
+    STAGE_ERROR, STAGE_OK, STAGE_SKIPPED, STAGE_TIMEOUT, Stage, run_stages
+)
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=8)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_dependent_stage_receives_inputs(executor):
+    stages = [
+        Stage("a", lambda inputs: 1),
+        Stage("b", lambda inputs: 2),
+        Stage("sum", lambda inputs: inputs["a"] + inputs["b"], depends_on=("a", "b")),
+    ]
+    results, report = run_stages(stages, executor)
+    assert results == {"a": 1, "b": 2, "sum": 3}
+    assert all(entry["status"] == STAGE_OK for entry in report.values())
+
+
+def test_independent_stages_run_concurrently(executor):
+    barrier = threading.Barrier(2, timeout=2)
+    stages = [Stage(name, lambda inputs: barrier.wait() is not None, timeout=3) for name in ("a", "b")]
+    results, report = run_stages(stages, executor)
+    assert results == {"a": True, "b": True}
+    assert {entry["status"] for entry in report.values()} == {STAGE_OK}
+
+
+def test_slow_stage_times_out_with_fallback_and_skips_dependents(executor):
+    release = threading.Event()
+    stages = [
+        Stage("slow", lambda inputs: release.wait(2) and "late", timeout=0.05, fallback="기본값"),
+        Stage("fast", lambda inputs: "빠름"),
+        Stage("after_slow", lambda inputs: "실행됨", depends_on=("slow",), fallback=[]),
+    ]
+    started = time.monotonic()
+    results, report = run_stages(stages, executor)
+    release.set()
+
+    assert time.monotonic() - started < 1.0
+    assert results["slow"] == "기본값"
+    assert report["slow"]["status"] == STAGE_TIMEOUT
+    assert results["fast"] == "빠름"
+    assert results["after_slow"] == []
+    assert report["after_slow"] == {"status": STAGE_SKIPPED, "elapsed_ms": 0.0}
+
+
+def test_failing_stage_uses_fallback(executor):
+    def fail(inputs):
+        raise RuntimeError("실패")
+
+    results, report = run_stages([Stage("broken", fail, fallback={"data": []})], executor)
+    assert results["broken"] == {"data": []}
+    assert report["broken"]["status"] == STAGE_ERROR
+
+
+def test_missing_dependency_is_skipped(executor):
+    results, report = run_stages([Stage("orphan", lambda inputs: 1, depends_on=("없음",), fallback=0)],
+                                 executor)
+    assert results == {"orphan": 0}
+    assert report["orphan"]["status"] == STAGE_SKIPPED
+
+
+def test_caller_context_is_propagated(executor):
+    marker = contextvars.ContextVar("marker", default="기본")
+    token = marker.set("호출자")
+    try:
+        results, _ = run_stages([Stage("read", lambda inputs: marker.get())], executor)
+    finally:
+        marker.reset(token)
+    assert results["read"] == "호출자"
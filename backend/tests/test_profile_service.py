@@ -0,0 +1,49 @@
+import numpy as np
+from app.api.services import congestion_db
+from app.api.services.area_registry import AREA_INDEX, LEVEL_CODES
+from app.api.services.profile_service import CongestionProfileStore
+
+# 2026-10-19는 월요일
+MONDAY_14 = "2026-10-19 14:05"
+
+
+def test_bad_timestamp_row_is_skipped_without_dropping_batch():
+    store = CongestionProfileStore()
+    store.ingest([
+        (1, "강남역", "붐빔", "2025-13-40 99:99", 100, 200),
+        (2, "강남역", "붐빔", MONDAY_14, 100, 200),
+        (3, "강남역", "여유", None, 100, 200),
+        (4, "없는 지역", "붐빔", MONDAY_14, 100, 200),
+    ])
+    arrays = store.get_all_arrays()
+    area_id = AREA_INDEX["강남역"]
+    assert arrays["level_counts"].sum() == 1
+    assert arrays["level_counts"][area_id, 0, 14, LEVEL_CODES["붐빔"]] == 1
+    assert arrays["mean_population"][area_id, 0, 14] == 150
+
+
+def test_weekday_and_hour_use_local_wall_clock():
+    store = CongestionProfileStore()
+    store.ingest([
+        (1, "강남역", "여유", "2026-10-25 23:59", None, None),  # 일요일
+        (2, "강남역", "여유", "2026-10-20 00:00", None, None),  # 화요일
+    ])
+    counts = store.get_all_arrays()["level_counts"][AREA_INDEX["강남역"]].sum(axis=-1)
+    assert counts[6, 23] == 1
+    assert counts[1, 0] == 1
+    assert counts.sum() == 2
+
+
+def test_refresh_advances_past_unparseable_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(congestion_db, "DB_PATH", str(tmp_path / "congestion.sqlite"))
+    congestion_db.init_db()
+    congestion_db.save_congestion_data("강남역", "붐빔", "잘못된 시각")
+    congestion_db.save_congestion_data("강남역", "붐빔", MONDAY_14)
+
+    store = CongestionProfileStore()
+    assert store.refresh() == 2
+    assert store.last_row_id == 2
+    assert store.refresh() == 0
+    profile = store.get_area_profile("강남역")
+    assert profile["samples"][0][14] == 1
+    assert np.asarray(profile["samples"]).sum() == 1
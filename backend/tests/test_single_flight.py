@@ -0,0 +1,48 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from app.api.services.single_flight import SingleFlight
+
+REQUESTS = 20
+
+
+def run_concurrently(group, func):
+    started = threading.Barrier(REQUESTS)
+
+    def request(_):
+        started.wait()
+        try:
+            return group.do("여의도", func)
+        except RuntimeError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=REQUESTS) as executor:
+        return list(executor.map(request, range(REQUESTS)))
+
+
+def test_concurrent_calls_share_one_execution():
+    group = SingleFlight("test")
+
+    def slow_upstream():
+        time.sleep(0.2)
+        return "ok"
+
+    assert run_concurrently(group, slow_upstream) == ["ok"] * REQUESTS
+    stats = group.stats()
+    assert stats["executions"] == 1 and stats["shared"] == REQUESTS - 1 and stats["in_flight"] == 0
+
+
+def test_error_is_shared_and_not_kept():
+    group = SingleFlight("test")
+
+    def failing_upstream():
+        time.sleep(0.2)
+        raise RuntimeError("실패")
+
+    results = run_concurrently(group, failing_upstream)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert group.stats()["executions"] == 1
+    assert group.do("여의도", lambda: "재시도") == "재시도"
+    with pytest.raises(ValueError):
+        group.do("여의도", int, "숫자 아님")
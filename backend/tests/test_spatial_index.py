@@ -0,0 +1,31 @@
+import random
+from app.api.services.coordinates import AREA_COORDINATES
+from app.api.services.spatial_index import SpatialIndex, haversine_km
+
+
+def brute_force(lat, lng):
+    return sorted((haversine_km(lat, lng, *coordinates), name) for name, coordinates in AREA_COORDINATES.items())
+
+
+def queries(count, seed=0):
+    rng = random.Random(seed)
+    # 서울 밖 좌표도 섞어 빈 격자 탐색 범위 확인
+    return [(rng.uniform(37.3, 37.8), rng.uniform(126.6, 127.3)) for _ in range(count)]
+
+
+def test_nearest_matches_brute_force():
+    index = SpatialIndex.from_mapping(AREA_COORDINATES)
+    for lat, lng in queries(2000):
+        distance, name = brute_force(lat, lng)[0]
+        found, found_distance = index.nearest(lat, lng)
+        assert found == name
+        assert abs(found_distance - distance) < 1e-9
+
+
+def test_nearest_k_and_radius_match_brute_force():
+    index = SpatialIndex.from_mapping(AREA_COORDINATES)
+    for lat, lng in queries(300, seed=1):
+        expected = brute_force(lat, lng)
+        assert [name for name, _ in index.nearest_k(lat, lng, 5)] == [name for _, name in expected[:5]]
+        assert {name for name, _ in index.within_radius(lat, lng, 3.0)} == \
+            {name for distance, name in expected if distance <= 3.0}
@@ -0,0 +1,60 @@
+from app.api.services.congestion_db import timestamp_to_minute
+from app.api.services.statistics_service import CongestionStatistics, POPULATION_WINDOW_MINUTES
+
+
+def test_out_of_order_rows_in_one_batch_keep_population_samples():
+    stats = CongestionStatistics()
+    stats.ingest([
+        (1, "강남역", "붐빔", "2026-10-19 14:10", 100, 100),
+        (2, "역삼역", "여유", "2026-10-19 14:05", 20, 20),
+        (3, "선릉역", "보통", "2026-10-19 14:00", 60, 60),
+    ])
+    population = stats.get_statistics()["population"]
+    assert population["samples"] == 3
+    assert (population["min"], population["max"], population["mean"]) == (20, 100, 60)
+    assert stats.get_statistics()["as_of"] == "2026-10-19 14:10"
+
+
+def test_late_rows_are_evicted_with_the_window():
+    stats = CongestionStatistics()
+    stats.ingest([
+        (1, "강남역", "여유", "2026-10-19 10:00", 500, 500),
+        (2, "역삼역", "여유", "2026-10-19 09:00", 5, 5),
+    ])
+    assert stats.get_statistics()["population"]["min"] == 5
+    # 구간이 지나면 늦게 들어온 최솟값도 함께 빠져야 함
+    stats.ingest([(3, "선릉역", "여유", "2026-10-20 10:30", 50, 50)])
+    population = stats.get_statistics()["population"]
+    assert population["samples"] == 1
+    assert population["min"] == population["max"] == 50
+
+
+def test_rows_older_than_the_window_are_ignored():
+    stats = CongestionStatistics()
+    stats.ingest([
+        (1, "강남역", "여유", "2026-10-20 10:00", 10, 10),
+        (2, "역삼역", "여유", "2026-10-19 09:00", 999, 999),
+    ])
+    assert stats.get_statistics()["population"]["samples"] == 1
+    assert POPULATION_WINDOW_MINUTES == 24 * 60
+
+
+def test_invalid_timestamps_are_skipped():
+    stats = CongestionStatistics()
+    stats.ingest([
+        (1, "강남역", "붐빔", "2025-13-40 99:99", 1, 1),
+        (2, "강남역", "붐빔", None, 1, 1),
+        (3, "역삼역", "여유", "2026-10-19 14:05", 30, 30),
+    ])
+    result = stats.get_statistics()
+    assert result["total"] == 1
+    assert result["population"]["samples"] == 1
+
+
+def test_timestamp_to_minute_is_timezone_independent():
+    assert timestamp_to_minute("1970-01-01 00:00") == 0
+    minute = timestamp_to_minute("2026-10-19 14:05:33")
+    assert minute % (24 * 60) == 14 * 60 + 5
+    assert timestamp_to_minute("2025-13-40 99:99") is None
+    assert timestamp_to_minute("") is None
+    assert timestamp_to_minute(None) is None
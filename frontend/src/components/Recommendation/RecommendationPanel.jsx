@@ -206,6 +206,12 @@ const RecommendationPanel = () => {
                   <h5>주의사항</h5>
                   <p>{recommendationData.analysis.warnings}</p>
                 </div>
+                {recommendationData.congestion && (
+                  <div className="analysis-item">
+                    <h5>덜 붐비는 대체 장소</h5>
+                    <p>{recommendationData.congestion.alternative_place}</p>
+                  </div>
+                )}
               </div>
             </div>
 